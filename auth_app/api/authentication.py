@@ -0,0 +1,27 @@
+# Drittanbieter
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+
+# Lokale Importe
+from auth_app import token_cache
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """``TokenAuthentication`` that keeps token/user snapshots in the cache.
+
+    Entries are dropped when the token is deleted or the user's cached
+    fields change (e.g. on deactivation), see ``auth_app.signals``.
+    """
+
+    def authenticate_credentials(self, key):
+        token = token_cache.get_token(key)
+        if token is None:
+            model = self.get_model()
+            try:
+                token = model.objects.select_related('user').get(key=key)
+            except model.DoesNotExist:
+                raise AuthenticationFailed('Invalid token.')
+            token_cache.set_token(token)
+        if not token.user.is_active:
+            raise AuthenticationFailed('User inactive or deleted.')
+        return (token.user, token)
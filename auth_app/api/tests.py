@@ -1,7 +1,14 @@
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
 from django.contrib.auth import get_user_model
+from auth_app import token_cache
+from auth_app.api.authentication import CachedTokenAuthentication
 
 User = get_user_model()
 
@@ -18,3 +25,80 @@ class RegistrationTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertIn('token', response.data)
         self.assertEqual(response.data['email'], 'test@example.com')
+
+
+class CachedTokenAuthenticationTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        token_cache.stats.reset()
+        self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+        self.token = Token.objects.create(user=self.user)
+        self.auth = CachedTokenAuthentication()
+
+    def test_cached_lookup_needs_no_query(self):
+        self.auth.authenticate_credentials(self.token.key)
+        with self.assertNumQueries(0):
+            user, token = self.auth.authenticate_credentials(self.token.key)
+        self.assertEqual((user, token), (self.user, self.token))
+        self.assertEqual((token_cache.stats.hits, token_cache.stats.misses), (1, 1))
+        self.assertEqual(token_cache.stats.hit_rate, 0.5)
+
+    def test_cache_holds_a_minimal_snapshot(self):
+        self.auth.authenticate_credentials(self.token.key)
+        cached = cache.get(token_cache.cache_key(self.token.key))
+        self.assertEqual(cached, {'id': self.user.id, 'is_active': True, 'is_staff': False})
+        user, _ = self.auth.authenticate_credentials(self.token.key)
+        with self.assertNumQueries(1):
+            self.assertEqual(user.email, 'testuser@example.com')
+
+    def test_only_snapshot_changes_invalidate(self):
+        self.auth.authenticate_credentials(self.token.key)
+        with self.assertNumQueries(1):
+            self.user.save(update_fields=['last_login'])
+        self.user.fullname = 'Renamed'
+        with self.assertNumQueries(1):
+            self.user.save()
+        self.assertIsNotNone(token_cache.get_token(self.token.key))
+        self.user.is_staff = True
+        self.user.save()
+        self.assertIsNone(token_cache.get_token(self.token.key))
+
+    def test_deleted_token_and_inactive_user_are_rejected(self):
+        self.auth.authenticate_credentials(self.token.key)
+        self.user.is_active = False
+        self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self.auth.authenticate_credentials(self.token.key)
+        key = self.token.key
+        self.token.delete()
+        with self.assertRaises(AuthenticationFailed):
+            self.auth.authenticate_credentials(key)
+        response = self.client.get(reverse('board-list'), HTTP_AUTHORIZATION=f'Token {key}')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class LoginHardeningTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+
+    def test_login_upgrades_legacy_hash(self):
+        self.assertTrue(self.user.password.startswith('scrypt$'))
+        User.objects.filter(pk=self.user.pk).update(password=make_password('testpass', hasher='pbkdf2_sha256'))
+        response = self.client.post(reverse('login'), {'email': 'testuser@example.com', 'password': 'testpass'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        work_factor = settings.KANBAN_PASSWORD_HASHER_PARAMS['scrypt_work_factor']
+        self.assertTrue(self.user.password.startswith(f'scrypt${work_factor}$'))
+
+    def test_login_is_throttled_per_email_and_ip(self):
+        url = reverse('login')
+        for _ in range(5):
+            response = self.client.post(url, {'email': 'testuser@example.com', 'password': 'wrong'}, REMOTE_ADDR='10.0.0.1')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(url, {'email': 'TestUser@example.com', 'password': 'testpass'}, REMOTE_ADDR='10.0.0.1')
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        response = self.client.post(url, {'email': 'other@example.com', 'password': 'wrong'}, REMOTE_ADDR='10.0.0.1')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(url, {'email': 'testuser@example.com', 'password': 'testpass'}, REMOTE_ADDR='10.0.0.9')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,50 @@
+# Standardbibliothek
+import hashlib
+import threading
+from contextlib import contextmanager
+
+# Drittanbieter
+from django.conf import settings
+from rest_framework.exceptions import Throttled
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class AuthEmailRateThrottle(SimpleRateThrottle):
+    """Limits attempts per submitted email address and client IP.
+
+    Keying on the pair keeps a single client from locking the owner of an
+    address out; the ``auth`` scope still caps each IP overall.
+    """
+    scope = 'auth-email'
+
+    def get_cache_key(self, request, view):
+        email = request.data.get('email')
+        if not isinstance(email, str) or not email.strip():
+            return None
+        key = f'{email.strip().lower()}|{self.get_ident(request)}'
+        ident = hashlib.sha256(key.encode()).hexdigest()
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+
+_hashing_slots = None
+_hashing_slots_lock = threading.Lock()
+
+
+def _get_hashing_slots():
+    global _hashing_slots
+    with _hashing_slots_lock:
+        if _hashing_slots is None:
+            _hashing_slots = threading.BoundedSemaphore(getattr(settings, 'KANBAN_AUTH_MAX_CONCURRENT_HASHES', 4))
+        return _hashing_slots
+
+
+@contextmanager
+def password_hashing_slot():
+    """Cap concurrent password hashing per process; raise ``Throttled`` if no slot frees up in time."""
+    slots = _get_hashing_slots()
+    if not slots.acquire(timeout=getattr(settings, 'KANBAN_AUTH_HASHING_WAIT', 2)):
+        raise Throttled(wait=1)
+    try:
+        yield
+    finally:
+        slots.release()
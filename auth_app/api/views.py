@@ -2,23 +2,28 @@
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.authtoken.models import Token
+from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.views import APIView
 from django.contrib.auth import authenticate, get_user_model
 
 # Lokale Importe
 from .serializers import RegistrationSerializer, UserSerializer
+from .throttles import AuthEmailRateThrottle, password_hashing_slot
 
 User = get_user_model()
 
 class RegistrationView(generics.CreateAPIView):
     """API endpoint for user registration."""
     serializer_class = RegistrationSerializer
+    throttle_classes = [ScopedRateThrottle, AuthEmailRateThrottle]
+    throttle_scope = 'auth'
 
     def create(self, request, *args, **kwargs):
         """Create a new user and return a token."""
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        user = serializer.save()
+        with password_hashing_slot():
+            user = serializer.save()
         token, created = Token.objects.get_or_create(user=user)
         data = {
             'token': token.key,
@@ -30,11 +35,15 @@ class RegistrationView(generics.CreateAPIView):
 
 class LoginView(APIView):
     """API endpoint for user login."""
+    throttle_classes = [ScopedRateThrottle, AuthEmailRateThrottle]
+    throttle_scope = 'auth'
+
     def post(self, request):
         """Authenticate user and return a token."""
         email = request.data.get('email')
         password = request.data.get('password')
-        user = authenticate(request, username=email, password=password)
+        with password_hashing_slot():
+            user = authenticate(request, username=email, password=password)
         if user is not None:
             token, created = Token.objects.get_or_create(user=user)
             data = {
@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class AuthAppConfig(AppConfig):
+    name = 'auth_app'
+
+    def ready(self):
+        """Register signal handlers."""
+        from auth_app import signals  # noqa: F401
@@ -0,0 +1,42 @@
+# Drittanbieter
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, ScryptPasswordHasher
+
+
+def _param(name, default):
+    return getattr(settings, 'KANBAN_PASSWORD_HASHER_PARAMS', {}).get(name, default)
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    """scrypt with cost parameters from ``KANBAN_PASSWORD_HASHER_PARAMS``."""
+
+    @property
+    def work_factor(self):
+        return _param('scrypt_work_factor', ScryptPasswordHasher.work_factor)
+
+    @property
+    def block_size(self):
+        return _param('scrypt_block_size', ScryptPasswordHasher.block_size)
+
+    @property
+    def parallelism(self):
+        return _param('scrypt_parallelism', ScryptPasswordHasher.parallelism)
+
+    # hashlib's default limit (32 MiB) is too small for work factors >= 2 ** 15
+    maxmem = 2 ** 28
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2id with cost parameters from ``KANBAN_PASSWORD_HASHER_PARAMS``; needs ``argon2-cffi``."""
+
+    @property
+    def time_cost(self):
+        return _param('argon2_time_cost', Argon2PasswordHasher.time_cost)
+
+    @property
+    def memory_cost(self):
+        return _param('argon2_memory_cost', Argon2PasswordHasher.memory_cost)
+
+    @property
+    def parallelism(self):
+        return _param('argon2_parallelism', Argon2PasswordHasher.parallelism)
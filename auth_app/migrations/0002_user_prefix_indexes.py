@@ -0,0 +1,46 @@
+# Case-insensitive prefix indexes for the user typeahead. Expression indexes
+# on lower(...) are vendor-specific (text_pattern_ops makes LIKE 'x%' indexable
+# on PostgreSQL regardless of collation), so they are created with raw SQL.
+
+from django.db import migrations
+
+
+FIELDS = ('email', 'fullname')
+
+STATEMENTS = {
+    'sqlite': (
+        [f'CREATE INDEX auth_user_{field}_prefix_idx ON auth_app_user (lower({field}))' for field in FIELDS],
+        [f'DROP INDEX IF EXISTS auth_user_{field}_prefix_idx' for field in FIELDS],
+    ),
+    'postgresql': (
+        [f'CREATE INDEX auth_user_{field}_prefix_idx ON auth_app_user (lower({field}) text_pattern_ops)' for field in FIELDS],
+        [f'DROP INDEX IF EXISTS auth_user_{field}_prefix_idx' for field in FIELDS],
+    ),
+}
+
+
+def _run(schema_editor, direction):
+    statements = STATEMENTS.get(schema_editor.connection.vendor)
+    if statements is None:
+        return
+    for sql in statements[direction]:
+        schema_editor.execute(sql, params=None)
+
+
+def create_prefix_indexes(apps, schema_editor):
+    _run(schema_editor, 0)
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    _run(schema_editor, 1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+    ]
@@ -0,0 +1,38 @@
+# Drittanbieter
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+# Lokale Importe
+from auth_app.token_cache import SNAPSHOT_FIELDS, invalidate_tokens, snapshot
+
+
+@receiver(post_delete, sender=Token)
+def token_deleted(sender, instance, **kwargs):
+    """Forget a deleted token."""
+    invalidate_tokens([instance.key])
+
+
+@receiver(post_init, sender=get_user_model())
+def user_initialized(sender, instance, **kwargs):
+    """Remember the cached fields of a loaded user, so saves can tell whether they changed."""
+    if not instance.get_deferred_fields() & set(SNAPSHOT_FIELDS):
+        instance._token_snapshot = snapshot(instance)
+
+
+@receiver(post_save, sender=get_user_model())
+def user_saved(sender, instance, created, update_fields, **kwargs):
+    """Drop cached token snapshots when a user's ``SNAPSHOT_FIELDS`` change.
+
+    Other saves, like the ``last_login`` update on every login, skip the
+    token lookup.
+    """
+    if update_fields is not None and not set(update_fields) & set(SNAPSHOT_FIELDS):
+        return
+    current = snapshot(instance)
+    changed = current != getattr(instance, '_token_snapshot', None)
+    instance._token_snapshot = current
+    if created or not changed:
+        return
+    invalidate_tokens(Token.objects.filter(user=instance).values_list('key', flat=True))
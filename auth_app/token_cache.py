@@ -0,0 +1,104 @@
+# Standardbibliothek
+import hashlib
+import logging
+import threading
+
+# Drittanbieter
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.authtoken.models import Token
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = 'auth:token:{digest}'
+
+# User fields kept in the cache; any other field is loaded on first access
+SNAPSHOT_FIELDS = ('id', 'is_active', 'is_staff')
+
+
+class TokenCacheStats:
+    """Process-local hit/miss counters for the token cache."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def record(self, hit):
+        """Count one lookup and log the hit rate every ``KANBAN_TOKEN_CACHE_STATS_INTERVAL`` lookups."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            lookups = self.hits + self.misses
+        interval = getattr(settings, 'KANBAN_TOKEN_CACHE_STATS_INTERVAL', 1000)
+        if interval and lookups % interval == 0:
+            logger.info('token cache: %d hits, %d misses (%.1f%% hit rate)', self.hits, self.misses, self.hit_rate * 100)
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+stats = TokenCacheStats()
+
+
+def _cache():
+    """Return the cache backend configured for tokens."""
+    return caches[getattr(settings, 'KANBAN_TOKEN_CACHE', 'default')]
+
+
+def _timeout():
+    return getattr(settings, 'KANBAN_TOKEN_CACHE_TIMEOUT', 300)
+
+
+def cache_key(key):
+    """Return the cache key for a token; the raw token never appears in the cache."""
+    return CACHE_KEY.format(digest=hashlib.sha256(key.encode()).hexdigest())
+
+
+def snapshot(user):
+    """Return the cached fields of a user."""
+    return {name: getattr(user, name) for name in SNAPSHOT_FIELDS}
+
+
+def get_token(key):
+    """Return the cached ``Token`` for ``key``, or None on a miss.
+
+    Its user only has the ``SNAPSHOT_FIELDS`` loaded; the other fields are
+    deferred, so the password hash and profile never sit in the cache.
+    """
+    values = _cache().get(cache_key(key))
+    stats.record(values is not None)
+    if values is None:
+        return None
+    user_model = get_user_model()
+    names = [field.attname for field in user_model._meta.concrete_fields if field.attname in values]
+    user = user_model.from_db(user_model.objects.db, names, [values[name] for name in names])
+    token = Token.from_db(Token.objects.db, ['key', 'user_id'], [key, user.pk])
+    token.user = user
+    return token
+
+
+def set_token(token):
+    """Store the snapshot of a token's user."""
+    _cache().set(cache_key(token.key), snapshot(token.user), _timeout())
+
+
+def invalidate_tokens(keys):
+    """Drop cached tokens, now and after commit."""
+    cache_keys = [cache_key(key) for key in keys]
+    if not cache_keys:
+        return
+    cache = _cache()
+    cache.delete_many(cache_keys)
+    transaction.on_commit(lambda: cache.delete_many(cache_keys))
@@ -0,0 +1,67 @@
+# Standardbibliothek
+import hashlib
+
+# Drittanbieter
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connection
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.db.models.lookups import GreaterThanOrEqual, LessThan, StartsWith
+
+
+User = get_user_model()
+
+CACHE_KEY = 'auth:user-prefix:{scope}:{limit}:{digest}'
+# Highest code point; ``key < prefix + PREFIX_END`` closes a prefix range
+PREFIX_END = '\U0010ffff'
+
+
+def _cache():
+    """Return the cache backend configured for user prefix results."""
+    return caches[getattr(settings, 'KANBAN_USER_SEARCH_CACHE', 'default')]
+
+
+def fold(prefix):
+    """Lowercase ``prefix`` the way the database's ``lower()`` does.
+
+    SQLite's built-in ``lower()`` only folds ASCII letters, so other letters
+    keep their case there (``Öl`` matches "Ölaf", ``öl`` does not);
+    PostgreSQL folds all of Unicode like ``str.lower()``.
+    """
+    if connection.vendor == 'sqlite':
+        return ''.join(char.lower() if char.isascii() else char for char in prefix)
+    return prefix.lower()
+
+
+def prefix_match(field, prefix):
+    """Return a condition for rows whose lowercased ``field`` starts with ``prefix``.
+
+    Shaped to use the ``lower(field)`` indexes of migration 0002: a LIKE on
+    PostgreSQL (``text_pattern_ops``) and a range on SQLite, whose LIKE
+    optimization does not apply to expression indexes.
+    """
+    key = Lower(field)
+    prefix = fold(prefix)
+    if connection.vendor == 'postgresql':
+        return Q(StartsWith(key, prefix))
+    return Q(GreaterThanOrEqual(key, prefix), LessThan(key, prefix + PREFIX_END))
+
+
+def search_users(prefix, limit, queryset=None, scope='all'):
+    """Return up to ``limit`` users whose email or full name starts with ``prefix``.
+
+    Results are cached for ``KANBAN_USER_SEARCH_CACHE_TIMEOUT`` seconds per
+    ``scope``; callers restricting ``queryset`` must pass a matching scope.
+    """
+    digest = hashlib.sha256(fold(prefix).encode()).hexdigest()
+    key = CACHE_KEY.format(scope=scope, limit=limit, digest=digest)
+    cache = _cache()
+    users = cache.get(key)
+    if users is None:
+        queryset = User.objects.all() if queryset is None else queryset
+        condition = prefix_match('email', prefix) | prefix_match('fullname', prefix)
+        users = list(queryset.filter(condition).order_by(Lower('email')).values('id', 'email', 'fullname')[:limit])
+        cache.set(key, users, getattr(settings, 'KANBAN_USER_SEARCH_CACHE_TIMEOUT', 30))
+    return users
@@ -0,0 +1,74 @@
+"""
+Environment-driven ``DATABASES`` configuration.
+
+``DATABASE_ENGINE`` selects ``sqlite`` (default) or ``postgresql``. See the
+README for the variables each backend reads.
+"""
+
+
+def env_bool(environ, name, default=False):
+    """Read a boolean environment variable ('1', 'true', 'yes', 'on')."""
+    value = environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def sqlite_config(environ, base_dir):
+    """SQLite with WAL, a busy timeout and IMMEDIATE write transactions.
+
+    WAL lets readers proceed while one writer commits; IMMEDIATE takes the
+    write lock at BEGIN, so concurrent writers wait on ``busy_timeout``
+    instead of failing with "database is locked" when upgrading a read lock.
+    """
+    journal_mode = environ.get('SQLITE_JOURNAL_MODE', 'wal')
+    synchronous = environ.get('SQLITE_SYNCHRONOUS', 'normal')
+    return {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': environ.get('DATABASE_NAME') or base_dir / 'db.sqlite3',
+        'CONN_MAX_AGE': int(environ.get('DATABASE_CONN_MAX_AGE', 0)),
+        'CONN_HEALTH_CHECKS': env_bool(environ, 'DATABASE_CONN_HEALTH_CHECKS'),
+        'OPTIONS': {
+            'timeout': int(environ.get('SQLITE_BUSY_TIMEOUT', 5000)) / 1000,
+            'transaction_mode': environ.get('SQLITE_TRANSACTION_MODE', 'IMMEDIATE'),
+            'init_command': f'PRAGMA journal_mode={journal_mode}; PRAGMA synchronous={synchronous};',
+        },
+    }
+
+
+def postgresql_config(environ):
+    """PostgreSQL via psycopg 3, with either persistent connections or the native pool.
+
+    Django's pool (``DATABASE_POOL=1``, needs ``psycopg[pool]``) cannot be
+    combined with ``CONN_MAX_AGE``, so the latter is only used without pool.
+    """
+    config = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': environ.get('DATABASE_NAME', 'kanban'),
+        'USER': environ.get('DATABASE_USER', ''),
+        'PASSWORD': environ.get('DATABASE_PASSWORD', ''),
+        'HOST': environ.get('DATABASE_HOST', ''),
+        'PORT': environ.get('DATABASE_PORT', ''),
+        'CONN_HEALTH_CHECKS': env_bool(environ, 'DATABASE_CONN_HEALTH_CHECKS', True),
+        'OPTIONS': {},
+    }
+    if env_bool(environ, 'DATABASE_POOL'):
+        config['CONN_MAX_AGE'] = 0
+        config['OPTIONS']['pool'] = {
+            'min_size': int(environ.get('DATABASE_POOL_MIN_SIZE', 2)),
+            'max_size': int(environ.get('DATABASE_POOL_MAX_SIZE', 10)),
+            'timeout': int(environ.get('DATABASE_POOL_TIMEOUT', 10)),
+        }
+    else:
+        config['CONN_MAX_AGE'] = int(environ.get('DATABASE_CONN_MAX_AGE', 60))
+    return config
+
+
+def database_config(environ, base_dir):
+    """Return the ``default`` database settings for the environment."""
+    engine = environ.get('DATABASE_ENGINE', 'sqlite').lower()
+    if engine in ('sqlite', 'sqlite3'):
+        return sqlite_config(environ, base_dir)
+    if engine in ('postgres', 'postgresql'):
+        return postgresql_config(environ)
+    raise ValueError(f'Unsupported DATABASE_ENGINE: {engine}')
@@ -10,11 +10,22 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
+import sys
 from pathlib import Path
 
+from dotenv import load_dotenv
+
+from core.database import database_config
+
+TESTING = sys.argv[1:2] == ['test']
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# Environment variables from .env (already set variables win)
+load_dotenv(BASE_DIR / '.env')
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
@@ -46,6 +57,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
+    'kanban_app.profiling.QueryProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -78,13 +90,123 @@ WSGI_APPLICATION = 'core.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Driven by DATABASE_ENGINE and friends, see core/database.py and the README
 DATABASES = {
+    'default': database_config(os.environ, BASE_DIR),
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     }
 }
 
+# Cache alias and timeout (seconds) for the per-user board access sets
+KANBAN_MEMBERSHIP_CACHE = 'default'
+KANBAN_MEMBERSHIP_CACHE_TIMEOUT = 300
+
+# Cache alias and timeout (seconds) for token -> user snapshots; the hit rate
+# is logged by ``auth_app.token_cache`` every N lookups
+KANBAN_TOKEN_CACHE = 'default'
+KANBAN_TOKEN_CACHE_TIMEOUT = 300
+KANBAN_TOKEN_CACHE_STATS_INTERVAL = 1000
+
+# Board and user deletion: rows per DELETE transaction, and whether board
+# deletion answers 202 and purges in a background thread (requires a periodic
+# `manage.py purge_kanban --pending` to finish purges lost on restart)
+KANBAN_PURGE_CHUNK_SIZE = 1000
+KANBAN_PURGE_IN_BACKGROUND = False
+
+# Due-date reminders (manage.py send_due_reminders): look-ahead window in
+# hours and the sink class that delivers one batch per assignee
+KANBAN_REMINDER_HOURS = 24
+KANBAN_REMINDER_SINK = 'kanban_app.reminders.LogSink'
+KANBAN_REMINDER_FILE = BASE_DIR / 'reminders.ndjson'
+
+# Cache alias and timeout (seconds) for /api/users/search/ prefix results
+KANBAN_USER_SEARCH_CACHE = 'default'
+KANBAN_USER_SEARCH_CACHE_TIMEOUT = 30
+
+# Delta sync (/api/sync/): days of change log kept by prune_changelog, most
+# changes per response before clients are told to reset, and how long (s)
+# new revisions are re-sent in case an older transaction commits late
+KANBAN_SYNC_RETENTION_DAYS = 30
+KANBAN_SYNC_MAX_CHANGES = 5000
+KANBAN_SYNC_SETTLE_SECONDS = 5
+
+
+# Serve the read-heavy list/detail GET endpoints with async views
+KANBAN_ASYNC_READS = False
+
+# Board change stream: pub/sub backend and SSE keepalive interval (seconds)
+KANBAN_EVENT_BACKEND = 'kanban_app.pubsub.InProcessBroker'
+KANBAN_EVENT_HEARTBEAT = 15
+
+# Per-request query profiling (Server-Timing header + JSON log lines), off
+# unless KANBAN_QUERY_PROFILING=1. Budgets are query counts per URL name;
+# 'raise' turns an exceeded budget into an error, e.g. in tests.
+KANBAN_QUERY_PROFILING = os.environ.get('KANBAN_QUERY_PROFILING') == '1'
+KANBAN_QUERY_REPEAT_THRESHOLD = 5
+KANBAN_QUERY_BUDGETS = {
+    'board-list': 2,
+    'board-detail': 5,
+    'task-list': 3,
+    'task-detail': 3,
+    'tasks-assigned-to-me': 3,
+    'tasks-reviewing': 3,
+    'task-comments': 3,
+    'search': 3,
+    'user-search': 3,
+    'sync': 7,
+}
+KANBAN_QUERY_BUDGET_ACTION = 'log'
+
+
+# Password hashing
+# https://docs.djangoproject.com/en/5.2/topics/auth/passwords/
+
+# Password hashing profile: 'scrypt', 'pbkdf2' or 'argon2' (needs argon2-cffi).
+# The first hasher hashes new passwords, the others only verify old hashes,
+# which are upgraded transparently on the next successful login.
+PASSWORD_HASHER_PROFILES = {
+    'scrypt': [
+        'auth_app.hashers.TunedScryptPasswordHasher',
+        'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    ],
+    'pbkdf2': [
+        'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+        'auth_app.hashers.TunedScryptPasswordHasher',
+    ],
+    'argon2': [
+        'auth_app.hashers.TunedArgon2PasswordHasher',
+        'auth_app.hashers.TunedScryptPasswordHasher',
+        'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    ],
+}
+PASSWORD_HASHERS = PASSWORD_HASHER_PROFILES[os.environ.get('KANBAN_PASSWORD_HASHER', 'scrypt')]
+
+# Cost parameters of the tuned hashers (scrypt: ~32 MiB and ~0.1 s per hash)
+KANBAN_PASSWORD_HASHER_PARAMS = {
+    'scrypt_work_factor': 2 ** 15,
+    'scrypt_block_size': 8,
+    'scrypt_parallelism': 1,
+    'argon2_time_cost': 2,
+    'argon2_memory_cost': 102400,
+    'argon2_parallelism': 8,
+}
+if TESTING:
+    # Cheap parameters so the test suite doesn't pay ~0.1 s per create_user()
+    KANBAN_PASSWORD_HASHER_PARAMS.update(scrypt_work_factor=2 ** 10, argon2_time_cost=1, argon2_memory_cost=1024)
+
+# Concurrent password hashes per process; further login/registration requests
+# wait up to KANBAN_AUTH_HASHING_WAIT seconds, then get a 429
+KANBAN_AUTH_MAX_CONCURRENT_HASHES = 4
+KANBAN_AUTH_HASHING_WAIT = 2
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -108,14 +230,24 @@ AUTH_USER_MODEL = 'auth_app.User'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'auth_app.api.authentication.CachedTokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
     ],
+    'DEFAULT_PAGINATION_CLASS': 'kanban_app.api.pagination.KanbanCursorPagination',
+    # Login/registration attempts per client IP and per (email, client IP)
+    'DEFAULT_THROTTLE_RATES': {
+        'auth': '20/min',
+        'auth-email': '5/min',
+    },
+    'PAGE_SIZE': 50,
 }
 
+# Allow clients to request a plain list with ?paginate=false
+KANBAN_ALLOW_UNPAGINATED = True
+
 CORS_ALLOW_ALL_ORIGINS = True
 
 # Internationalization
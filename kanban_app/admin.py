@@ -4,7 +4,7 @@ from .models import Board, Task, Comment
 
 @admin.register(Board)
 class BoardAdmin(admin.ModelAdmin):
-    list_display = ('id', 'title', 'owner')
+    list_display = ('id', 'title', 'owner', 'member_count', 'task_count')
     search_fields = ('title',)
     filter_horizontal = ('members',)
 
@@ -22,5 +22,7 @@ class TaskAdmin(admin.ModelAdmin):
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
     list_display = ('id', 'task', 'author', 'created_at')
+    list_select_related = ('task', 'author')
     search_fields = ('content',)
-    list_filter = ('task', 'author')
+    list_filter = ('created_at',)
+    raw_id_fields = ('task', 'author')
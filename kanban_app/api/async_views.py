@@ -0,0 +1,142 @@
+# Drittanbieter
+from asgiref.sync import sync_to_async
+from django.db.models import Count, Max
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import NotFound
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+# Lokale Importe
+from kanban_app.membership import has_board_access
+from kanban_app.models import Board, Comment, Task
+from .conditional import make_etag, not_modified, set_validators
+from .filters import filter_comments, task_rows
+from .pagination import CommentCursorPagination, KanbanCursorPagination
+from .serializers import (
+    BoardDetailSerializer, BoardMemberRowSerializer, BoardSerializer, CommentRowSerializer, TaskRowSerializer
+)
+
+
+def split_by_method(async_view, sync_view):
+    """Serve GET/HEAD with an async view and every other method with the sync DRF view."""
+    sync_handler = sync_to_async(sync_view)
+
+    async def view(request, *args, **kwargs):
+        if request.method in ('GET', 'HEAD'):
+            return await async_view(request, *args, **kwargs)
+        return await sync_handler(request, *args, **kwargs)
+
+    return csrf_exempt(view)
+
+
+class AsyncReadView(APIView):
+    """DRF view whose ``get`` runs on the event loop.
+
+    ``dispatch`` follows ``APIView.dispatch``: authentication, permission
+    and throttle checks (``initial``) run in a worker thread because they
+    may query the database; subclasses implement ``async def get`` and
+    return a ``Response``.
+    """
+    http_method_names = ['get', 'head']
+    permission_classes = [IsAuthenticated]
+    pagination_class = KanbanCursorPagination
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            response = await handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def list_response(self, request, queryset, serializer_class, **serializer_kwargs):
+        """Return the (paginated) serialized list, fetching rows with ``aiterator()``."""
+        paginator = self.pagination_class()
+        page = await paginator.apaginate_queryset(queryset, request, self)
+        if page is None:
+            rows = [obj async for obj in queryset.aiterator()]
+            return Response(serializer_class(rows, many=True, **serializer_kwargs).data)
+        return paginator.get_paginated_response(serializer_class(page, many=True, **serializer_kwargs).data)
+
+
+class AsyncBoardListView(AsyncReadView):
+    """Async variant of ``BoardViewSet.list``."""
+
+    async def get(self, request):
+        return await self.list_response(request, Board.objects.accessible_to(request.user), BoardSerializer)
+
+
+class AsyncBoardDetailView(AsyncReadView):
+    """Async variant of ``BoardViewSet.retrieve``, including conditional GET."""
+
+    async def get(self, request, pk):
+        stamp = await (
+            Board.objects.accessible_to(request.user)
+            .filter(pk=pk)
+            .values('id', 'revision', 'updated_at')
+            .afirst()
+        )
+        if stamp is None:
+            raise NotFound('Board not found.')
+        etag = make_etag('board', stamp['id'], stamp['revision'])
+        response = not_modified(request, etag, stamp['updated_at'])
+        if response is not None:
+            return response
+        board = await Board.objects.aget(pk=stamp['id'])
+        context = {
+            'member_rows': [row async for row in BoardMemberRowSerializer.rows(board.members.all())],
+            'task_rows': [row async for row in TaskRowSerializer.rows(board.tasks.all())],
+        }
+        data = BoardDetailSerializer(board, context=context).data
+        return set_validators(Response(data), etag, stamp['updated_at'])
+
+
+class AsyncTaskListView(AsyncReadView):
+    """Async task list with the filters and ETag stamp of the sync task list views.
+
+    Subclasses set ``task_scope`` to the ``TaskQuerySet`` method that selects
+    the user's tasks.
+    """
+    task_scope = None
+    cursor_ordering = None
+
+    async def get(self, request):
+        tasks = getattr(Task.objects, self.task_scope)(request.user)
+        queryset, fields, self.cursor_ordering = task_rows(tasks, request.query_params, TaskRowSerializer)
+        stamp = await queryset.order_by().aaggregate(count=Count('id'), last_modified=Max('updated_at'))
+        etag = make_etag('tasks', request.user.id, stamp['count'], stamp['last_modified'].timestamp() if stamp['last_modified'] else 0)
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+        response = await self.list_response(request, queryset, TaskRowSerializer, fields=fields)
+        return set_validators(response, etag)
+
+
+class AsyncAssignedToMeTasksView(AsyncTaskListView):
+    """Async variant of ``AssignedToMeTasksView``."""
+    task_scope = 'assigned_to'
+
+
+class AsyncReviewingTasksView(AsyncTaskListView):
+    """Async variant of ``ReviewingTasksView``."""
+    task_scope = 'related_to'
+
+
+class AsyncCommentListView(AsyncReadView):
+    """Async variant of ``CommentListCreateView`` GET."""
+    pagination_class = CommentCursorPagination
+
+    async def get(self, request, task_id):
+        task = await Task.objects.filter(id=task_id).values('board_id').afirst()
+        if task is None or not await sync_to_async(has_board_access)(request.user, task['board_id']):
+            raise NotFound('Task not found.')
+        comments = filter_comments(Comment.objects.filter(task_id=task_id), request.query_params)
+        return await self.list_response(request, CommentRowSerializer.rows(comments), CommentRowSerializer)
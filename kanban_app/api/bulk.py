@@ -0,0 +1,214 @@
+# Standardbibliothek
+from collections import defaultdict
+
+# Drittanbieter
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
+
+# Lokale Importe
+from kanban_app import changelog, counters
+from kanban_app.membership import get_accessible_board_ids
+from kanban_app.models import Board, Task
+from kanban_app.pubsub import publish_board_event
+from .serializers import BulkTaskCreateSerializer, BulkTaskUpdateSerializer, TaskSerializer
+
+
+User = get_user_model()
+
+
+class TaskBulkOperation:
+    """Apply the create, update and delete operations of one bulk request.
+
+    Referenced tasks, boards and users are loaded with one query each, and all
+    writes happen in a single transaction. Each operation gets its own result
+    entry, so invalid items do not block the valid ones.
+    """
+    update_fields = ('title', 'description', 'status', 'priority', 'due_date')
+
+    def __init__(self, user, creates, updates, deletes):
+        self.user = user
+        self.creates = [BulkTaskCreateSerializer(data=item) for item in creates]
+        self.updates = [BulkTaskUpdateSerializer(data=item) for item in updates]
+        self.deletes = deletes
+        self.results = {
+            'create': [None] * len(creates),
+            'update': [None] * len(updates),
+            'delete': [None] * len(deletes),
+        }
+
+    def run(self):
+        """Validate, resolve, write and return the per-item results."""
+        for serializer in self.creates + self.updates:
+            serializer.is_valid()
+        self.load()
+        new_tasks = self.prepare_creates()
+        changed_tasks, changed_fields = self.prepare_updates()
+        deleted_tasks = self.prepare_deletes()
+        with transaction.atomic():
+            Task.objects.bulk_create([task for _, task in new_tasks], batch_size=500)
+            if changed_tasks:
+                now = timezone.now()
+                for task in changed_tasks.values():
+                    task.updated_at = now
+                fields = sorted(changed_fields) + ['updated_at']
+                Task.objects.bulk_update(changed_tasks.values(), fields, batch_size=500)
+            if deleted_tasks:
+                Task.objects.filter(id__in=deleted_tasks).delete()
+            counters.tasks_changed(self.counter_deltas(new_tasks, changed_tasks, deleted_tasks))
+            changelog.record('task', [(task.board_id, task.id) for _, task in new_tasks] + [
+                (task.board_id, task_id) for task_id, task in changed_tasks.items() if task_id not in deleted_tasks
+            ])
+            changelog.record('task', [(self.tasks[task_id].board_id, task_id) for task_id in deleted_tasks], deleted=True)
+        for index, task in new_tasks:
+            data = TaskSerializer(task).data
+            self.results['create'][index] = {'status': status.HTTP_201_CREATED, 'task': data}
+            publish_board_event(task.board_id, 'task.created', data)
+        for index, serializer in enumerate(self.updates):
+            if self.results['update'][index] is None:
+                task = self.tasks[serializer.validated_data['id']]
+                self.results['update'][index] = {'status': status.HTTP_200_OK, 'task': TaskSerializer(task).data}
+        for task_id, task in changed_tasks.items():
+            if task_id not in deleted_tasks:
+                publish_board_event(task.board_id, 'task.updated', TaskSerializer(task).data)
+        for task_id in deleted_tasks:
+            publish_board_event(self.tasks[task_id].board_id, 'task.deleted', {'id': task_id})
+        return self.results
+
+    def load(self):
+        """Resolve all referenced tasks, boards and users with one query each."""
+        task_ids = {s.validated_data['id'] for s in self.updates if not s.errors}
+        task_ids.update(task_id for task_id in self.deletes if self.is_id(task_id))
+        self.tasks = Task.objects.for_serialization().in_bulk(task_ids) if task_ids else {}
+        self.original_flags = {task.id: (task.status, task.priority) for task in self.tasks.values()}
+        board_ids = {s.validated_data['board'] for s in self.creates if not s.errors}
+        board_ids.update(task.board_id for task in self.tasks.values())
+        self.boards = Board.objects.in_bulk(board_ids) if board_ids else {}
+        user_ids = {
+            s.validated_data[field]
+            for s in self.creates + self.updates if not s.errors
+            for field in ('assignee_id', 'reviewer_id')
+            if s.validated_data.get(field)
+        }
+        self.users = User.objects.in_bulk(user_ids) if user_ids else {}
+        self.accessible_board_ids = get_accessible_board_ids(self.user)
+
+    def prepare_creates(self):
+        """Return (index, unsaved task) pairs for all valid create operations."""
+        new_tasks = []
+        for index, serializer in enumerate(self.creates):
+            if serializer.errors:
+                self.fail('create', index, status.HTTP_400_BAD_REQUEST, serializer.errors)
+                continue
+            data = serializer.validated_data
+            board = self.boards.get(data['board'])
+            if board is None:
+                self.fail('create', index, status.HTTP_404_NOT_FOUND, {'detail': 'Board not found.'})
+                continue
+            if board.id not in self.accessible_board_ids:
+                self.fail('create', index, status.HTTP_403_FORBIDDEN, {'detail': 'Not a board member.'})
+                continue
+            user_errors = self.user_errors(data)
+            if user_errors:
+                self.fail('create', index, status.HTTP_400_BAD_REQUEST, user_errors)
+                continue
+            new_tasks.append((index, Task(
+                board=board,
+                title=data['title'],
+                description=data['description'],
+                status=data['status'],
+                priority=data['priority'],
+                assignee=self.users.get(data.get('assignee_id')),
+                reviewer=self.users.get(data.get('reviewer_id')),
+                due_date=data.get('due_date'),
+                created_by=self.user,
+            )))
+        return new_tasks
+
+    def prepare_updates(self):
+        """Apply valid update operations in memory; return tasks and changed fields."""
+        changed_tasks = {}
+        changed_fields = set()
+        for index, serializer in enumerate(self.updates):
+            if serializer.errors:
+                self.fail('update', index, status.HTTP_400_BAD_REQUEST, serializer.errors)
+                continue
+            data = serializer.validated_data
+            task = self.accessible_task(data['id'])
+            if task is None:
+                self.fail('update', index, status.HTTP_404_NOT_FOUND, {'detail': 'Task not found.'})
+                continue
+            user_errors = self.user_errors(data)
+            if user_errors:
+                self.fail('update', index, status.HTTP_400_BAD_REQUEST, user_errors)
+                continue
+            for field in self.update_fields:
+                if field in data:
+                    setattr(task, field, data[field])
+                    changed_fields.add(field)
+            for field in ('assignee', 'reviewer'):
+                if f'{field}_id' in data:
+                    setattr(task, field, self.users.get(data[f'{field}_id']))
+                    changed_fields.add(field)
+            changed_tasks[task.id] = task
+        return changed_tasks, changed_fields
+
+    def prepare_deletes(self):
+        """Return the IDs of all tasks the user may delete."""
+        deleted_tasks = []
+        for index, task_id in enumerate(self.deletes):
+            task = self.accessible_task(task_id) if self.is_id(task_id) else None
+            if task is None:
+                self.fail('delete', index, status.HTTP_404_NOT_FOUND, {'detail': 'Task not found.'})
+                continue
+            if self.user.id not in (task.created_by_id, self.boards[task.board_id].owner_id):
+                self.fail('delete', index, status.HTTP_403_FORBIDDEN, {'detail': 'Only the creator or board owner can delete this task.'})
+                continue
+            if task.id not in deleted_tasks:
+                deleted_tasks.append(task.id)
+            self.results['delete'][index] = {'status': status.HTTP_204_NO_CONTENT, 'id': task.id}
+        return deleted_tasks
+
+    def counter_deltas(self, new_tasks, changed_tasks, deleted_tasks):
+        """Collect per-board counter deltas for all written tasks."""
+        deltas = defaultdict(lambda: [0, 0, 0])
+        deleted = set(deleted_tasks)
+
+        def add(board_id, delta):
+            for position, value in enumerate(delta):
+                deltas[board_id][position] += value
+
+        for _, task in new_tasks:
+            add(task.board_id, counters.task_flag_delta(task.status, task.priority))
+        for task_id, task in changed_tasks.items():
+            if task_id not in deleted:
+                add(task.board_id, counters.task_flag_delta(task.status, task.priority))
+                add(task.board_id, counters.task_flag_delta(*self.original_flags[task_id], sign=-1))
+        for task_id in deleted_tasks:
+            add(self.tasks[task_id].board_id, counters.task_flag_delta(*self.original_flags[task_id], sign=-1))
+        return deltas
+
+    def accessible_task(self, task_id):
+        """Return the loaded task if it exists on a board the user can access."""
+        task = self.tasks.get(task_id)
+        if task is None or task.board_id not in self.accessible_board_ids:
+            return None
+        return task
+
+    def user_errors(self, data):
+        """Return field errors for assignee/reviewer IDs that do not exist."""
+        return {
+            field: 'User not found.'
+            for field in ('assignee_id', 'reviewer_id')
+            if data.get(field) and data[field] not in self.users
+        }
+
+    def fail(self, operation, index, status_code, errors):
+        """Record a failed operation."""
+        self.results[operation][index] = {'status': status_code, 'errors': errors}
+
+    @staticmethod
+    def is_id(value):
+        """Return True if the value is usable as a primary key."""
+        return isinstance(value, int) and not isinstance(value, bool)
@@ -0,0 +1,25 @@
+# Drittanbieter
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(*parts):
+    """Return a quoted ETag built from version stamp parts."""
+    return quote_etag('-'.join(str(part) for part in parts))
+
+
+def not_modified(request, etag, last_modified=None):
+    """Return a 304 response if the request's validators match, else None."""
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag, last_modified=None):
+    """Attach ETag and Last-Modified headers to a response."""
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
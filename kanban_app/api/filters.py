@@ -0,0 +1,151 @@
+# Standardbibliothek
+from datetime import date
+
+# Drittanbieter
+from django.db.models import Case, F, IntegerField, Q, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+
+# Lokale Importe
+from kanban_app.models import Task
+
+
+def _rank(field, choices):
+    """Return a CASE expression ranking ``field`` by the order of ``choices``."""
+    return Case(
+        *(When(**{field: value}, then=Value(index)) for index, (value, _) in enumerate(choices)),
+        default=Value(len(choices)),
+        output_field=IntegerField(),
+    )
+
+
+# Public ordering names -> expression annotated as ``sort_key``. Sort keys are
+# never NULL, so ``(sort_key, id)`` is a unique cursor position.
+TASK_ORDERING = {
+    'title': lambda: F('title'),
+    'updated_at': lambda: F('updated_at'),
+    'due_date': lambda: Coalesce('due_date', Value(date.max)),
+    'priority': lambda: _rank('priority', Task.PRIORITY_CHOICES),
+    'status': lambda: _rank('status', Task.STATUS_CHOICES),
+}
+
+
+def _split(value):
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def _choices(params, name, choices):
+    values = _split(params.get(name, ''))
+    allowed = {value for value, _ in choices}
+    invalid = [value for value in values if value not in allowed]
+    if invalid:
+        raise ValidationError({name: f"Unknown value(s): {', '.join(invalid)}."})
+    return values
+
+
+def _date(params, name):
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValidationError({name: 'Use YYYY-MM-DD.'})
+
+
+def _datetime(params, name):
+    value = params.get(name)
+    if not value:
+        return None
+    # A literal '+' in a query string arrives as a space
+    parsed = parse_datetime(value.replace(' ', '+'))
+    if parsed is None:
+        raise ValidationError({name: 'Use an ISO 8601 timestamp, e.g. 2026-01-31T12:00:00Z.'})
+    return parsed if timezone.is_aware(parsed) else timezone.make_aware(parsed)
+
+
+def _bool(params, name):
+    value = params.get(name, '').lower()
+    if value in ('', '0', 'false', 'no'):
+        return False
+    if value in ('1', 'true', 'yes'):
+        return True
+    raise ValidationError({name: 'Use true or false.'})
+
+
+def filter_tasks(queryset, params):
+    """Apply the ``status``, ``priority``, ``board``, ``due_after``, ``due_before`` and ``overdue`` filters.
+
+    Multiple values are comma-separated. Raises ``ValidationError`` on bad input.
+    """
+    statuses = _choices(params, 'status', Task.STATUS_CHOICES)
+    if statuses:
+        queryset = queryset.filter(status__in=statuses)
+    priorities = _choices(params, 'priority', Task.PRIORITY_CHOICES)
+    if priorities:
+        queryset = queryset.filter(priority__in=priorities)
+    boards = _split(params.get('board', ''))
+    if boards:
+        if not all(board.isdigit() for board in boards):
+            raise ValidationError({'board': 'Use board ids.'})
+        queryset = queryset.filter(board_id__in=[int(board) for board in boards])
+    due_after, due_before = _date(params, 'due_after'), _date(params, 'due_before')
+    if due_after:
+        queryset = queryset.filter(due_date__gte=due_after)
+    if due_before:
+        queryset = queryset.filter(due_date__lte=due_before)
+    if _bool(params, 'overdue'):
+        queryset = queryset.filter(due_date__lt=timezone.localdate()).filter(~Q(status='done'))
+    return queryset
+
+
+def order_tasks(queryset, params):
+    """Apply ``?ordering=`` (``-`` prefix for descending); return the queryset and its ordering.
+
+    The ordering is None for the default ``id`` ordering. Call it after
+    ``values()`` so the ``sort_key`` annotation ends up in the rows.
+    """
+    value = params.get('ordering')
+    if not value or value in ('id', '-id'):
+        ordering = (value,) if value else None
+        return (queryset.order_by(*ordering) if ordering else queryset), ordering
+    name = value.lstrip('-')
+    if name not in TASK_ORDERING:
+        choices = ', '.join(['id', *TASK_ORDERING])
+        raise ValidationError({'ordering': f"Use one of {choices}, optionally prefixed with '-'."})
+    prefix = '-' if value.startswith('-') else ''
+    ordering = (f'{prefix}sort_key', f'{prefix}id')
+    return queryset.annotate(sort_key=TASK_ORDERING[name]()).order_by(*ordering), ordering
+
+
+def filter_comments(queryset, params):
+    """Apply ``?since=``: only comments created strictly after the given timestamp."""
+    since = _datetime(params, 'since')
+    if since is not None:
+        queryset = queryset.filter(created_at__gt=since)
+    return queryset
+
+
+def sparse_fields(params, serializer_class):
+    """Return the field names requested with ``?fields=``, or None for all fields."""
+    fields = _split(params.get('fields', ''))
+    if not fields:
+        return None
+    unknown = [field for field in fields if field not in serializer_class.field_sources]
+    if unknown:
+        raise ValidationError({'fields': f"Unknown field(s): {', '.join(unknown)}."})
+    return fields
+
+
+def task_rows(queryset, params, serializer_class):
+    """Apply filters, ``?fields=`` and ``?ordering=`` to a task queryset.
+
+    Returns the ``values()`` rows, the requested fields (None for all) and
+    the cursor ordering (None for the default).
+    """
+    fields = sparse_fields(params, serializer_class)
+    rows = serializer_class.rows(filter_tasks(queryset, params), fields)
+    rows, ordering = order_tasks(rows, params)
+    return rows, fields, ordering
@@ -0,0 +1,158 @@
+# Standardbibliothek
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64Error
+from urllib.parse import parse_qs, urlencode
+
+# Drittanbieter
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KanbanCursorPagination(BasePagination):
+    """Keyset pagination returning ``{"next", "previous", "results"}``.
+
+    The ordering must end in ``id`` so positions are unique; views may set
+    ``cursor_ordering`` to e.g. ``('-sort_key', '-id')``, with the same
+    direction for every field. A cursor stores the direction and the
+    ordering values of the row it starts after, so ties never repeat or skip
+    rows. The page query is built and evaluated in separate steps so the
+    async views can fetch it with ``aiterator()``. Clients that still expect
+    a plain list can opt out with ``?paginate=false`` as long as
+    ``KANBAN_ALLOW_UNPAGINATED`` is enabled.
+    """
+    ordering = ('id',)
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    unpaginated_query_param = 'paginate'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return a page of results, or None if the client opted out."""
+        page_queryset = self.get_page_queryset(queryset, request, view)
+        if page_queryset is None:
+            return None
+        return self.set_page(list(page_queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """Async variant of ``paginate_queryset``."""
+        page_queryset = self.get_page_queryset(queryset, request, view)
+        if page_queryset is None:
+            return None
+        return self.set_page([obj async for obj in page_queryset.aiterator()])
+
+    def get_paginated_response(self, data):
+        return Response({'next': self.next_link, 'previous': self.previous_link, 'results': data})
+
+    def is_unpaginated(self, request):
+        """Return True if the request opted out of pagination."""
+        if not getattr(settings, 'KANBAN_ALLOW_UNPAGINATED', False):
+            return False
+        value = request.query_params.get(self.unpaginated_query_param, '')
+        return value.lower() in ('0', 'false', 'no')
+
+    def get_page_size(self, request):
+        """Return ``?page_size=`` capped at ``max_page_size``, else ``PAGE_SIZE``."""
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return api_settings.PAGE_SIZE
+        return min(page_size, self.max_page_size) if page_size > 0 else api_settings.PAGE_SIZE
+
+    def get_page_queryset(self, queryset, request, view=None):
+        """Decode the cursor and return the sliced queryset for the page, or None."""
+        if self.is_unpaginated(request):
+            return None
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.base_url = request.build_absolute_uri()
+        self.ordering = tuple(getattr(view, 'cursor_ordering', None) or self.ordering)
+        self.reverse, self.position = self.decode_cursor(request, queryset)
+        descending = self.ordering[0].startswith('-') != self.reverse
+        fields = [field.lstrip('-') for field in self.ordering]
+        queryset = queryset.order_by(*(f'-{field}' if descending else field for field in fields))
+        if self.position is not None:
+            queryset = queryset.filter(self.after(fields, self.position, 'lt' if descending else 'gt'))
+        return queryset[:self.page_size + 1]
+
+    @staticmethod
+    def after(fields, values, lookup):
+        """Return the condition for rows after ``values`` in lexicographic ``fields`` order."""
+        condition = Q()
+        for index, field in enumerate(fields):
+            equal = {fields[i]: values[i] for i in range(index)}
+            condition |= Q(**equal, **{f'{field}__{lookup}': values[index]})
+        return condition
+
+    def get_position(self, instance):
+        """Return the ordering values of a row or model instance as strings."""
+        fields = [field.lstrip('-') for field in self.ordering]
+        if isinstance(instance, dict):
+            return [str(instance[field]) for field in fields]
+        return [str(getattr(instance, field)) for field in fields]
+
+    def set_page(self, results):
+        """Keep ``page_size`` rows and build the links around them."""
+        page = list(results[:self.page_size])
+        has_more = len(results) > len(page)
+        if self.reverse:
+            page.reverse()
+        first = self.get_position(page[0]) if page else self.position
+        last = self.get_position(page[-1]) if page else self.position
+        started = self.position is not None
+        has_next, has_previous = (started, has_more) if self.reverse else (has_more, started)
+        self.next_link = self.encode_cursor(False, last) if has_next else None
+        self.previous_link = self.encode_cursor(True, first) if has_previous else None
+        self.page = page
+        return page
+
+    def decode_cursor(self, request, queryset):
+        """Return ``(reverse, position)`` of the request's cursor; raise NotFound if malformed.
+
+        Position values are converted with the ordering fields of ``queryset``,
+        so tampered cursors are rejected here instead of failing in the query.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return False, None
+        try:
+            tokens = parse_qs(urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'), keep_blank_values=True)
+            position = tokens['p']
+        except (Base64Error, KeyError, UnicodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        try:
+            position = [self.to_python(queryset, field.lstrip('-'), value) for field, value in zip(self.ordering, position)]
+        except (ValidationError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        return tokens.get('r') == ['1'], position
+
+    @staticmethod
+    def to_python(queryset, name, value):
+        """Convert a cursor value with the model field or annotation ``name`` of ``queryset``."""
+        annotation = queryset.query.annotations.get(name)
+        field = annotation.output_field if annotation is not None else queryset.model._meta.get_field(name)
+        value = field.to_python(value)
+        field.run_validators(value)
+        return value
+
+    def encode_cursor(self, reverse, position):
+        """Return the URL for a page starting after ``position``, or the first page."""
+        if position is None:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        tokens = {'p': position, **({'r': '1'} if reverse else {})}
+        encoded = urlsafe_b64encode(urlencode(tokens, doseq=True).encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+
+class CommentCursorPagination(KanbanCursorPagination):
+    """Keyset pagination over the comment ``created_at`` ordering."""
+    ordering = ('created_at', 'id')
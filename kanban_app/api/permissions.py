@@ -4,21 +4,22 @@
 # Drittanbieter
 from rest_framework.permissions import BasePermission
 
+# Lokale Importe
+from kanban_app.membership import has_board_access
+
 
 class IsBoardOwnerOrMember(BasePermission):
     """Permission: User must be board owner or member."""
 
     def has_object_permission(self, request, view, obj):
-        user = request.user
-        return user == obj.owner or user in obj.members.all()
+        return has_board_access(request.user, obj.id)
 
 
 class IsTaskBoardMember(BasePermission):
     """Permission: User must be board owner or member for a task."""
 
     def has_object_permission(self, request, view, obj):
-        user = request.user
-        return user in obj.board.members.all() or user == obj.board.owner
+        return has_board_access(request.user, obj.board_id)
 
 
 class IsCommentAuthor(BasePermission):
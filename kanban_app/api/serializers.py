@@ -1,5 +1,5 @@
 # Standardbibliothek
-# (keine)
+from abc import ABC, abstractmethod
 
 # Drittanbieter
 from rest_framework import serializers
@@ -22,11 +22,10 @@ class BoardMemberSerializer(serializers.ModelSerializer):
 
 class BoardSerializer(serializers.ModelSerializer):
     """Serializer for board list view with summary fields."""
-    owner_id = serializers.IntegerField(source='owner.id', read_only=True)
-    member_count = serializers.SerializerMethodField()
-    ticket_count = serializers.SerializerMethodField()
-    tasks_to_do_count = serializers.SerializerMethodField()
-    tasks_high_prio_count = serializers.SerializerMethodField()
+    owner_id = serializers.IntegerField(read_only=True)
+    ticket_count = serializers.IntegerField(source='task_count', read_only=True)
+    tasks_to_do_count = serializers.IntegerField(source='todo_count', read_only=True)
+    tasks_high_prio_count = serializers.IntegerField(source='high_prio_count', read_only=True)
 
     class Meta:
         model = Board
@@ -35,36 +34,34 @@ class BoardSerializer(serializers.ModelSerializer):
             'tasks_to_do_count', 'tasks_high_prio_count'
         ]
 
-    def get_member_count(self, obj):
-        """Return the number of members in the board."""
-        return obj.members.count()
-
-    def get_ticket_count(self, obj):
-        """Return the number of tasks in the board."""
-        return obj.tasks.count()
-
-    def get_tasks_to_do_count(self, obj):
-        """Return the number of 'to-do' tasks in the board."""
-        return obj.tasks.filter(status='to-do').count()
-
-    def get_tasks_high_prio_count(self, obj):
-        """Return the number of high priority tasks in the board."""
-        return obj.tasks.filter(priority='high').count()
-
 
 class BoardDetailSerializer(serializers.ModelSerializer):
-    """Serializer for board detail view with members and tasks."""
-    owner_id = serializers.IntegerField(source='owner.id', read_only=True)
-    members = BoardMemberSerializer(many=True, read_only=True)
+    """Serializer for board detail view with members and tasks.
+
+    Members and tasks are read as ``values()`` rows; callers that already
+    fetched them (the async view) pass ``member_rows``/``task_rows`` in the context.
+    """
+    owner_id = serializers.IntegerField(read_only=True)
+    members = serializers.SerializerMethodField()
     tasks = serializers.SerializerMethodField()
 
     class Meta:
         model = Board
         fields = ['id', 'title', 'owner_id', 'members', 'tasks']
 
+    def get_members(self, obj):
+        """Return serialized members for the board."""
+        rows = self.context.get('member_rows')
+        if rows is None:
+            rows = BoardMemberRowSerializer.rows(obj.members.all())
+        return BoardMemberRowSerializer(rows, many=True).data
+
     def get_tasks(self, obj):
         """Return serialized tasks for the board."""
-        return TaskSerializer(obj.tasks.all(), many=True).data
+        rows = self.context.get('task_rows')
+        if rows is None:
+            rows = TaskRowSerializer.rows(obj.tasks.all())
+        return TaskRowSerializer(rows, many=True).data
 
 
 class TaskUserSerializer(serializers.ModelSerializer):
@@ -79,8 +76,7 @@ class TaskSerializer(serializers.ModelSerializer):
     """Serializer for tasks with assignee, reviewer, board id, and comment count."""
     assignee = TaskUserSerializer(read_only=True)
     reviewer = TaskUserSerializer(read_only=True)
-    board = serializers.IntegerField(source='board.id', read_only=True)
-    comments_count = serializers.SerializerMethodField()
+    board = serializers.IntegerField(source='board_id', read_only=True)
 
     class Meta:
         model = Task
@@ -89,9 +85,138 @@ class TaskSerializer(serializers.ModelSerializer):
             'assignee', 'reviewer', 'due_date', 'comments_count'
         ]
 
-    def get_comments_count(self, obj):
-        """Return the number of comments for the task."""
-        return obj.comments.count()
+
+class RowSerializer(ABC):
+    """Read-only serializer for flat ``values()`` rows, skipping DRF's per-field work.
+
+    Subclasses list the ``values()`` lookups in ``value_fields`` and build the
+    same dict their ``ModelSerializer`` counterpart would. Subclasses that
+    support sparse fieldsets map each output field to its lookups in
+    ``field_sources`` and render single fields in ``render_field``.
+    """
+    value_fields = ()
+    field_sources = {}
+
+    def __init__(self, instance=None, many=False, fields=None, **kwargs):
+        self.instance = instance
+        self.many = many
+        self.fields = fields
+
+    @classmethod
+    def rows(cls, queryset, fields=None):
+        """Return ``queryset`` as the ``values()`` rows this serializer expects.
+
+        With ``fields``, only the lookups in ``field_sources`` those fields
+        need are selected (plus ``id``), so unrequested joins are skipped.
+        """
+        if fields is None:
+            return queryset.values(*cls.value_fields)
+        lookups = dict.fromkeys(['id', *(lookup for field in fields for lookup in cls.field_sources[field])])
+        return queryset.values(*lookups)
+
+    @property
+    def data(self):
+        if self.many:
+            return [self.to_representation(row) for row in self.instance]
+        return self.to_representation(self.instance)
+
+    @abstractmethod
+    def to_representation(self, row):
+        """Return the JSON-ready dict for one ``values()`` row."""
+
+
+class BoardMemberRowSerializer(RowSerializer):
+    """Row variant of ``BoardMemberSerializer``."""
+    value_fields = ('id', 'email', 'fullname')
+
+    def to_representation(self, row):
+        return {'id': row['id'], 'email': row['email'], 'fullname': row['fullname']}
+
+
+class TaskRowSerializer(RowSerializer):
+    """Row variant of ``TaskSerializer`` for list endpoints; renders identical JSON."""
+    value_fields = (
+        'id', 'board_id', 'title', 'description', 'status', 'priority', 'due_date', 'comments_count',
+        'assignee_id', 'assignee__email', 'assignee__fullname',
+        'reviewer_id', 'reviewer__email', 'reviewer__fullname',
+    )
+
+    field_sources = {
+        'id': ('id',),
+        'board': ('board_id',),
+        'title': ('title',),
+        'description': ('description',),
+        'status': ('status',),
+        'priority': ('priority',),
+        'assignee': ('assignee_id', 'assignee__email', 'assignee__fullname'),
+        'reviewer': ('reviewer_id', 'reviewer__email', 'reviewer__fullname'),
+        'due_date': ('due_date',),
+        'comments_count': ('comments_count',),
+    }
+
+    @staticmethod
+    def user(row, prefix):
+        """Return the nested user dict for ``prefix`` or None if unset."""
+        user_id = row[f'{prefix}_id']
+        if user_id is None:
+            return None
+        return {'id': user_id, 'email': row[f'{prefix}__email'], 'fullname': row[f'{prefix}__fullname']}
+
+    def render_field(self, row, field):
+        """Render a single output field of a sparse fieldset."""
+        if field in ('assignee', 'reviewer'):
+            return self.user(row, field)
+        if field == 'due_date':
+            return row['due_date'].isoformat() if row['due_date'] is not None else None
+        return row[self.field_sources[field][0]]
+
+    def to_representation(self, row):
+        if self.fields is not None:
+            return {field: self.render_field(row, field) for field in self.fields}
+        due_date = row['due_date']
+        return {
+            'id': row['id'],
+            'board': row['board_id'],
+            'title': row['title'],
+            'description': row['description'],
+            'status': row['status'],
+            'priority': row['priority'],
+            'assignee': self.user(row, 'assignee'),
+            'reviewer': self.user(row, 'reviewer'),
+            'due_date': due_date.isoformat() if due_date is not None else None,
+            'comments_count': row['comments_count'],
+        }
+
+
+class BulkTaskRequestSerializer(serializers.Serializer):
+    """Validates the body of the bulk task endpoint; its items are validated one by one."""
+    create = serializers.ListField(required=False, default=list)
+    update = serializers.ListField(required=False, default=list)
+    delete = serializers.ListField(required=False, default=list)
+
+
+class BulkTaskCreateSerializer(serializers.Serializer):
+    """Validates one create operation of the bulk task endpoint."""
+    board = serializers.IntegerField()
+    title = serializers.CharField(max_length=255)
+    description = serializers.CharField(required=False, allow_blank=True, default='')
+    status = serializers.ChoiceField(choices=Task.STATUS_CHOICES)
+    priority = serializers.ChoiceField(choices=Task.PRIORITY_CHOICES)
+    assignee_id = serializers.IntegerField(required=False, allow_null=True)
+    reviewer_id = serializers.IntegerField(required=False, allow_null=True)
+    due_date = serializers.DateField(required=False, allow_null=True)
+
+
+class BulkTaskUpdateSerializer(serializers.Serializer):
+    """Validates one update operation of the bulk task endpoint."""
+    id = serializers.IntegerField()
+    title = serializers.CharField(required=False, max_length=255)
+    description = serializers.CharField(required=False, allow_blank=True)
+    status = serializers.ChoiceField(required=False, choices=Task.STATUS_CHOICES)
+    priority = serializers.ChoiceField(required=False, choices=Task.PRIORITY_CHOICES)
+    assignee_id = serializers.IntegerField(required=False, allow_null=True)
+    reviewer_id = serializers.IntegerField(required=False, allow_null=True)
+    due_date = serializers.DateField(required=False, allow_null=True)
 
 
 class CommentSerializer(serializers.ModelSerializer):
@@ -101,3 +226,17 @@ class CommentSerializer(serializers.ModelSerializer):
     class Meta:
         model = Comment
         fields = ['id', 'created_at', 'author', 'content']
+
+
+class CommentRowSerializer(RowSerializer):
+    """Row variant of ``CommentSerializer`` for the comment list, exports and ``/api/sync/``."""
+    value_fields = ('id', 'created_at', 'author__fullname', 'content')
+    created_at = serializers.DateTimeField()
+
+    def to_representation(self, row):
+        return {
+            'id': row['id'],
+            'created_at': self.created_at.to_representation(row['created_at']),
+            'author': row['author__fullname'],
+            'content': row['content'],
+        }
@@ -0,0 +1,132 @@
+# Standardbibliothek
+import asyncio
+import json
+
+# Drittanbieter
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+def dumps(data):
+    """Encode like DRF's compact ``JSONRenderer``."""
+    return json.dumps(data, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':'))
+
+
+class EventStreamRenderer(BaseRenderer):
+    """Lets content negotiation accept ``text/event-stream`` for stream endpoints."""
+    media_type = 'text/event-stream'
+    format = 'event-stream'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render error payloads as a single SSE error event."""
+        return format_event({'type': 'error', 'data': data}).encode(self.charset)
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Lets content negotiation accept newline-delimited JSON for export endpoints."""
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render error payloads as a single line."""
+        return (dumps(data) + '\n').encode(self.charset)
+
+
+def served_by_asgi(request):
+    """Return True if the request came in through Django's ASGI handler."""
+    return isinstance(getattr(request, 'scope', None), dict)
+
+
+def _batches(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _abatches(rows, size):
+    batch = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _array_items(batch, serialize, first):
+    items = ','.join(dumps(serialize(row)) for row in batch)
+    return items if first else ',' + items
+
+
+def _lines(batch, serialize):
+    return ''.join(dumps(serialize(row)) + '\n' for row in batch)
+
+
+def json_array_stream(rows, serialize, chunk_size):
+    """Yield a JSON array of serialized rows, ``chunk_size`` items per chunk."""
+    yield '['
+    for index, batch in enumerate(_batches(rows, chunk_size)):
+        yield _array_items(batch, serialize, index == 0)
+    yield ']'
+
+
+async def ajson_array_stream(rows, serialize, chunk_size):
+    """Async variant of ``json_array_stream`` over an async iterator such as ``aiterator()``."""
+    yield '['
+    first = True
+    async for batch in _abatches(rows, chunk_size):
+        yield _array_items(batch, serialize, first)
+        first = False
+    yield ']'
+
+
+def ndjson_stream(rows, serialize, chunk_size):
+    """Yield one serialized row per line, ``chunk_size`` lines per chunk."""
+    for batch in _batches(rows, chunk_size):
+        yield _lines(batch, serialize)
+
+
+async def andjson_stream(rows, serialize, chunk_size):
+    """Async variant of ``ndjson_stream``."""
+    async for batch in _abatches(rows, chunk_size):
+        yield _lines(batch, serialize)
+
+
+def format_event(event):
+    """Return an event as a Server-Sent Events frame."""
+    return f"event: {event['type']}\ndata: {json.dumps(event, cls=JSONEncoder)}\n\n"
+
+
+async def board_event_stream(broker, board_id, heartbeat, has_access=None):
+    """Yield SSE frames for a board until the client disconnects or loses access.
+
+    ``has_access`` is an async callable checked on every heartbeat and on
+    ``board.updated`` events (membership changes); once it returns False
+    the stream ends. It also ends after a ``board.deleted`` event.
+    """
+    subscription = broker.subscribe(board_id)
+    try:
+        yield 'retry: 3000\n\n'
+        while True:
+            try:
+                event = await subscription.get(timeout=heartbeat)
+            except asyncio.TimeoutError:
+                if has_access is not None and not await has_access():
+                    return
+                yield ': keepalive\n\n'
+                continue
+            if event['type'] == 'board.updated' and has_access is not None and not await has_access():
+                return
+            yield format_event(event)
+            if event['type'] == 'board.deleted':
+                return
+    finally:
+        subscription.close()
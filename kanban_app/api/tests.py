@@ -1,14 +1,50 @@
+import asyncio
+import json
+import threading
+import time
+from base64 import urlsafe_b64encode
+from datetime import date, datetime, timedelta
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from rest_framework.test import APITestCase
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
 from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.renderers import JSONRenderer
+from rest_framework.throttling import BaseThrottle
 from django.contrib.auth import get_user_model
-from kanban_app.models import Board
+from core.database import database_config
+from kanban_app import changelog, purge, reminders
+from kanban_app.membership import has_board_access
+from kanban_app.models import Board, Change, Task, Comment, ReminderState
+from kanban_app.profiling import QueryBudgetExceeded, QueryProfile
+from kanban_app.pubsub import InProcessBroker, get_broker
+from kanban_app.reminders import MemorySink
+from kanban_app.api.serializers import (
+    BoardMemberRowSerializer, BoardMemberSerializer, CommentSerializer, TaskRowSerializer, TaskSerializer
+)
+from kanban_app.api.async_views import AsyncAssignedToMeTasksView, AsyncBoardDetailView
+from kanban_app.api.streams import board_event_stream
+from kanban_app.api.views import AssignedToMeTasksView, BoardViewSet, StreamingExportView
 
 User = get_user_model()
 
 class BoardAPITestCase(APITestCase):
     """Test basic Board API functionality."""
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
         self.client.force_authenticate(user=self.user)
 
@@ -25,4 +61,1123 @@ class BoardAPITestCase(APITestCase):
         url = reverse('board-list')
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertTrue(len(response.data) >= 1)
+        self.assertTrue(len(response.json()['results']) >= 1)
+
+    def test_list_boards_constant_queries(self):
+        other = User.objects.create_user(username='other', email='other@example.com', password='testpass', fullname='Other User')
+        for i in range(5):
+            board = Board.objects.create(title=f'Board {i}', owner=self.user)
+            board.members.set([self.user, other])
+            Task.objects.create(board=board, title='A', status='to-do', priority='high', created_by=self.user)
+            Task.objects.create(board=board, title='B', status='done', priority='low', created_by=self.user)
+        Board.objects.recount()
+        url = reverse('board-list')
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['results']), 5)
+        for item in response.json()['results']:
+            self.assertEqual(item['member_count'], 2)
+            self.assertEqual(item['ticket_count'], 2)
+            self.assertEqual(item['tasks_to_do_count'], 1)
+            self.assertEqual(item['tasks_high_prio_count'], 1)
+
+    def test_retrieve_board_constant_queries(self):
+        other = User.objects.create_user(username='other', email='other@example.com', password='testpass', fullname='Other User')
+        board = Board.objects.create(title='Board', owner=self.user)
+        board.members.set([self.user, other])
+        url = reverse('board-detail', kwargs={'pk': board.pk})
+        self.client.get(url)
+        for i in range(10):
+            task = Task.objects.create(board=board, title=f'Task {i}', status='to-do', priority='low', assignee=other, reviewer=self.user, created_by=self.user)
+            Comment.objects.create(task=task, author=other, content='Hi')
+            Task.objects.recount_comments()
+            with self.assertNumQueries(4):
+                response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['members']), 2)
+        self.assertEqual(len(response.json()['tasks']), 10)
+        self.assertEqual(response.json()['tasks'][0]['comments_count'], 1)
+        self.assertEqual(response.json()['tasks'][0]['assignee']['email'], 'other@example.com')
+
+
+class CounterTestCase(APITestCase):
+    """Test that the denormalized counters follow the API mutation paths."""
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+        self.other = User.objects.create_user(username='other', email='other@example.com', password='testpass', fullname='Other User')
+        self.client.force_authenticate(user=self.user)
+
+    def test_counters_follow_mutations(self):
+        response = self.client.post(reverse('board-list'), {'title': 'Board', 'members': [self.other.id]}, format='json')
+        self.assertEqual(response.data['member_count'], 2)
+        board = Board.objects.get()
+        task_data = {'board': board.id, 'title': 'Task', 'status': 'to-do', 'priority': 'high'}
+        task_id = self.client.post(reverse('task-list'), task_data, format='json').data['id']
+        self.client.post(reverse('task-list'), {**task_data, 'status': 'done'}, format='json')
+        comment_url = reverse('task-comments', kwargs={'task_id': task_id})
+        comment_id = self.client.post(comment_url, {'content': 'One'}, format='json').data['id']
+        self.client.post(comment_url, {'content': 'Two'}, format='json')
+        self.client.delete(reverse('task-comment-delete', kwargs={'task_id': task_id, 'pk': comment_id}))
+        self.client.patch(reverse('task-detail', kwargs={'pk': task_id}), {'status': 'review', 'priority': 'low'}, format='json')
+        self.client.patch(reverse('board-detail', kwargs={'pk': board.id}), {'members': [self.user.id]}, format='json')
+        board.refresh_from_db()
+        self.assertEqual((board.member_count, board.task_count, board.todo_count, board.high_prio_count), (1, 2, 0, 1))
+        self.assertEqual(Task.objects.get(pk=task_id).comments_count, 1)
+        self.client.delete(reverse('task-detail', kwargs={'pk': task_id}))
+        board.refresh_from_db()
+        self.assertEqual((board.task_count, board.todo_count, board.high_prio_count), (1, 0, 1))
+
+    def test_drifted_counters_do_not_go_negative(self):
+        board = Board.objects.create(title='Board', owner=self.user)
+        board.members.add(self.user)
+        task = Task.objects.create(board=board, title='Task', status='to-do', priority='high', created_by=self.user)
+        comment = Comment.objects.create(task=task, author=self.user, content='Hi')
+        response = self.client.delete(reverse('task-comment-delete', kwargs={'task_id': task.id, 'pk': comment.id}))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.client.delete(reverse('task-detail', kwargs={'pk': task.id})).status_code, status.HTTP_204_NO_CONTENT)
+        board.refresh_from_db()
+        self.assertEqual((board.task_count, board.todo_count, board.high_prio_count), (0, 0, 0))
+
+    def test_recount_command(self):
+        board = Board.objects.create(title='Board', owner=self.user)
+        board.members.set([self.user, self.other])
+        task = Task.objects.create(board=board, title='Task', status='to-do', priority='high', created_by=self.user)
+        Comment.objects.create(task=task, author=self.user, content='Hi')
+        call_command('recount_kanban', stdout=StringIO())
+        board.refresh_from_db()
+        task.refresh_from_db()
+        self.assertEqual((board.member_count, board.task_count, board.todo_count, board.high_prio_count), (2, 1, 1, 1))
+        self.assertEqual(task.comments_count, 1)
+
+    def test_seed_command(self):
+        call_command('seed_kanban', users=10, boards=4, members=3, tasks=50, comments=2, stdout=StringIO())
+        boards = Board.objects.filter(title__startswith='seed board')
+        self.assertEqual(boards.count(), 4)
+        self.assertEqual(Task.objects.filter(board__in=boards).count(), 50)
+        for board in boards:
+            self.assertEqual(board.member_count, board.members.count())
+            self.assertIn(board.owner, board.members.all())
+            self.assertEqual(board.task_count, board.tasks.count())
+        task = Task.objects.order_by('-comments_count').first()
+        self.assertEqual(task.comments_count, task.comments.count())
+
+
+class TaskBulkTestCase(APITestCase):
+    """Test the bulk task endpoint."""
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+        self.other = User.objects.create_user(username='other', email='other@example.com', password='testpass', fullname='Other User')
+        self.client.force_authenticate(user=self.user)
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.foreign_board = Board.objects.create(title='Foreign', owner=self.other)
+        self.url = reverse('task-bulk')
+
+    def create_payload(self, count):
+        return [
+            {'board': self.board.id, 'title': f'Task {i}', 'status': 'to-do', 'priority': 'high', 'assignee_id': self.other.id}
+            for i in range(count)
+        ]
+
+    def test_bulk_operations_report_per_item_results(self):
+        payload = {'create': self.create_payload(2) + [
+            {'board': self.foreign_board.id, 'title': 'X', 'status': 'to-do', 'priority': 'low'},
+            {'board': self.board.id, 'title': 'Y', 'status': 'unknown', 'priority': 'low'},
+        ]}
+        response = self.client.post(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['status'] for item in response.data['create']], [201, 201, 403, 400])
+        first, second = [item['task']['id'] for item in response.data['create'][:2]]
+        payload = {
+            'update': [{'id': first, 'status': 'done', 'reviewer_id': self.user.id}, {'id': 0, 'title': 'Z'}],
+            'delete': [second],
+        }
+        response = self.client.post(self.url, payload, format='json')
+        self.assertEqual([item['status'] for item in response.data['update']], [200, 404])
+        self.assertEqual(response.data['update'][0]['task']['reviewer']['id'], self.user.id)
+        self.assertEqual(response.data['delete'], [{'status': 204, 'id': second}])
+        self.assertEqual(list(Task.objects.values_list('id', 'status')), [(first, 'done')])
+        self.board.refresh_from_db()
+        self.assertEqual((self.board.task_count, self.board.todo_count, self.board.high_prio_count), (1, 0, 1))
+
+    def test_malformed_bodies_are_rejected(self):
+        for payload in ([], {'create': {'title': 'X'}}, {'delete': 3}):
+            response = self.client.post(self.url, payload, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, payload)
+        self.assertFalse(Task.objects.exists())
+
+    def test_bulk_create_uses_constant_queries(self):
+        self.client.post(self.url, {'create': self.create_payload(1)}, format='json')
+        with CaptureQueriesContext(connection) as small:
+            self.client.post(self.url, {'create': self.create_payload(2)}, format='json')
+        with CaptureQueriesContext(connection) as large:
+            self.client.post(self.url, {'create': self.create_payload(50)}, format='json')
+        self.assertEqual(len(small), len(large))
+        self.assertEqual(Task.objects.count(), 53)
+
+
+class ConditionalGetTestCase(APITestCase):
+    """Test ETag/Last-Modified handling for polled endpoints."""
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+        self.client.force_authenticate(user=self.user)
+        self.board = Board.objects.create(title='Board', owner=self.user)
+
+    def create_task(self):
+        data = {'board': self.board.id, 'title': 'Task', 'status': 'to-do', 'priority': 'low', 'assignee_id': self.user.id}
+        return self.client.post(reverse('task-list'), data, format='json').data['id']
+
+    def test_board_detail_returns_304_until_changed(self):
+        url = reverse('board-detail', kwargs={'pk': self.board.id})
+        etag = self.client.get(url)['ETag']
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        task_id = self.create_task()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        self.client.post(reverse('task-comments', kwargs={'task_id': task_id}), {'content': 'Hi'}, format='json')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_assigned_to_me_returns_304_until_changed(self):
+        url = reverse('tasks-assigned-to-me')
+        task_id = self.create_task()
+        etag = self.client.get(url)['ETag']
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.client.patch(reverse('task-detail', kwargs={'pk': task_id}), {'title': 'Renamed'}, format='json')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['results'][0]['title'], 'Renamed')
+
+    def test_task_lists_ignore_if_modified_since(self):
+        url = reverse('tasks-assigned-to-me')
+        self.create_task()
+        removed = self.create_task()
+        response = self.client.get(url)
+        self.assertNotIn('Last-Modified', response)
+        self.client.delete(reverse('task-detail', kwargs={'pk': removed}))
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 60))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['results']), 1)
+
+
+class RecordingBroker(InProcessBroker):
+    """Broker that also keeps every published event for assertions."""
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def publish(self, board_id, event):
+        self.events.append(event)
+        super().publish(board_id, event)
+
+
+@override_settings(KANBAN_EVENT_BACKEND='kanban_app.api.tests.RecordingBroker')
+class BoardEventTestCase(APITestCase):
+    """Test the board change stream."""
+    def setUp(self):
+        cache.clear()
+        get_broker.cache_clear()
+        self.addCleanup(get_broker.cache_clear)
+        self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+        self.client.force_authenticate(user=self.user)
+        self.board = Board.objects.create(title='Board', owner=self.user)
+
+    def test_mutations_publish_events_after_commit(self):
+        data = {'board': self.board.id, 'title': 'Task', 'status': 'to-do', 'priority': 'low'}
+        with self.captureOnCommitCallbacks(execute=True):
+            task_id = self.client.post(reverse('task-list'), data, format='json').data['id']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('task-comments', kwargs={'task_id': task_id}), {'content': 'Hi'}, format='json')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(reverse('task-detail', kwargs={'pk': task_id}))
+        events = get_broker().events
+        self.assertEqual([event['type'] for event in events], ['task.created', 'comment.created', 'task.deleted'])
+        self.assertEqual(events[0]['data']['title'], 'Task')
+        self.assertEqual(events[2]['data'], {'id': task_id})
+
+    def test_stream_delivers_events_from_other_threads(self):
+        async def scenario():
+            broker = InProcessBroker()
+            stream = board_event_stream(broker, self.board.id, heartbeat=0.01)
+            frames = [await anext(stream), await anext(stream)]
+            event = {'type': 'task.deleted', 'board': self.board.id, 'data': {'id': 1}}
+            threading.Thread(target=broker.publish, args=(self.board.id, event)).start()
+            frame = await anext(stream)
+            while frame == ': keepalive\n\n':
+                frame = await anext(stream)
+            frames.append(frame)
+            await stream.aclose()
+            return frames, broker._subscribers
+
+        frames, subscribers = asyncio.run(scenario())
+        self.assertEqual(frames[:2], ['retry: 3000\n\n', ': keepalive\n\n'])
+        self.assertTrue(frames[2].startswith('event: task.deleted\n'))
+        self.assertEqual(dict(subscribers), {})
+
+    def test_stream_requires_board_access(self):
+        other = User.objects.create_user(username='other', email='other@example.com', password='testpass', fullname='Other User')
+        self.client.force_authenticate(user=other)
+        response = self.client.get(reverse('board-events', kwargs={'pk': self.board.id}), HTTP_ACCEPT='text/event-stream')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.get(f'/api/boards/{self.board.id}x/events/', HTTP_ACCEPT='text/event-stream')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_stream_is_refused_under_wsgi(self):
+        response = self.client.get(reverse('board-events', kwargs={'pk': self.board.id}), HTTP_ACCEPT='text/event-stream')
+        self.assertEqual(response.status_code, status.HTTP_501_NOT_IMPLEMENTED)
+        self.assertFalse(response.streaming)
+
+    def test_stream_ends_when_access_is_lost(self):
+        async def scenario():
+            checks = iter([True, False])
+
+            async def has_access():
+                return next(checks)
+
+            broker = InProcessBroker()
+            stream = board_event_stream(broker, self.board.id, heartbeat=0.01, has_access=has_access)
+            frames = [frame async for frame in stream]
+            return frames, broker._subscribers
+
+        frames, subscribers = asyncio.run(scenario())
+        self.assertEqual(frames, ['retry: 3000\n\n', ': keepalive\n\n'])
+        self.assertEqual(dict(subscribers), {})
+
+
+class AlwaysThrottled(BaseThrottle):
+    def allow_request(self, request, view):
+        return False
+
+
+class AsyncReadViewTestCase(APITestCase):
+    """Test that the async read views match the DRF views byte for byte."""
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.board.members.add(self.user)
+        for i in range(3):
+            Task.objects.create(board=self.board, title=f'Task {i}', status='to-do', priority='low', assignee=self.user, reviewer=self.user, created_by=self.user)
+
+    def render_sync(self, view, path, **kwargs):
+        request = APIRequestFactory().get(path)
+        force_authenticate(request, user=self.user)
+        response = view(request, **kwargs)
+        response.render()
+        return response
+
+    def render_async(self, view, path, **kwargs):
+        request = APIRequestFactory().get(path, **kwargs.pop('headers', {}))
+        if 'HTTP_AUTHORIZATION' not in request.META:
+            force_authenticate(request, user=self.user)
+        response = async_to_sync(view)(request, **kwargs)
+        response.render()
+        return response
+
+    def test_async_views_match_sync_views(self):
+        sync_response = self.render_sync(AssignedToMeTasksView.as_view(), '/api/tasks/assigned-to-me/?page_size=2')
+        async_response = self.render_async(AsyncAssignedToMeTasksView.as_view(), '/api/tasks/assigned-to-me/?page_size=2')
+        self.assertEqual(sync_response.content, async_response.content)
+        self.assertEqual(sync_response['ETag'], async_response['ETag'])
+        path = f'/api/boards/{self.board.id}/'
+        sync_response = self.render_sync(BoardViewSet.as_view({'get': 'retrieve'}), path, pk=self.board.id)
+        async_response = self.render_async(AsyncBoardDetailView.as_view(), path, pk=self.board.id)
+        self.assertEqual(sync_response.content, async_response.content)
+
+    def test_async_views_use_drf_authentication_and_permissions(self):
+        view = AsyncAssignedToMeTasksView.as_view()
+        path = '/api/tasks/assigned-to-me/'
+        response = self.render_async(view, path, headers={'HTTP_AUTHORIZATION': 'Token invalid'})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response['WWW-Authenticate'], 'Token')
+        request = APIRequestFactory().get(path)
+        self.assertEqual(async_to_sync(view)(request).status_code, status.HTTP_401_UNAUTHORIZED)
+        token = Token.objects.create(user=self.user)
+        response = self.render_async(view, path, headers={'HTTP_AUTHORIZATION': f'Token {token.key}'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(json.loads(response.content)['results']), 3)
+        with patch.object(AsyncAssignedToMeTasksView, 'throttle_classes', [AlwaysThrottled]):
+            response = self.render_async(view, path)
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+
+class RowSerializerTestCase(APITestCase):
+    """Test that the values()-based serializers render the same JSON as the DRF ones."""
+    def test_task_rows_match_task_serializer(self):
+        user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+        board = Board.objects.create(title='Board', owner=user)
+        board.members.add(user)
+        Task.objects.create(board=board, title='Full', description='Text', status='review', priority='high', assignee=user, reviewer=user, due_date=date(2026, 1, 31), created_by=user)
+        Task.objects.create(board=board, title='Empty', status='to-do', priority='low', created_by=user)
+        Task.objects.recount_comments()
+        renderer = JSONRenderer()
+        expected = renderer.render(TaskSerializer(Task.objects.for_serialization(), many=True).data)
+        self.assertEqual(renderer.render(TaskRowSerializer(TaskRowSerializer.rows(Task.objects.all()), many=True).data), expected)
+        members = BoardMemberSerializer(board.members.all(), many=True).data
+        rows = BoardMemberRowSerializer.rows(board.members.all())
+        self.assertEqual(renderer.render(BoardMemberRowSerializer(rows, many=True).data), renderer.render(members))
+
+
+class StreamingExportTestCase(APITestCase):
+    """Test the streaming JSON and NDJSON export endpoints."""
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+        self.client.force_authenticate(user=self.user)
+        board = Board.objects.create(title='Board', owner=self.user)
+        board.members.add(self.user)
+        Task.objects.bulk_create([
+            Task(board=board, title=f'Task {i}', status='to-do', priority='low', assignee=self.user, created_by=self.user)
+            for i in range(5)
+        ])
+        self.task = Task.objects.first()
+        for i in range(3):
+            Comment.objects.create(task=self.task, author=self.user, content=f'Comment {i}')
+
+    def export(self, url, **kwargs):
+        response = self.client.get(url, **kwargs)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return response, b''.join(response.streaming_content)
+
+    @override_settings(KANBAN_ALLOW_UNPAGINATED=True)
+    def test_task_export_matches_list(self):
+        expected = self.client.get(reverse('tasks-assigned-to-me'), {'paginate': 'false'}).content
+        with patch.object(StreamingExportView, 'chunk_size', 2):
+            _, content = self.export(reverse('tasks-assigned-to-me-export'))
+            response, lines = self.export(reverse('tasks-reviewing-export'), HTTP_ACCEPT='application/x-ndjson')
+        self.assertEqual(content, expected)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson; charset=utf-8')
+        self.assertEqual([json.loads(line) for line in lines.splitlines()], json.loads(expected))
+
+    async def test_asgi_export_streams_from_async_iterator(self):
+        token = await Token.objects.acreate(user=self.user)
+        headers = {'Authorization': f'Token {token.key}'}
+        expected = [task async for task in TaskRowSerializer.rows(Task.objects.order_by('id')).aiterator()]
+        with patch.object(StreamingExportView, 'chunk_size', 2):
+            response = await self.async_client.get(reverse('tasks-assigned-to-me-export'), headers=headers)
+            self.assertTrue(response.is_async)
+            chunks = [chunk async for chunk in response.streaming_content]
+            ndjson = await self.async_client.get(reverse('tasks-assigned-to-me-export'), {'format': 'ndjson'}, headers=headers)
+            lines = b''.join([chunk async for chunk in ndjson.streaming_content]).splitlines()
+        self.assertEqual(len(chunks), 5)
+        self.assertEqual(json.loads(b''.join(chunks)), TaskRowSerializer(expected, many=True).data)
+        self.assertEqual([json.loads(line)['id'] for line in lines], [row['id'] for row in expected])
+
+    def test_comment_export_matches_serializer(self):
+        _, content = self.export(reverse('task-comments-export', kwargs={'task_id': self.task.id}))
+        expected = CommentSerializer(Comment.objects.select_related('author'), many=True).data
+        self.assertEqual(content, JSONRenderer().render(expected))
+        other = User.objects.create_user(username='other', email='other@example.com', password='testpass', fullname='Other User')
+        self.client.force_authenticate(user=other)
+        response = self.client.get(reverse('task-comments-export', kwargs={'task_id': self.task.id}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TaskPaginationTestCase(APITestCase):
+    """Test cursor pagination on the task list endpoints."""
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+        self.client.force_authenticate(user=self.user)
+        board = Board.objects.create(title='Board', owner=self.user)
+        for i in range(5):
+            Task.objects.create(board=board, title=f'Task {i}', status='to-do', priority='low', assignee=self.user, created_by=self.user)
+
+    def test_assigned_to_me_is_cursor_paginated(self):
+        url = reverse('tasks-assigned-to-me')
+        response = self.client.get(url, {'page_size': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        titles = [task['title'] for task in response.json()['results']]
+        while response.json()['next']:
+            response = self.client.get(response.json()['next'])
+            titles += [task['title'] for task in response.json()['results']]
+        self.assertEqual(titles, [f'Task {i}' for i in range(5)])
+
+    def test_cursor_walks_ties_in_both_directions(self):
+        Task.objects.filter(title__in=['Task 1', 'Task 3']).update(priority='high')
+        response = self.client.get(reverse('tasks-assigned-to-me'), {'page_size': 2, 'ordering': '-priority'})
+        pages = [[task['title'] for task in response.json()['results']]]
+        while response.json()['next']:
+            response = self.client.get(response.json()['next'])
+            pages.append([task['title'] for task in response.json()['results']])
+        self.assertEqual(pages, [['Task 3', 'Task 1'], ['Task 4', 'Task 2'], ['Task 0']])
+        backwards = []
+        while response.json()['previous']:
+            response = self.client.get(response.json()['previous'])
+            backwards.append([task['title'] for task in response.json()['results']])
+        self.assertEqual(backwards, pages[-2::-1])
+        self.assertEqual(self.client.get(reverse('tasks-assigned-to-me'), {'cursor': 'bogus'}).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_tampered_cursors_are_rejected(self):
+        def cursor(query):
+            return urlsafe_b64encode(query.encode()).decode()
+
+        task = Task.objects.first()
+        requests = [
+            (reverse('board-list'), {'cursor': 'bogus'}),
+            (reverse('task-list'), {'cursor': cursor('p=abc')}),
+            (reverse('tasks-assigned-to-me'), {'cursor': cursor('p=abc')}),
+            (reverse('tasks-assigned-to-me'), {'cursor': cursor('p=99999999999999999999999')}),
+            (reverse('tasks-assigned-to-me'), {'cursor': cursor('p=soon&p=1'), 'ordering': 'due_date'}),
+            (reverse('task-comments', kwargs={'task_id': task.id}), {'cursor': cursor('p=yesterday&p=1')}),
+        ]
+        for url, params in requests:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, (url, params))
+            self.assertEqual(response.json(), {'detail': 'Invalid cursor'})
+
+    def test_task_lists_have_no_duplicates(self):
+        other = User.objects.create_user(username='other', email='other@example.com', password='testpass', fullname='Other User')
+        board = Board.objects.get()
+        board.members.set([self.user, other])
+        Task.objects.update(reviewer=self.user)
+        for url in (reverse('tasks-reviewing'), reverse('task-list')):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(response.json()['results']), 5)
+
+    def test_unpaginated_opt_in(self):
+        url = reverse('tasks-assigned-to-me')
+        response = self.client.get(url, {'paginate': 'false'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()), 5)
+
+
+class TaskFilterTestCase(APITestCase):
+    """Test server-side filters, ordering and sparse fieldsets on the task lists."""
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+        self.client.force_authenticate(user=self.user)
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        other = Board.objects.create(title='Other', owner=self.user)
+        specs = [
+            (self.board, 'to-do', 'high', date(2020, 1, 1)),
+            (self.board, 'done', 'high', date(2020, 1, 2)),
+            (self.board, 'review', 'low', None),
+            (other, 'to-do', 'medium', date(2999, 1, 1)),
+            (other, 'in-progress', 'high', date(2999, 1, 1)),
+        ]
+        for i, (board, task_status, priority, due_date) in enumerate(specs):
+            Task.objects.create(
+                board=board, title=f'Task {i}', status=task_status, priority=priority,
+                due_date=due_date, assignee=self.user, created_by=self.user
+            )
+
+    def titles(self, url, params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [task['title'] for task in response.json()['results']]
+
+    def test_filters(self):
+        url = reverse('task-list')
+        self.assertEqual(self.titles(url, {'status': 'to-do,review'}), ['Task 0', 'Task 2', 'Task 3'])
+        self.assertEqual(self.titles(url, {'priority': 'high', 'board': self.board.id}), ['Task 0', 'Task 1'])
+        self.assertEqual(self.titles(url, {'due_after': '2020-01-02', 'due_before': '2999-01-01'}), ['Task 1', 'Task 3', 'Task 4'])
+        self.assertEqual(self.titles(url, {'overdue': 'true'}), ['Task 0'])
+        for params in ({'status': 'later'}, {'due_after': 'soon'}, {'board': 'x'}, {'ordering': 'owner'}, {'fields': 'secret'}):
+            self.assertEqual(self.client.get(url, params).status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(TIME_ZONE='Pacific/Auckland')
+    def test_overdue_uses_the_local_date(self):
+        url = reverse('task-list')
+        # Already January 2nd in Auckland
+        with patch('django.utils.timezone.now', return_value=datetime.fromisoformat('2999-01-01T12:00:00+00:00')):
+            self.assertEqual(self.titles(url, {'overdue': 'true'}), ['Task 0', 'Task 3', 'Task 4'])
+
+    def test_ordering_pages_through_ties(self):
+        url = reverse('tasks-assigned-to-me')
+        response = self.client.get(url, {'ordering': '-priority', 'page_size': 2})
+        titles = [task['title'] for task in response.json()['results']]
+        while response.json()['next']:
+            response = self.client.get(response.json()['next'])
+            titles += [task['title'] for task in response.json()['results']]
+        self.assertEqual(titles, ['Task 4', 'Task 1', 'Task 0', 'Task 3', 'Task 2'])
+        self.assertEqual(self.titles(url, {'ordering': 'due_date'}), ['Task 0', 'Task 1', 'Task 3', 'Task 4', 'Task 2'])
+
+    def test_sparse_fields_skip_user_joins(self):
+        url = reverse('tasks-reviewing')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {'fields': 'title,status', 'status': 'done'})
+        self.assertEqual(response.json()['results'], [{'title': 'Task 1', 'status': 'done'}])
+        self.assertNotIn('JOIN "auth_app_user"', queries[-1]['sql'].replace('INNER ', '').replace('LEFT OUTER ', ''))
+        response = self.client.get(url, {'fields': 'id,assignee,due_date', 'status': 'done'})
+        task = Task.objects.get(title='Task 1')
+        self.assertEqual(response.json()['results'], [{
+            'id': task.id, 'assignee': {'id': self.user.id, 'email': self.user.email, 'fullname': self.user.fullname},
+            'due_date': '2020-01-02',
+        }])
+
+    def test_async_view_applies_filters(self):
+        view = AsyncAssignedToMeTasksView.as_view()
+        request = APIRequestFactory().get('/api/tasks/assigned-to-me/', {'status': 'done', 'fields': 'title'})
+        force_authenticate(request, user=self.user)
+        response = async_to_sync(view)(request).render()
+        self.assertEqual(json.loads(response.content)['results'], [{'title': 'Task 1'}])
+        request = APIRequestFactory().get('/api/tasks/assigned-to-me/', {'priority': 'urgent'})
+        force_authenticate(request, user=self.user)
+        response = async_to_sync(view)(request)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class CommentTimelineTestCase(APITestCase):
+    """Test comment access checks, the since cursor and batch creation."""
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+        self.client.force_authenticate(user=self.user)
+        board = Board.objects.create(title='Board', owner=self.user)
+        self.task = Task.objects.create(board=board, title='Task', status='to-do', priority='low', created_by=self.user)
+        self.url = reverse('task-comments', kwargs={'task_id': self.task.id})
+
+    def add_comments(self, count):
+        start = Comment.objects.count()
+        for i in range(start, start + count):
+            author = User.objects.create_user(username=f'author{i}', email=f'author{i}@example.com', password='testpass', fullname=f'Author {i}')
+            Comment.objects.create(task=self.task, author=author, content=f'Comment {i}')
+
+    def test_list_queries_do_not_grow_with_comments(self):
+        self.add_comments(2)
+        self.client.get(self.url)
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(self.url)
+        self.add_comments(10)
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.json()['results']), 12)
+        self.assertEqual(response.json()['results'][11]['author'], 'Author 11')
+        self.assertEqual(len(few), len(many))
+
+    def test_since_returns_newer_comments(self):
+        self.add_comments(3)
+        first = self.client.get(self.url).json()['results'][0]
+        response = self.client.get(self.url, {'since': first['created_at']})
+        self.assertEqual([comment['content'] for comment in response.json()['results']], ['Comment 1', 'Comment 2'])
+        self.assertEqual(self.client.get(self.url, {'since': 'yesterday'}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_create(self):
+        url = reverse('task-comments-bulk', kwargs={'task_id': self.task.id})
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(url, {'comments': [{'content': f'Bulk {i}'} for i in range(30)]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.json()), 30)
+        self.assertEqual(response.json()[0]['author'], 'Test User')
+        self.assertLess(len(queries), 10)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.comments_count, 30)
+        response = self.client.post(url, {'comments': [{'content': 'Valid'}, {'content': ''}]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        for payload in ([{'content': 'Hi'}], {'comments': {'content': 'Hi'}}):
+            self.assertEqual(self.client.post(url, payload, format='json').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Comment.objects.count(), 30)
+
+    def test_non_members_cannot_read_or_write(self):
+        outsider = User.objects.create_user(username='outsider', email='outsider@example.com', password='testpass', fullname='Outsider')
+        self.client.force_authenticate(user=outsider)
+        bulk_url = reverse('task-comments-bulk', kwargs={'task_id': self.task.id})
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.post(self.url, {'content': 'Hi'}, format='json').status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.post(bulk_url, {'comments': [{'content': 'Hi'}]}, format='json').status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(Comment.objects.exists())
+
+    def test_str_does_not_query(self):
+        self.add_comments(1)
+        comment = Comment.objects.get()
+        with self.assertNumQueries(0):
+            str(comment)
+
+
+class UserSearchTestCase(APITestCase):
+    """Test the user prefix typeahead."""
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+        self.client.force_authenticate(user=self.user)
+        self.anna = User.objects.create_user(username='anna', email='Anna.Berg@example.com', password='testpass', fullname='Anna Berg')
+        self.andreas = User.objects.create_user(username='andreas', email='a.keller@example.com', password='testpass', fullname='Andreas Keller')
+        User.objects.create_user(username='bernd', email='bernd@example.com', password='testpass', fullname='Bernd Anders')
+        board = Board.objects.create(title='Board', owner=self.user)
+        board.members.add(self.andreas)
+        self.url = reverse('user-search')
+
+    def emails(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [user['email'] for user in response.json()['results']]
+
+    def make_staff(self):
+        self.user.is_staff = True
+        self.user.save(update_fields=['is_staff'])
+
+    def test_prefix_matches_email_and_fullname(self):
+        self.assertEqual(self.emails(prefix='an'), ['a.keller@example.com'])
+        self.assertEqual(self.client.get(self.url, {'prefix': 'an', 'scope': 'all'}).status_code, status.HTTP_403_FORBIDDEN)
+        self.make_staff()
+        self.assertEqual(self.emails(prefix='an', scope='all'), ['a.keller@example.com', 'Anna.Berg@example.com'])
+        self.assertEqual(self.emails(prefix='ANNA.', scope='all'), ['Anna.Berg@example.com'])
+        self.assertEqual(self.emails(prefix='an', scope='all', limit=1), ['a.keller@example.com'])
+        self.assertEqual(self.client.get(self.url, {'prefix': 'a'}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_non_ascii_prefix(self):
+        olaf = User.objects.create_user(username='olaf', email='ÖLAF@example.com', password='testpass', fullname='Ölaf Öz')
+        Board.objects.get().members.add(olaf)
+        self.assertEqual(self.emails(prefix='Öl'), ['ÖLAF@example.com'])
+        self.assertEqual(self.emails(prefix='ÖLA'), ['ÖLAF@example.com'])
+
+    def test_results_are_cached(self):
+        self.make_staff()
+        self.emails(prefix='be', scope='all')
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.emails(prefix='Be', scope='all'), ['bernd@example.com'])
+        self.assertFalse([query for query in queries if 'auth_app_user' in query['sql']])
+
+    @skipUnless(connection.vendor == 'sqlite', 'Asserts on SQLite EXPLAIN QUERY PLAN output.')
+    def test_prefix_query_uses_indexes(self):
+        self.make_staff()
+        with CaptureQueriesContext(connection) as queries:
+            self.emails(prefix='zz', scope='all')
+        sql = next(query['sql'] for query in queries if 'LIMIT' in query['sql'] and 'auth_app_user' in query['sql'])
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            plan = ' '.join(str(row[-1]) for row in cursor.fetchall())
+        self.assertIn('auth_user_email_prefix_idx', plan)
+        self.assertIn('auth_user_fullname_prefix_idx', plan)
+
+
+class PurgeTestCase(APITestCase):
+    """Test chunked set-based deletion of boards and users."""
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+        self.other = User.objects.create_user(username='other', email='other@example.com', password='testpass', fullname='Other User')
+        self.client.force_authenticate(user=self.user)
+
+    def make_board(self, owner, tasks, comments=2):
+        board = Board.objects.create(title='Board', owner=owner)
+        board.members.set([self.user, self.other])
+        created = Task.objects.bulk_create([
+            Task(board=board, title=f'Task {i}', status='to-do', priority='high', created_by=owner) for i in range(tasks)
+        ])
+        Comment.objects.bulk_create([Comment(task=task, author=self.other, content='Hi') for task in created for _ in range(comments)])
+        return board
+
+    def test_board_delete_does_not_load_rows(self):
+        counts = []
+        for tasks in (3, 30):
+            board = self.make_board(self.user, tasks)
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.delete(reverse('board-detail', kwargs={'pk': board.id}))
+            self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+        self.assertFalse(Board.objects.exists() or Task.objects.exists() or Comment.objects.exists())
+        self.assertFalse(Board.members.through.objects.exists())
+        self.assertFalse(has_board_access(self.other, board.id))
+
+    def test_chunks_and_late_comments(self):
+        board = self.make_board(self.user, 5)
+        Comment.objects.create(task=Task.objects.first(), author=self.user, content='Late')
+        deleted = purge.purge_board(board.id, chunk_size=2)
+        self.assertEqual(deleted, {'comments': 11, 'tasks': 5, 'memberships': 2, 'boards': 1})
+
+    @override_settings(KANBAN_PURGE_IN_BACKGROUND=True)
+    def test_background_purge_hides_board_first(self):
+        board = self.make_board(self.user, 3)
+        self.assertTrue(has_board_access(self.other, board.id))
+        with patch('kanban_app.purge._submit') as submit, self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(reverse('board-detail', kwargs={'pk': board.id}))
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        submit.assert_called_once_with(purge.purge_board, board.id)
+        self.assertFalse(has_board_access(self.other, board.id))
+        self.assertEqual(self.client.get(reverse('board-detail', kwargs={'pk': board.id})).status_code, status.HTTP_404_NOT_FOUND)
+        call_command('purge_kanban', pending=True, stdout=StringIO())
+        self.assertFalse(Board.objects.exists() or Task.objects.exists())
+
+    @override_settings(KANBAN_PURGE_IN_BACKGROUND=True)
+    def test_interrupted_purge_is_resumed_by_pending_run(self):
+        board = self.make_board(self.user, 4)
+        with patch('kanban_app.purge._submit'), self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(reverse('board-detail', kwargs={'pk': board.id}))
+        delete = purge._delete
+        calls = []
+
+        def crash_on_third_chunk(queryset):
+            calls.append(queryset)
+            if len(calls) == 3:
+                raise RuntimeError('worker stopped')
+            return delete(queryset)
+
+        with patch('kanban_app.purge._delete', crash_on_third_chunk), self.assertRaises(RuntimeError):
+            purge.purge_board(board.id, chunk_size=2)
+        self.assertEqual((Comment.objects.count(), Task.objects.count()), (4, 4))
+        self.assertEqual(self.client.get(reverse('board-detail', kwargs={'pk': board.id})).status_code, status.HTTP_404_NOT_FOUND)
+        out = StringIO()
+        call_command('purge_kanban', pending=True, stdout=out)
+        self.assertIn(f'Board {board.id}: deleted 4 comments, 4 tasks, 2 memberships, 1 boards', out.getvalue())
+        self.assertFalse(Board.objects.exists() or Task.objects.exists() or Comment.objects.exists())
+
+    def test_purge_user(self):
+        self.make_board(self.other, 4)
+        board = self.make_board(self.user, 2)
+        own_task = Task.objects.create(board=board, title='By other', status='to-do', priority='low', created_by=self.other)
+        Task.objects.filter(board=board).update(assignee=self.other)
+        Board.objects.recount()
+        Task.objects.recount_comments()
+        purge.purge_user(self.other.id, chunk_size=3)
+        self.assertFalse(User.objects.filter(pk=self.other.pk).exists())
+        self.assertEqual(list(Board.objects.all()), [board])
+        self.assertFalse(Task.objects.filter(pk=own_task.pk).exists())
+        board.refresh_from_db()
+        self.assertEqual((board.task_count, board.member_count), (2, 1))
+        self.assertEqual(list(Task.objects.values_list('comments_count', 'assignee')), [(0, None), (0, None)])
+
+
+class DueReminderTestCase(APITestCase):
+    """Test the due-date reminder ticks and their high-water marks."""
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+        self.other = User.objects.create_user(username='other', email='other@example.com', password='testpass', fullname='Other User')
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.today = timezone.localdate()
+        specs = [
+            ('Overdue', self.today - timedelta(days=3), 'to-do', self.user),
+            ('Tomorrow', self.today + timedelta(days=1), 'in-progress', self.user),
+            ('Other', self.today, 'review', self.other),
+            ('Done', self.today, 'done', self.user),
+            ('Later', self.today + timedelta(days=5), 'to-do', self.user),
+            ('Unassigned', self.today, 'to-do', None),
+        ]
+        self.tasks = {
+            title: Task.objects.create(board=self.board, title=title, status=task_status, priority='low', due_date=due_date, assignee=assignee, created_by=self.user)
+            for title, due_date, task_status, assignee in specs
+        }
+        MemorySink.sent = []
+
+    def tick(self, now=None):
+        return reminders.run_tick(hours=36, sink=MemorySink(), now=now)
+
+    def sent_titles(self):
+        return {reminder['user']['email']: [task['title'] for task in reminder['tasks']] for reminder in MemorySink.sent}
+
+    def test_batches_per_assignee_once(self):
+        self.assertEqual(self.tick(), 3)
+        self.assertEqual(self.sent_titles(), {'testuser@example.com': ['Overdue', 'Tomorrow'], 'other@example.com': ['Other']})
+        self.assertTrue(MemorySink.sent[0]['tasks'][0]['overdue'])
+        MemorySink.sent = []
+        self.assertEqual(self.tick(), 0)
+        self.assertEqual(MemorySink.sent, [])
+
+    def test_later_ticks_pick_up_new_rows_only(self):
+        self.tick()
+        MemorySink.sent = []
+        later = self.tasks['Later']
+        unassigned = self.tasks['Unassigned']
+        unassigned.assignee = self.other
+        unassigned.save()
+        self.tasks['Overdue'].save(update_fields=['status', 'updated_at'])
+        self.assertEqual(self.tick(now=timezone.now() + timedelta(days=4)), 2)
+        self.assertEqual(self.sent_titles(), {'testuser@example.com': ['Later'], 'other@example.com': ['Unassigned']})
+        later.due_date = self.today + timedelta(days=8)
+        later.save()
+        MemorySink.sent = []
+        self.assertEqual(self.tick(now=timezone.now() + timedelta(days=7)), 1)
+        self.assertEqual(self.sent_titles(), {'testuser@example.com': ['Later']})
+
+    def test_reassigned_task_reminds_new_assignee(self):
+        self.tick()
+        MemorySink.sent = []
+        task = self.tasks['Tomorrow']
+        task.assignee = self.other
+        task.save(update_fields=['assignee', 'updated_at'])
+        self.assertEqual(self.tick(), 1)
+        self.assertEqual(self.sent_titles(), {'other@example.com': ['Tomorrow']})
+        MemorySink.sent = []
+        self.assertEqual(self.tick(), 0)
+
+    def test_file_sink_and_command(self):
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'reminders.ndjson'
+            with override_settings(KANBAN_REMINDER_SINK='kanban_app.reminders.FileSink', KANBAN_REMINDER_FILE=path):
+                reminders.get_sink.cache_clear()
+                try:
+                    call_command('send_due_reminders', hours=36, stdout=StringIO())
+                finally:
+                    reminders.get_sink.cache_clear()
+            lines = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+        self.assertEqual(sorted(line['user']['email'] for line in lines), ['other@example.com', 'testuser@example.com'])
+
+
+@override_settings(KANBAN_SYNC_SETTLE_SECONDS=0)
+class SyncTestCase(APITestCase):
+    """Test the change log and the /api/sync/ delta endpoint."""
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+        self.other = User.objects.create_user(username='other', email='other@example.com', password='testpass', fullname='Other User')
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(reverse('board-list'), {'title': 'Board', 'members': []}, format='json')
+        self.board = Board.objects.get(pk=response.data['id'])
+
+    def sync(self, since, user=None):
+        self.client.force_authenticate(user=user or self.user)
+        response = self.client.get(reverse('sync'), {'since': since})
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def create_task(self, title):
+        data = {'board': self.board.id, 'title': title, 'status': 'to-do', 'priority': 'low'}
+        return self.client.post(reverse('task-list'), data, format='json').data['id']
+
+    def test_changes_are_compacted_per_object(self):
+        Task.objects.bulk_create([
+            Task(board=self.board, title=f'Old {i}', status='done', priority='low', created_by=self.user) for i in range(20)
+        ])
+        revision = self.sync(0)['revision']
+        kept, dropped = self.create_task('Kept'), self.create_task('Dropped')
+        for title in ('Renamed', 'Renamed again'):
+            self.client.patch(reverse('task-detail', kwargs={'pk': kept}), {'title': title}, format='json')
+        self.client.delete(reverse('task-detail', kwargs={'pk': dropped}))
+        self.client.post(reverse('task-comments', kwargs={'task_id': kept}), {'content': 'Hi'}, format='json')
+        with CaptureQueriesContext(connection) as queries:
+            data = self.sync(revision)
+        self.assertLessEqual(len(queries), 7)
+        self.assertFalse(data['reset'])
+        self.assertEqual([(task['id'], task['title'], task['comments_count']) for task in data['tasks']['upserted']], [(kept, 'Renamed again', 1)])
+        self.assertEqual(data['tasks']['deleted'], [dropped])
+        self.assertEqual([comment['task'] for comment in data['comments']['upserted']], [kept])
+        self.assertEqual([(board['id'], board['ticket_count']) for board in data['boards']['upserted']], [(self.board.id, 1)])
+        self.assertEqual(self.sync(data['revision'])['tasks'], {'upserted': [], 'deleted': []})
+
+    def test_membership_changes_and_visibility(self):
+        revision = self.sync(0, self.other)['revision']
+        self.create_task('Private')
+        self.assertEqual(self.sync(revision, self.other)['tasks']['upserted'], [])
+        self.client.patch(reverse('board-detail', kwargs={'pk': self.board.id}), {'members': [self.other.id]}, format='json')
+        joined = self.sync(revision, self.other)
+        self.assertEqual([board['id'] for board in joined['boards']['upserted']], [self.board.id])
+        self.assertEqual([task['title'] for task in joined['tasks']['upserted']], ['Private'])
+        self.client.patch(reverse('board-detail', kwargs={'pk': self.board.id}), {'members': []}, format='json')
+        left = self.sync(joined['revision'], self.other)
+        self.assertEqual((left['boards']['deleted'], left['tasks']['upserted']), ([self.board.id], []))
+        revision = self.sync(0)['revision']
+        self.client.delete(reverse('board-detail', kwargs={'pk': self.board.id}))
+        self.assertEqual(self.sync(revision)['boards'], {'upserted': [], 'deleted': [self.board.id]})
+
+    def test_membership_changes_outside_the_api_are_logged(self):
+        revision = self.sync(0, self.other)['revision']
+        self.other.boards.add(self.board)
+        self.assertEqual([board['id'] for board in self.sync(revision, self.other)['boards']['upserted']], [self.board.id])
+        revision = self.sync(0, self.other)['revision']
+        self.board.members.clear()
+        self.assertEqual(self.sync(revision, self.other)['boards']['deleted'], [self.board.id])
+        self.assertEqual(Change.objects.filter(kind='membership', object_id=self.other.id).count(), 2)
+
+    def test_pruned_log_and_unsettled_revisions(self):
+        self.create_task('Task')
+        Change.objects.update(created_at=timezone.now() - timedelta(days=40))
+        self.create_task('New')
+        out = StringIO()
+        call_command('prune_changelog', days=30, stdout=out)
+        self.assertIn('Deleted 3 change(s).', out.getvalue())
+        self.assertEqual(self.sync(0), {'revision': changelog.current_revision(), 'reset': True})
+        self.assertEqual(self.sync(10 ** 12), {'revision': changelog.current_revision(), 'reset': True})
+        self.assertEqual(self.client.get(reverse('sync'), {'since': 'x'}).status_code, status.HTTP_400_BAD_REQUEST)
+        since = changelog.current_revision() - 1
+        with override_settings(KANBAN_SYNC_SETTLE_SECONDS=60):
+            data = self.sync(since)
+        self.assertEqual((data['revision'], [task['title'] for task in data['tasks']['upserted']]), (since, ['New']))
+
+
+class BoardMembershipCacheTestCase(APITestCase):
+    """Test the cached board access sets used by the permission classes."""
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username='owner', email='owner@example.com', password='testpass', fullname='Owner')
+        self.member = User.objects.create_user(username='member', email='member@example.com', password='testpass', fullname='Member')
+        self.board = Board.objects.create(title='Board', owner=self.owner)
+
+    def test_access_is_cached_and_invalidated(self):
+        self.assertTrue(has_board_access(self.owner, self.board.id))
+        self.assertFalse(has_board_access(self.member, self.board.id))
+        with self.assertNumQueries(0):
+            self.assertFalse(has_board_access(self.member, self.board.id))
+        self.board.members.add(self.member)
+        self.assertTrue(has_board_access(self.member, self.board.id))
+        self.board.members.clear()
+        self.assertFalse(has_board_access(self.member, self.board.id))
+        self.member.boards.add(self.board)
+        self.assertTrue(has_board_access(self.member, self.board.id))
+        board_id = self.board.id
+        self.board.delete()
+        self.assertFalse(has_board_access(self.owner, board_id))
+        self.assertFalse(has_board_access(self.member, board_id))
+
+
+    def test_owner_change_invalidates_previous_owner(self):
+        self.assertTrue(has_board_access(self.owner, self.board.id))
+        self.assertFalse(has_board_access(self.member, self.board.id))
+        self.board.owner = self.member
+        self.board.save()
+        self.assertFalse(has_board_access(self.owner, self.board.id))
+        self.assertTrue(has_board_access(self.member, self.board.id))
+        with self.assertNumQueries(1):
+            self.board.save(update_fields=['title'])
+
+@skipUnless(connection.vendor == 'sqlite', 'Asserts on SQLite EXPLAIN QUERY PLAN output.')
+class IndexUsageTestCase(APITestCase):
+    """Test that the main query of each endpoint is served by an index."""
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.task = Task.objects.create(board=self.board, title='Task', status='to-do', priority='high', assignee=self.user, created_by=self.user)
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(f'USING INDEX {index_name}', plan.replace('COVERING INDEX', 'INDEX'))
+
+    def test_task_endpoints_use_indexes(self):
+        self.assertUsesIndex(Task.objects.filter(assignee=self.user).for_serialization(), 'kanban_task_assignee_id_idx')
+        self.assertUsesIndex(Task.objects.related_to(self.user), 'kanban_task_reviewer_id_idx')
+        self.assertUsesIndex(Task.objects.accessible_to(self.user), 'kanban_task_board_')
+
+    def test_board_counter_queries_use_indexes(self):
+        self.assertUsesIndex(Task.objects.filter(board=self.board, status='to-do'), 'kanban_task_board_status_idx')
+        self.assertUsesIndex(Task.objects.filter(board=self.board, priority='high'), 'kanban_task_board_prio_idx')
+
+    def test_due_date_filter_uses_index(self):
+        self.assertUsesIndex(Task.objects.filter(due_date__lt=date(2026, 1, 1)).order_by(), 'kanban_task_due_status_idx')
+
+    def test_reminder_scans_use_indexes(self):
+        # Many long-past due dates, few recent changes, as in a live table
+        Task.objects.bulk_create([
+            Task(board=self.board, title='Old', status='to-do', priority='low', due_date=date(2025, 1, 1) + timedelta(days=i % 300), created_by=self.user)
+            for i in range(500)
+        ])
+        Task.objects.update(updated_at=timezone.now() - timedelta(days=30))
+        connection.cursor().execute('ANALYZE')
+        state = ReminderState(due_horizon=date(2026, 1, 1), updated_since=timezone.now() - timedelta(minutes=5))
+        with CaptureQueriesContext(connection) as queries:
+            reminders.candidates(state, date(2026, 1, 2))
+        plans = [connection.cursor().execute(f"EXPLAIN QUERY PLAN {query['sql']}").fetchall() for query in queries]
+        plans = [' '.join(str(row[-1]) for row in plan) for plan in plans]
+        self.assertIn('kanban_task_due_status_idx', plans[0])
+        self.assertIn('kanban_task_open_due_upd_idx', plans[1])
+
+    def test_comment_list_uses_index(self):
+        self.assertUsesIndex(Comment.objects.filter(task=self.task), 'kanban_comment_task_date_idx')
+
+
+@override_settings(KANBAN_QUERY_PROFILING=True, KANBAN_QUERY_BUDGET_ACTION='raise')
+class QueryProfilingTestCase(APITestCase):
+    """Test the query profiling middleware and keep the main endpoints within their budgets."""
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+        other = User.objects.create_user(username='other', email='other@example.com', password='testpass', fullname='Other User')
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.board.members.set([self.user, other])
+        for i in range(10):
+            task = Task.objects.create(board=self.board, title=f'Task {i}', status='to-do', priority='low', assignee=other, reviewer=self.user, created_by=self.user)
+            Comment.objects.create(task=task, author=other, content='Hi')
+        self.task = task
+        token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+
+    def test_endpoints_stay_within_query_budget(self):
+        urls = [
+            reverse('board-list'),
+            reverse('board-detail', kwargs={'pk': self.board.pk}),
+            reverse('task-list'),
+            reverse('task-detail', kwargs={'pk': self.task.pk}),
+            reverse('tasks-assigned-to-me'),
+            reverse('tasks-reviewing'),
+            reverse('task-comments', kwargs={'task_id': self.task.pk}),
+            reverse('search') + '?q=task',
+            reverse('sync') + '?since=0',
+        ]
+        for url in urls:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK, url)
+            self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="\d+ queries", app;dur=[\d.]+$')
+
+    def test_budget_and_repeated_queries_are_reported(self):
+        with override_settings(KANBAN_QUERY_BUDGETS={'task-list': 1}):
+            with self.assertRaises(QueryBudgetExceeded):
+                self.client.get(reverse('task-list'))
+        profile = QueryProfile()
+        with connection.execute_wrapper(profile):
+            TaskSerializer(Task.objects.all(), many=True).data
+        self.assertEqual(profile.count, 21)
+        self.assertEqual(list(profile.repeated(5).values()), [20])
+
+
+class DatabaseConfigTestCase(SimpleTestCase):
+    """Test the environment-driven database settings."""
+    def test_sqlite_defaults_to_wal_and_immediate_transactions(self):
+        config = database_config({}, Path('/srv/kanban'))
+        self.assertEqual(config['NAME'], Path('/srv/kanban/db.sqlite3'))
+        self.assertEqual(config['OPTIONS']['transaction_mode'], 'IMMEDIATE')
+        self.assertEqual(config['OPTIONS']['timeout'], 5)
+        self.assertIn('journal_mode=wal', config['OPTIONS']['init_command'])
+
+    def test_postgresql_pool_disables_persistent_connections(self):
+        environ = {'DATABASE_ENGINE': 'postgresql', 'DATABASE_CONN_MAX_AGE': '300'}
+        self.assertEqual(database_config(environ, Path('.'))['CONN_MAX_AGE'], 300)
+        config = database_config({**environ, 'DATABASE_POOL': '1', 'DATABASE_POOL_MAX_SIZE': '20'}, Path('.'))
+        self.assertEqual(config['CONN_MAX_AGE'], 0)
+        self.assertEqual(config['OPTIONS']['pool'], {'min_size': 2, 'max_size': 20, 'timeout': 10})
+        self.assertTrue(config['CONN_HEALTH_CHECKS'])
+        with self.assertRaises(ValueError):
+            database_config({'DATABASE_ENGINE': 'oracle'}, Path('.'))
+
+
+class SearchTestCase(APITestCase):
+    """Test the full-text search endpoint and its trigger-maintained index."""
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', email='testuser@example.com', password='testpass', fullname='Test User')
+        self.client.force_authenticate(user=self.user)
+        self.board = Board.objects.create(title='Board', owner=self.user)
+        self.task = Task.objects.create(board=self.board, title='Deploy release', description='Roll out the new build', status='to-do', priority='high', created_by=self.user)
+        Comment.objects.create(task=self.task, author=self.user, content='The deployment failed twice')
+        other = User.objects.create_user(username='other', email='other@example.com', password='testpass', fullname='Other User')
+        hidden = Board.objects.create(title='Hidden', owner=other)
+        Task.objects.create(board=hidden, title='Deploy secret', status='to-do', priority='low', created_by=other)
+
+    def search(self, **params):
+        response = self.client.get(reverse('search'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def test_search_ranks_and_scopes_hits(self):
+        results = self.search(q='deploy')['results']
+        self.assertEqual([(hit['type'], hit['task']) for hit in results], [('task', self.task.id), ('comment', self.task.id)])
+        self.assertEqual(results[1]['title'], 'Deploy release')
+        self.assertIn('<mark>', results[1]['snippet'])
+        self.assertEqual(len(self.search(q='deploy', type='comment')['results']), 1)
+        page = self.search(q='deploy', page_size=1)
+        self.assertEqual(len(page['results']), 1)
+        self.assertIsNotNone(page['next'])
+        self.assertEqual(self.client.get(reverse('search'), {'q': '"*'}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_index_follows_writes(self):
+        self.client.patch(reverse('task-detail', kwargs={'pk': self.task.pk}), {'title': 'Ship version'}, format='json')
+        self.assertEqual([hit['type'] for hit in self.search(q='ship')['results']], ['task'])
+        self.client.post(reverse('task-bulk'), {'create': [
+            {'board': self.board.id, 'title': 'Bulk ship', 'status': 'to-do', 'priority': 'low'}
+        ]}, format='json')
+        self.assertEqual(len(self.search(q='ship')['results']), 2)
+        self.task.delete()
+        self.assertEqual([hit['title'] for hit in self.search(q='ship deploy')['results']], [])
+        self.assertEqual([hit['title'] for hit in self.search(q='ship')['results']], ['Bulk ship'])
+
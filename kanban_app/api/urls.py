@@ -1,18 +1,51 @@
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
+from .async_views import (
+    AsyncAssignedToMeTasksView, AsyncBoardDetailView, AsyncBoardListView,
+    AsyncCommentListView, AsyncReviewingTasksView, split_by_method
+)
 from .views import (
     BoardViewSet, TaskViewSet, AssignedToMeTasksView, ReviewingTasksView,
-    CommentListCreateView, CommentDeleteView
+    CommentListCreateView, CommentBulkCreateView, CommentDeleteView, AssignedToMeTasksExportView,
+    ReviewingTasksExportView, CommentExportView, SearchView, SyncView, UserSearchView
 )
 
 router = DefaultRouter()
 router.register(r'boards', BoardViewSet, basename='board')
 router.register(r'tasks', TaskViewSet, basename='task')
 
-urlpatterns = [
-    path('tasks/assigned-to-me/', AssignedToMeTasksView.as_view(), name='tasks-assigned-to-me'),
-    path('tasks/reviewing/', ReviewingTasksView.as_view(), name='tasks-reviewing'),
-    path('tasks/<int:task_id>/comments/', CommentListCreateView.as_view(), name='task-comments'),
+if getattr(settings, 'KANBAN_ASYNC_READS', False):
+    board_list = BoardViewSet.as_view({'get': 'list', 'post': 'create'})
+    board_detail = BoardViewSet.as_view({
+        'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'
+    })
+    read_urlpatterns = [
+        path('boards/', split_by_method(AsyncBoardListView.as_view(), board_list), name='board-list'),
+        path('boards/<int:pk>/', split_by_method(AsyncBoardDetailView.as_view(), board_detail), name='board-detail'),
+        path('tasks/assigned-to-me/', AsyncAssignedToMeTasksView.as_view(), name='tasks-assigned-to-me'),
+        path('tasks/reviewing/', AsyncReviewingTasksView.as_view(), name='tasks-reviewing'),
+        path(
+            'tasks/<int:task_id>/comments/',
+            split_by_method(AsyncCommentListView.as_view(), CommentListCreateView.as_view()),
+            name='task-comments'
+        ),
+    ]
+else:
+    read_urlpatterns = [
+        path('tasks/assigned-to-me/', AssignedToMeTasksView.as_view(), name='tasks-assigned-to-me'),
+        path('tasks/reviewing/', ReviewingTasksView.as_view(), name='tasks-reviewing'),
+        path('tasks/<int:task_id>/comments/', CommentListCreateView.as_view(), name='task-comments'),
+    ]
+
+urlpatterns = read_urlpatterns + [
+    path('search/', SearchView.as_view(), name='search'),
+    path('users/search/', UserSearchView.as_view(), name='user-search'),
+    path('sync/', SyncView.as_view(), name='sync'),
+    path('tasks/assigned-to-me/export/', AssignedToMeTasksExportView.as_view(), name='tasks-assigned-to-me-export'),
+    path('tasks/reviewing/export/', ReviewingTasksExportView.as_view(), name='tasks-reviewing-export'),
+    path('tasks/<int:task_id>/comments/bulk/', CommentBulkCreateView.as_view(), name='task-comments-bulk'),
+    path('tasks/<int:task_id>/comments/export/', CommentExportView.as_view(), name='task-comments-export'),
     path('tasks/<int:task_id>/comments/<int:pk>/', CommentDeleteView.as_view(), name='task-comment-delete'),
     path('', include(router.urls)),
 ]
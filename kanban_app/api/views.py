@@ -1,15 +1,40 @@
-from django.db.models import Q
+from abc import ABCMeta, abstractmethod
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max, Q
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 
 from rest_framework import generics, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from rest_framework.views import APIView
 
+from auth_app.user_search import search_users
+from kanban_app import changelog, counters, purge
+from kanban_app.membership import get_accessible_board_ids, has_board_access
 from kanban_app.models import Board, Task, Comment
+from kanban_app.pubsub import get_broker, publish_board_event
+from kanban_app.search import DOC_TYPES, get_search_backend, search
 from .serializers import (
-    BoardSerializer, BoardDetailSerializer, TaskSerializer, CommentSerializer
+    BoardSerializer, BoardDetailSerializer, BoardMemberRowSerializer, BulkTaskRequestSerializer,
+    TaskSerializer, TaskRowSerializer, CommentSerializer, CommentRowSerializer
 )
+from .bulk import TaskBulkOperation
+from .conditional import make_etag, not_modified, set_validators
+from .filters import filter_comments, task_rows
+from .pagination import CommentCursorPagination
 from .permissions import IsTaskBoardMember, IsCommentAuthor
+from .streams import (
+    EventStreamRenderer, NDJSONRenderer, ajson_array_stream, andjson_stream, board_event_stream, json_array_stream,
+    ndjson_stream, served_by_asgi
+)
 from django.contrib.auth import get_user_model
 
 
@@ -24,29 +49,39 @@ class BoardViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return boards where the user is owner or member."""
-        user = self.request.user
-        qs = Board.objects.filter(Q(members=user) | Q(owner=user)).distinct()
-        return qs
+        return Board.objects.accessible_to(self.request.user)
 
     def list(self, request, *args, **kwargs):
         """List all boards for the authenticated user."""
+        queryset = self.get_queryset()
+        # Outside the try, so an invalid cursor keeps its 404
+        page = self.paginate_queryset(queryset)
         try:
-            queryset = self.get_queryset()
+            if page is not None:
+                serializer = self.get_serializer(page, many=True)
+                return self.get_paginated_response(serializer.data)
             serializer = self.get_serializer(queryset, many=True)
             return Response(serializer.data)
         except Exception as e:
             return Response({'detail': f'Internal Server Error: {e}'}, status=500)
 
     def retrieve(self, request, *args, **kwargs):
-        """Retrieve a specific board if the user has access."""
-        try:
-            board = self.get_queryset().get(pk=kwargs['pk'])
-        except Board.DoesNotExist:
+        """Retrieve a specific board if the user has access.
+
+        The board revision is checked first, so polls with a matching
+        ``If-None-Match`` or ``If-Modified-Since`` get a 304 without loading
+        members and tasks.
+        """
+        stamp = Board.objects.accessible_to(request.user).filter(pk=kwargs['pk']).values('id', 'revision', 'updated_at').first()
+        if stamp is None:
             return Response({'detail': 'Board not found.'}, status=status.HTTP_404_NOT_FOUND)
-        if not (request.user == board.owner or request.user in board.members.all()):
-            return Response({'detail': 'Not authorized.'}, status=status.HTTP_403_FORBIDDEN)
+        etag = make_etag('board', stamp['id'], stamp['revision'])
+        response = not_modified(request, etag, stamp['updated_at'])
+        if response is not None:
+            return response
+        board = self.get_queryset().get(pk=stamp['id'])
         serializer = BoardDetailSerializer(board)
-        return Response(serializer.data)
+        return set_validators(Response(serializer.data), etag, stamp['updated_at'])
 
     def get_serializer_class(self):
         """Return the appropriate serializer class for detail or list."""
@@ -60,12 +95,15 @@ class BoardViewSet(viewsets.ModelViewSet):
         data['owner'] = request.user.id
         serializer = self.get_serializer(data=data)
         serializer.is_valid(raise_exception=True)
-        board = Board.objects.create(title=data['title'], owner=request.user)
         member_ids = data.get('members', [])
         if request.user.id not in member_ids:
             member_ids.append(request.user.id)
-        board.members.set(User.objects.filter(id__in=member_ids))
-        board.save()
+        with transaction.atomic():
+            board = Board.objects.create(title=data['title'], owner=request.user)
+            board.members.set(User.objects.filter(id__in=member_ids))
+            counters.board_updated(board, members_changed=True)
+            changelog.record('board', [(board.id, board.id)])
+        board.refresh_from_db()
         out_serializer = self.get_serializer(board)
         return Response(out_serializer.data, status=status.HTTP_201_CREATED)
 
@@ -75,109 +113,267 @@ class BoardViewSet(viewsets.ModelViewSet):
         self.check_object_permissions(request, board)
         title = request.data.get('title', board.title)
         members = request.data.get('members', None)
-        if members is not None:
-            board.members.set(User.objects.filter(id__in=members))
-        board.title = title
-        board.save()
-        serializer = BoardDetailSerializer(board)
+        with transaction.atomic():
+            if members is not None:
+                board.members.set(User.objects.filter(id__in=members))
+            board.title = title
+            board.save(update_fields=['title'])
+            counters.board_updated(board, members_changed=members is not None)
+            changelog.record('board', [(board.id, board.id)])
+        board = self.get_queryset().get(pk=board.pk)
+        member_rows = list(BoardMemberRowSerializer.rows(board.members.all()))
+        publish_board_event(board.id, 'board.updated', {
+            'title': board.title,
+            'members': BoardMemberRowSerializer(member_rows, many=True).data,
+        })
+        serializer = BoardDetailSerializer(board, context={'member_rows': member_rows})
         return Response(serializer.data)
 
     def destroy(self, request, *args, **kwargs):
-        """Delete a board if the user is the owner."""
+        """Delete a board if the user is the owner.
+
+        Tasks and comments are removed with chunked set-based DELETEs; with
+        ``KANBAN_PURGE_IN_BACKGROUND`` the board is hidden at once and purged
+        by a background worker after a 202 response.
+        """
         board = self.get_object()
-        if board.owner != request.user:
+        if board.owner_id != request.user.id:
             return Response({'detail': 'Only the owner can delete this board.'}, status=status.HTTP_403_FORBIDDEN)
-        board.delete()
+        board_id = board.id
+        if getattr(settings, 'KANBAN_PURGE_IN_BACKGROUND', False):
+            purge.schedule_board_purge(board_id)
+            publish_board_event(board_id, 'board.deleted', {'id': board_id})
+            return Response({'detail': 'Board deletion scheduled.'}, status=status.HTTP_202_ACCEPTED)
+        purge.purge_board(board_id)
+        publish_board_event(board_id, 'board.deleted', {'id': board_id})
         return Response(status=status.HTTP_204_NO_CONTENT)
 
-class TaskViewSet(viewsets.ModelViewSet):
+    @action(detail=True, methods=['get'], renderer_classes=[EventStreamRenderer])
+    def events(self, request, pk=None):
+        """Stream task, comment and membership changes of a board as Server-Sent Events.
+
+        Requires an ASGI deployment (501 under WSGI, where the endless stream
+        would be buffered and hold a worker); the stream stays open until the
+        client disconnects or loses access to the board.
+        """
+        board_id = int(pk) if pk.isdigit() else None
+        if board_id is None or not has_board_access(request.user, board_id):
+            return Response({'detail': 'Board not found.'}, status=status.HTTP_404_NOT_FOUND)
+        if not served_by_asgi(request):
+            return Response({'detail': 'Event streams need an ASGI server.'}, status=status.HTTP_501_NOT_IMPLEMENTED)
+        heartbeat = getattr(settings, 'KANBAN_EVENT_HEARTBEAT', 15)
+        user = request.user
+        has_access = sync_to_async(lambda: has_board_access(user, board_id))
+        response = StreamingHttpResponse(
+            board_event_stream(get_broker(), board_id, heartbeat, has_access),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+
+class TaskRowListMixin:
+    """List tasks as rows with the filters, ``?ordering=`` and ``?fields=`` of ``filters.task_rows``."""
+    fields = None
+    cursor_ordering = None
+
+    def task_rows(self, queryset):
+        rows, self.fields, self.cursor_ordering = task_rows(queryset, self.request.query_params, TaskRowSerializer)
+        return rows
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+        page = self.paginate_queryset(queryset)
+        serializer = TaskRowSerializer(queryset if page is None else page, many=True, fields=self.fields)
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data)
+
+class TaskViewSet(TaskRowListMixin, viewsets.ModelViewSet):
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
     permission_classes = [IsAuthenticated, IsTaskBoardMember]
+    bulk_max_operations = 500
 
     def get_queryset(self):
         user = self.request.user
         if self.action == 'assigned_to_me':
-            return Task.objects.filter(assignee=user)
+            return Task.objects.filter(assignee=user).for_serialization()
         if self.action == 'reviewing':
-            return Task.objects.filter(reviewer=user)
-        return Task.objects.filter(board__members=user) | Task.objects.filter(board__owner=user)
+            return Task.objects.filter(reviewer=user).for_serialization()
+        if self.action == 'list':
+            return self.task_rows(Task.objects.accessible_to(user))
+        return Task.objects.accessible_to(user).for_serialization()
 
     def create(self, request, *args, **kwargs):
         data = request.data.copy()
         board = get_object_or_404(Board, id=data['board'])
-        if request.user not in board.members.all() and request.user != board.owner:
+        if not has_board_access(request.user, board.id):
             return Response({'detail': 'Not a board member.'}, status=status.HTTP_403_FORBIDDEN)
         assignee = data.get('assignee_id')
         reviewer = data.get('reviewer_id')
-        task = Task.objects.create(
-            board=board,
-            title=data['title'],
-            description=data.get('description', ''),
-            status=data['status'],
-            priority=data['priority'],
-            assignee=User.objects.filter(id=assignee).first() if assignee else None,
-            reviewer=User.objects.filter(id=reviewer).first() if reviewer else None,
-            due_date=data.get('due_date'),
-            created_by=request.user
-        )
-        serializer = TaskSerializer(task)
+        with transaction.atomic():
+            task = Task.objects.create(
+                board=board,
+                title=data['title'],
+                description=data.get('description', ''),
+                status=data['status'],
+                priority=data['priority'],
+                assignee=User.objects.filter(id=assignee).first() if assignee else None,
+                reviewer=User.objects.filter(id=reviewer).first() if reviewer else None,
+                due_date=data.get('due_date'),
+                created_by=request.user
+            )
+            counters.task_created(task)
+            changelog.record('task', [(task.board_id, task.id)])
+            serializer = TaskSerializer(task)
+            publish_board_event(task.board_id, 'task.created', serializer.data)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     def partial_update(self, request, *args, **kwargs):
         task = self.get_object()
         self.check_object_permissions(request, task)
+        old_status, old_priority = task.status, task.priority
+        update_fields = []
         for field in ['title', 'description', 'status', 'priority', 'due_date']:
             if field in request.data:
                 setattr(task, field, request.data[field])
+                update_fields.append(field)
         assignee_id = request.data.get('assignee_id')
         reviewer_id = request.data.get('reviewer_id')
         if assignee_id:
             task.assignee = User.objects.filter(id=assignee_id).first()
+            update_fields.append('assignee')
         if reviewer_id:
             task.reviewer = User.objects.filter(id=reviewer_id).first()
-        task.save()
-        serializer = TaskSerializer(task)
+            update_fields.append('reviewer')
+        with transaction.atomic():
+            task.save(update_fields=update_fields + ['updated_at'])
+            counters.task_updated(task, old_status, old_priority)
+            changelog.record('task', [(task.board_id, task.id)])
+            serializer = TaskSerializer(task)
+            publish_board_event(task.board_id, 'task.updated', serializer.data)
         return Response(serializer.data)
 
     def destroy(self, request, *args, **kwargs):
         task = self.get_object()
         if task.created_by != request.user and task.board.owner != request.user:
             return Response({'detail': 'Only the creator or board owner can delete this task.'}, status=status.HTTP_403_FORBIDDEN)
-        task.delete()
+        task_id = task.id
+        with transaction.atomic():
+            task.delete()
+            counters.task_deleted(task)
+            changelog.record('task', [(task.board_id, task_id)], deleted=True)
+            publish_board_event(task.board_id, 'task.deleted', {'id': task_id})
         return Response(status=status.HTTP_204_NO_CONTENT)
 
-class AssignedToMeTasksView(generics.ListAPIView):
-    serializer_class = TaskSerializer
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk(self, request):
+        """Create, update and delete many tasks in one request and transaction."""
+        serializer = BulkTaskRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        operations = [serializer.validated_data[key] for key in ('create', 'update', 'delete')]
+        if sum(len(items) for items in operations) > self.bulk_max_operations:
+            return Response(
+                {'detail': f'At most {self.bulk_max_operations} operations per request.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        results = TaskBulkOperation(request.user, *operations).run()
+        return Response(results, status=status.HTTP_200_OK)
+
+
+class ConditionalTaskListMixin:
+    """Answer conditional GETs on task lists from a count and ``Max(updated_at)`` stamp.
+
+    Only an ETag is sent: the newest ``updated_at`` does not move when a task
+    leaves the list, so a Last-Modified date would let clients keep a stale copy.
+    """
+
+    def list(self, request, *args, **kwargs):
+        stamp = self.get_queryset().order_by().aggregate(count=Count('id'), last_modified=Max('updated_at'))
+        etag = make_etag('tasks', request.user.id, stamp['count'], stamp['last_modified'].timestamp() if stamp['last_modified'] else 0)
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+        return set_validators(super().list(request, *args, **kwargs), etag)
+
+class AssignedToMeTasksView(ConditionalTaskListMixin, TaskRowListMixin, generics.ListAPIView):
+    serializer_class = TaskRowSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return Task.objects.filter(assignee=self.request.user)
+        return self.task_rows(Task.objects.assigned_to(self.request.user))
 
-class ReviewingTasksView(generics.ListAPIView):
-    serializer_class = TaskSerializer
+class ReviewingTasksView(ConditionalTaskListMixin, TaskRowListMixin, generics.ListAPIView):
+    serializer_class = TaskRowSerializer
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
         """Return all tasks where the user is reviewer or assignee or board member/owner."""
-        user = self.request.user
-        reviewer_qs = Task.objects.filter(reviewer=user)
-        assignee_qs = Task.objects.filter(assignee=user)
-        board_qs = Task.objects.filter(board__members=user) | Task.objects.filter(board__owner=user)
-        return (reviewer_qs | assignee_qs | board_qs).distinct()
+        return self.task_rows(Task.objects.related_to(self.request.user))
 
-class CommentListCreateView(generics.ListCreateAPIView):
+class TaskCommentsMixin:
+    """Resolve the task of the URL, hiding tasks on boards the user cannot access."""
+
+    def get_task(self):
+        task = Task.objects.filter(id=self.kwargs['task_id']).only('id', 'board_id').first()
+        if task is None or not has_board_access(self.request.user, task.board_id):
+            raise NotFound('Task not found.')
+        return task
+
+class CommentListCreateView(TaskCommentsMixin, generics.ListCreateAPIView):
+    """List a task's comments as rows (``?since=`` for newer ones only) or add one."""
     serializer_class = CommentSerializer
-    permission_classes = [IsAuthenticated, IsTaskBoardMember]
+    pagination_class = CommentCursorPagination
+    permission_classes = [IsAuthenticated]
+
+    def get_serializer_class(self):
+        if self.request.method == 'GET':
+            return CommentRowSerializer
+        return CommentSerializer
 
     def get_queryset(self):
-        task_id = self.kwargs['task_id']
-        return Comment.objects.filter(task_id=task_id)
+        comments = Comment.objects.filter(task=self.get_task())
+        return CommentRowSerializer.rows(filter_comments(comments, self.request.query_params))
 
     def perform_create(self, serializer):
-        task_id = self.kwargs['task_id']
-        task = get_object_or_404(Task, id=task_id)
-        serializer.save(author=self.request.user, task=task)
+        task = self.get_task()
+        with transaction.atomic():
+            comment = serializer.save(author=self.request.user, task=task)
+            counters.comment_created(comment)
+            changelog.record('comment', [(task.board_id, comment.id)])
+            changelog.record('task', [(task.board_id, task.id)])
+            publish_board_event(task.board_id, 'comment.created', {'task': task.id, 'comment': serializer.data})
+
+class CommentBulkCreateView(TaskCommentsMixin, APIView):
+    """Add many comments to a task with one ``bulk_create`` and one counter update.
+
+    Expects ``{"comments": [{"content": ...}, ...]}``; nothing is written
+    unless every comment is valid.
+    """
+    permission_classes = [IsAuthenticated]
+    max_comments = 500
+
+    def post(self, request, task_id):
+        task = self.get_task()
+        items = request.data.get('comments') if isinstance(request.data, dict) else None
+        if not isinstance(items, list) or not items:
+            return Response({'detail': 'comments must be a non-empty list.'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > self.max_comments:
+            return Response({'detail': f'At most {self.max_comments} comments per request.'}, status=status.HTTP_400_BAD_REQUEST)
+        serializer = CommentSerializer(data=items, many=True)
+        serializer.is_valid(raise_exception=True)
+        comments = [Comment(task=task, author=request.user, content=item['content']) for item in serializer.validated_data]
+        with transaction.atomic():
+            comments = Comment.objects.bulk_create(comments, batch_size=self.max_comments)
+            counters.comments_created(task.id, len(comments))
+            changelog.record('comment', [(task.board_id, comment.id) for comment in comments])
+            changelog.record('task', [(task.board_id, task.id)])
+            data = CommentSerializer(comments, many=True).data
+            for comment in data:
+                publish_board_event(task.board_id, 'comment.created', {'task': task.id, 'comment': comment})
+        return Response(data, status=status.HTTP_201_CREATED)
 
 class CommentDeleteView(generics.DestroyAPIView):
     serializer_class = CommentSerializer
@@ -186,3 +382,173 @@ class CommentDeleteView(generics.DestroyAPIView):
     def get_queryset(self):
         task_id = self.kwargs['task_id']
         return Comment.objects.filter(task_id=task_id)
+
+    def perform_destroy(self, instance):
+        comment_id, board_id = instance.id, instance.task.board_id
+        with transaction.atomic():
+            instance.delete()
+            counters.comment_deleted(instance)
+            changelog.record('comment', [(board_id, comment_id)], deleted=True)
+            changelog.record('task', [(board_id, instance.task_id)])
+            publish_board_event(board_id, 'comment.deleted', {'task': instance.task_id, 'id': comment_id})
+
+class StreamingExportView(APIView, metaclass=ABCMeta):
+    """Stream a full list as a JSON array or NDJSON (``?format=ndjson``) without buffering it.
+
+    Rows are fetched in chunks and serialized one at a time, so memory stays
+    flat regardless of the number of rows. Under ASGI the body is an async
+    generator over ``aiterator()``: Django would read a sync iterator
+    completely before sending it. Subclasses set ``serializer_class`` and
+    implement ``get_queryset``.
+    """
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [JSONRenderer, NDJSONRenderer]
+    serializer_class = None
+    chunk_size = 2000
+
+    @abstractmethod
+    def get_queryset(self):
+        """Return the ordered queryset to export."""
+
+    def get(self, request, *args, **kwargs):
+        queryset = self.serializer_class.rows(self.get_queryset())
+        serialize = self.serializer_class().to_representation
+        ndjson = request.accepted_renderer.format == 'ndjson'
+        if served_by_asgi(request):
+            rows = queryset.aiterator(chunk_size=self.chunk_size)
+            stream = (andjson_stream if ndjson else ajson_array_stream)(rows, serialize, self.chunk_size)
+        else:
+            rows = queryset.iterator(chunk_size=self.chunk_size)
+            stream = (ndjson_stream if ndjson else json_array_stream)(rows, serialize, self.chunk_size)
+        return StreamingHttpResponse(stream, content_type=f'{request.accepted_renderer.media_type}; charset=utf-8')
+
+class AssignedToMeTasksExportView(StreamingExportView):
+    serializer_class = TaskRowSerializer
+
+    def get_queryset(self):
+        return Task.objects.assigned_to(self.request.user).order_by('id')
+
+class ReviewingTasksExportView(StreamingExportView):
+    serializer_class = TaskRowSerializer
+
+    def get_queryset(self):
+        return Task.objects.related_to(self.request.user).order_by('id')
+
+class CommentExportView(TaskCommentsMixin, StreamingExportView):
+    serializer_class = CommentRowSerializer
+
+    def get_queryset(self):
+        return Comment.objects.filter(task=self.get_task()).order_by('created_at')
+
+class SearchView(APIView):
+    """Ranked full-text search over tasks and comments on the caller's boards.
+
+    ``?q=`` is required, ``?type=task|comment`` narrows the hits and
+    ``?page_size=``/``?offset=`` page through them.
+    """
+    permission_classes = [IsAuthenticated]
+    page_size = 20
+    max_page_size = 100
+
+    def get(self, request):
+        backend = get_search_backend()
+        if backend is None:
+            return Response({'detail': 'Search is not supported on this database.'}, status=status.HTTP_501_NOT_IMPLEMENTED)
+        doc_type = request.query_params.get('type') or None
+        if doc_type is not None and doc_type not in DOC_TYPES:
+            return Response({'detail': f"type must be one of {', '.join(DOC_TYPES)}."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            page_size = min(max(int(request.query_params.get('page_size', self.page_size)), 1), self.max_page_size)
+            offset = max(int(request.query_params.get('offset', 0)), 0)
+        except ValueError:
+            return Response({'detail': 'page_size and offset must be integers.'}, status=status.HTTP_400_BAD_REQUEST)
+        board_ids = get_accessible_board_ids(request.user)
+        results = search(backend, request.query_params.get('q', ''), board_ids, doc_type, page_size + 1, offset)
+        if results is None:
+            return Response({'detail': 'q must contain at least one word.'}, status=status.HTTP_400_BAD_REQUEST)
+        url = request.build_absolute_uri()
+        previous = None
+        if offset:
+            previous = replace_query_param(url, 'offset', offset - page_size) if offset > page_size else remove_query_param(url, 'offset')
+        return Response({
+            'next': replace_query_param(url, 'offset', offset + page_size) if len(results) > page_size else None,
+            'previous': previous,
+            'results': results[:page_size],
+        })
+
+class UserSearchView(APIView):
+    """Typeahead over user emails and full names for the member picker.
+
+    ``?prefix=`` matches the start of either field case-insensitively and
+    ``?limit=`` caps the number of hits. Hits are limited to users sharing a
+    board with the caller; ``?scope=all`` searches every account and is
+    reserved for staff, so accounts cannot be enumerated by prefix.
+    """
+    permission_classes = [IsAuthenticated]
+    min_prefix_length = 2
+    limit = 10
+    max_limit = 50
+
+    def get(self, request):
+        prefix = request.query_params.get('prefix', '').strip()
+        if len(prefix) < self.min_prefix_length:
+            return Response(
+                {'detail': f'prefix must have at least {self.min_prefix_length} characters.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            limit = min(max(int(request.query_params.get('limit', self.limit)), 1), self.max_limit)
+        except ValueError:
+            return Response({'detail': 'limit must be an integer.'}, status=status.HTTP_400_BAD_REQUEST)
+        scope = request.query_params.get('scope', 'boards')
+        if scope == 'all':
+            if not request.user.is_staff:
+                return Response({'detail': 'scope=all is limited to staff.'}, status=status.HTTP_403_FORBIDDEN)
+            return Response({'results': search_users(prefix, limit)})
+        if scope != 'boards':
+            return Response({'detail': 'scope must be all or boards.'}, status=status.HTTP_400_BAD_REQUEST)
+        board_ids = get_accessible_board_ids(request.user)
+        queryset = User.objects.filter(
+            Q(id__in=Board.members.through.objects.filter(board_id__in=board_ids).values('user_id'))
+            | Q(id__in=Board.objects.filter(id__in=board_ids).values('owner_id'))
+        )
+        return Response({'results': search_users(prefix, limit, queryset, scope=f'boards:{request.user.id}')})
+
+class SyncView(APIView):
+    """Changes on the caller's boards since revision ``?since=``, compacted per object.
+
+    Clients store the returned ``revision`` and pass it on the next call;
+    ``"reset": true`` asks them to reload boards and task lists instead.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        try:
+            since = int(request.query_params.get('since', 0))
+        except ValueError:
+            return Response({'detail': 'since must be an integer.'}, status=status.HTTP_400_BAD_REQUEST)
+        delta = changelog.changes_since(request.user, since)
+        if delta['reset']:
+            return Response(delta)
+        task_serializer, comment_serializer = TaskRowSerializer(), CommentRowSerializer()
+        tasks = [task_serializer.to_representation(row) for row in TaskRowSerializer.rows(delta['tasks']['upserted'])]
+        comments = [
+            {**comment_serializer.to_representation(row), 'task': row['task_id']}
+            for row in delta['comments']['upserted'].values(*CommentRowSerializer.value_fields, 'task_id')
+        ]
+        return Response({
+            'revision': delta['revision'],
+            'reset': False,
+            'boards': {
+                'upserted': BoardSerializer(delta['boards']['upserted'], many=True).data,
+                'deleted': delta['boards']['deleted'],
+            },
+            'tasks': self.entries(delta['tasks'], tasks),
+            'comments': self.entries(delta['comments'], comments),
+        })
+
+    @staticmethod
+    def entries(delta, rows):
+        """Return the upserted rows; changed objects without a row count as deleted."""
+        missing = delta['changed'] - {row['id'] for row in rows}
+        return {'upserted': rows, 'deleted': sorted(delta['deleted'] | missing)}
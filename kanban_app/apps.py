@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class KanbanAppConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'kanban_app'
+
+    def ready(self):
+        """Register signal handlers."""
+        from kanban_app import signals  # noqa: F401
@@ -0,0 +1,139 @@
+# Standardbibliothek
+from datetime import timedelta
+
+# Drittanbieter
+from django.conf import settings
+from django.db.models import Max, Min, Q
+from django.utils import timezone
+
+# Lokale Importe
+from kanban_app.membership import get_accessible_board_ids
+from kanban_app.models import Board, Change, Comment, Task
+
+
+def record(kind, objects, deleted=False):
+    """Append one change per ``(board_id, object_id)`` pair with a single INSERT.
+
+    Call it inside the mutation's transaction, so the change commits with it.
+    """
+    Change.objects.bulk_create([
+        Change(board_id=board_id, kind=kind, object_id=object_id, deleted=deleted) for board_id, object_id in objects
+    ])
+
+
+def record_membership(board_id, old_user_ids, new_user_ids):
+    """Log the users who joined or left a board."""
+    old_user_ids, new_user_ids = set(old_user_ids), set(new_user_ids)
+    record('membership', [(board_id, user_id) for user_id in sorted(new_user_ids - old_user_ids)])
+    record('membership', [(board_id, user_id) for user_id in sorted(old_user_ids - new_user_ids)], deleted=True)
+
+
+def current_revision():
+    """Return the newest revision, or 0 before the first change."""
+    return Change.objects.order_by('-id').values_list('id', flat=True).first() or 0
+
+
+def _settled_revision(since):
+    """Return the newest revision that is safe to hand out as the next ``since``.
+
+    Revisions are assigned at insert time but become visible at commit, so a
+    long transaction can commit a lower revision after a higher one. Changes
+    younger than ``KANBAN_SYNC_SETTLE_SECONDS`` are sent, but the cursor stays
+    before them, so they are sent again on the next sync instead of being skipped.
+    """
+    settle = timedelta(seconds=getattr(settings, 'KANBAN_SYNC_SETTLE_SECONDS', 5))
+    settled = (
+        Change.objects.filter(id__gt=since, created_at__lte=timezone.now() - settle)
+        .order_by('-id').values_list('id', flat=True).first()
+    )
+    return settled or since
+
+
+def _reset():
+    return {'revision': _settled_revision(0), 'reset': True}
+
+
+def _visible_changes(user, since, board_ids):
+    """Return the caller's changes after ``since``, oldest first.
+
+    Besides changes on accessible boards (the ``board_id, id`` index), the
+    caller's own membership changes are read from the ``kind, object_id, id``
+    index, so boards they lost access to are reported as well.
+    """
+    limit = getattr(settings, 'KANBAN_SYNC_MAX_CHANGES', 5000)
+    condition = Q(kind='membership', object_id=user.pk)
+    if board_ids:
+        condition |= Q(board_id__in=board_ids)
+    fields = ('id', 'board_id', 'kind', 'object_id', 'deleted')
+    return list(Change.objects.filter(condition, id__gt=since).order_by('id').values_list(*fields)[:limit + 1])
+
+
+def _compact(changes):
+    """Keep the newest change per object."""
+    latest = {}
+    for change in changes:
+        _, board_id, kind, object_id, _ = change
+        key = (kind, board_id, object_id) if kind == 'membership' else (kind, object_id)
+        latest[key] = change
+    return latest.values()
+
+
+def changes_since(user, since):
+    """Return everything the user has to apply to move from ``since`` to ``revision``.
+
+    Changes are compacted per object and the changed boards, tasks and
+    comments are returned as querysets, so the cost grows with the number of
+    changes, not with the amount of data; only boards the user joined bring
+    all their tasks. Task and comment entries also carry the ``changed`` ids:
+    those missing from ``upserted`` were deleted after their last logged
+    change. The result is ``{"reset": true}`` when the log no longer reaches
+    back to ``since``, ``since`` is ahead of the newest revision (e.g. after
+    a database restore) or there are more than ``KANBAN_SYNC_MAX_CHANGES``
+    changes; the client then reloads everything and continues from the
+    returned revision.
+    """
+    log = Change.objects.aggregate(oldest=Min('id'), newest=Max('id'))
+    if since < 0 or since > (log['newest'] or 0) or (log['oldest'] is not None and since < log['oldest'] - 1):
+        return _reset()
+    board_ids = get_accessible_board_ids(user)
+    changes = _visible_changes(user, since, board_ids)
+    if len(changes) > getattr(settings, 'KANBAN_SYNC_MAX_CHANGES', 5000):
+        return _reset()
+
+    joined, left, touched = set(), set(), set()
+    changed = {'task': set(), 'comment': set()}
+    deleted = {'task': set(), 'comment': set()}
+    for _, board_id, kind, object_id, is_deleted in _compact(changes):
+        own = kind == 'membership' and object_id == user.pk
+        if board_id not in board_ids:
+            if own:
+                left.add(board_id)
+            continue
+        touched.add(board_id)
+        if own and not is_deleted:
+            joined.add(board_id)
+        elif kind in changed:
+            (deleted if is_deleted else changed)[kind].add(object_id)
+
+    tasks = Task.objects.filter(Q(id__in=changed['task']) | Q(board_id__in=joined), board_id__in=board_ids)
+    comments = Comment.objects.filter(id__in=changed['comment'], task__board_id__in=board_ids)
+    return {
+        'revision': _settled_revision(since),
+        'reset': False,
+        'boards': {'upserted': Board.objects.filter(id__in=touched).order_by('id'), 'deleted': sorted(left)},
+        'tasks': {'upserted': tasks.order_by('id'), 'changed': changed['task'], 'deleted': deleted['task']},
+        'comments': {'upserted': comments.order_by('id'), 'changed': changed['comment'], 'deleted': deleted['comment']},
+    }
+
+
+def prune(days=None):
+    """Delete changes older than ``days`` (default ``KANBAN_SYNC_RETENTION_DAYS``).
+
+    The newest change is always kept, so clients behind the pruned range are
+    detected and told to reset. Returns the number of deleted rows.
+    """
+    days = getattr(settings, 'KANBAN_SYNC_RETENTION_DAYS', 30) if days is None else days
+    cutoff = timezone.now() - timedelta(days=days)
+    newest = current_revision()
+    deleted, _ = Change.objects.filter(created_at__lt=cutoff, id__lt=newest).delete()
+    return deleted
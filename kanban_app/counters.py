@@ -0,0 +1,87 @@
+# Drittanbieter
+from django.db.models import F, Subquery
+from django.db.models.functions import Greatest, Now
+
+# Lokale Importe
+from kanban_app.models import Board, Task
+
+
+def _task_flags(status, priority):
+    """Return (is_todo, is_high_prio) as integers for counter deltas."""
+    return int(status == 'to-do'), int(priority == 'high')
+
+
+def _shift(field, delta):
+    """Return ``field + delta``, never below zero.
+
+    Rows added outside the API (admin, shell, raw SQL) are not counted, so a
+    later decrement could otherwise violate the unsigned column's CHECK.
+    """
+    if delta > 0:
+        return F(field) + delta
+    return Greatest(F(field) + delta, 0)
+
+
+def _update_board_task_counters(board_id, task_delta, todo_delta, high_prio_delta):
+    """Apply counter deltas and bump the board revision with a single UPDATE."""
+    deltas = {'task_count': task_delta, 'todo_count': todo_delta, 'high_prio_count': high_prio_delta}
+    changes = {field: _shift(field, delta) for field, delta in deltas.items() if delta}
+    Board.objects.filter(pk=board_id).touch(**changes)
+
+
+def task_created(task):
+    """Count a new task on its board."""
+    todo, high_prio = _task_flags(task.status, task.priority)
+    _update_board_task_counters(task.board_id, 1, todo, high_prio)
+
+
+def task_updated(task, old_status, old_priority):
+    """Move a task between the to-do/high priority counters after a change."""
+    old_todo, old_high_prio = _task_flags(old_status, old_priority)
+    todo, high_prio = _task_flags(task.status, task.priority)
+    _update_board_task_counters(task.board_id, 0, todo - old_todo, high_prio - old_high_prio)
+
+
+def task_deleted(task):
+    """Remove a deleted task from its board counters."""
+    todo, high_prio = _task_flags(task.status, task.priority)
+    _update_board_task_counters(task.board_id, -1, -todo, -high_prio)
+
+
+def _update_comments_count(task_id, delta):
+    """Apply a comment count delta to a task and bump its board revision."""
+    Task.objects.filter(pk=task_id).update(comments_count=_shift('comments_count', delta), updated_at=Now())
+    Board.objects.filter(pk=Subquery(Task.objects.filter(pk=task_id).values('board_id'))).touch()
+
+
+def comment_created(comment):
+    """Count a new comment on its task."""
+    _update_comments_count(comment.task_id, 1)
+
+
+def comments_created(task_id, count):
+    """Count ``count`` new comments on one task with a single UPDATE."""
+    _update_comments_count(task_id, count)
+
+
+def comment_deleted(comment):
+    """Remove a deleted comment from its task counter."""
+    _update_comments_count(comment.task_id, -1)
+
+
+def board_updated(board, members_changed=False):
+    """Bump the board revision, recomputing the member count after ``members.set()``."""
+    changes = {'member_count': Board.objects.member_count_subquery()} if members_changed else {}
+    Board.objects.filter(pk=board.pk).touch(**changes)
+
+
+def task_flag_delta(status, priority, sign=1):
+    """Return a (task, to-do, high priority) delta tuple for one task."""
+    todo, high_prio = _task_flags(status, priority)
+    return sign, sign * todo, sign * high_prio
+
+
+def tasks_changed(deltas):
+    """Apply per-board (task, to-do, high priority) deltas collected by bulk writes."""
+    for board_id, (task_delta, todo_delta, high_prio_delta) in deltas.items():
+        _update_board_task_counters(board_id, task_delta, todo_delta, high_prio_delta)
@@ -0,0 +1,225 @@
+# Standardbibliothek
+import json
+import subprocess
+import time
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from unittest import mock
+
+# Drittanbieter
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import URLPattern, URLResolver, get_resolver
+from rest_framework.authtoken.models import Token
+
+# Lokale Importe
+from auth_app.api.views import LoginView, RegistrationView
+from kanban_app.benchmarks import summarize
+from kanban_app.changelog import current_revision
+from kanban_app.models import Board, Comment, Task
+from kanban_app.profiling import QueryProfile
+
+
+User = get_user_model()
+
+# Routes that cannot be measured as a single request/response
+SKIPPED_ROUTES = {'board-events': 'long-lived Server-Sent Events stream'}
+
+
+class Command(BaseCommand):
+    """Measure latency percentiles and query counts of every API route on a seeded dataset."""
+    help = (
+        'Benchmark every route of kanban_app/api/urls.py and auth_app/api/urls.py as a user of a '
+        'dataset created with seed_kanban and write the results to JSON. Writes are rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', help='Email of the user to act as (default: first user of --prefix).')
+        parser.add_argument('--prefix', default='seed')
+        parser.add_argument('--password', default='seed-password')
+        parser.add_argument('--repeat', type=int, default=30)
+        parser.add_argument('--warmup', type=int, default=3)
+        parser.add_argument('--output', default='benchmark-results.json')
+        parser.add_argument('--compare', help='Earlier results file to compare against.')
+        parser.add_argument('--threshold', type=float, default=0.2, help='Relative p50 increase reported as regression.')
+
+    def handle(self, *args, **options):
+        """Run every route inside a rolled-back transaction and write the report."""
+        user = self.get_user(options)
+        token, _ = Token.objects.get_or_create(user=user)
+        board = Board.objects.accessible_to(user).order_by('-task_count').first()
+        if board is None:
+            raise CommandError(f'{user.email} has no boards; run seed_kanban first.')
+        task = Task.objects.filter(board=board).order_by('-comments_count').first()
+        if task is None:
+            raise CommandError(f'Board {board.id} has no tasks; run seed_kanban first.')
+
+        iterations = options['warmup'] + options['repeat']
+        results = {}
+        with ExitStack() as stack:
+            stack.enter_context(override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']))
+            # Throttling would turn repeated logins into 429s; the harness measures the handlers.
+            for view in (LoginView, RegistrationView):
+                stack.enter_context(mock.patch.object(view, 'throttle_classes', []))
+            stack.enter_context(transaction.atomic())
+            client = Client(headers={'Authorization': f'Token {token.key}'})
+            routes = self.routes(user, board, task, iterations, options)
+            for name, method, build in routes:
+                results[name] = self.measure(client, method, build, options)
+                row = results[name]
+                self.stdout.write(
+                    f"{name:34} {row['status']:>4} p50 {row['p50_ms']:8.2f} ms  p95 {row['p95_ms']:8.2f} ms  "
+                    f"queries {row['queries']}"
+                )
+            transaction.set_rollback(True)
+
+        self.check_coverage({name.split(' ')[0] for name, _, _ in routes})
+        report = {'meta': self.meta(user, options), 'results': results}
+        with open(options['output'], 'w', encoding='utf-8') as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
+        if options['compare']:
+            self.compare(options['compare'], results, options['threshold'])
+
+    def get_user(self, options):
+        email = options['user'] or f"{options['prefix']}-0@example.com"
+        user = User.objects.filter(email=email).first()
+        if user is None:
+            raise CommandError(f'No user {email}; run seed_kanban first or pass --user.')
+        return user
+
+    def routes(self, user, board, task, iterations, options):
+        """Return ``(name, method, build)`` per route; ``build(i)`` returns path and body of request ``i``."""
+        # Throw-away rows so every DELETE request has something to delete
+        delete_boards = Board.objects.bulk_create([Board(title=f'Delete {i}', owner=user) for i in range(iterations)])
+        delete_tasks = Task.objects.bulk_create([
+            Task(board=board, title=f'Delete {i}', status='to-do', priority='low', created_by=user)
+            for i in range(iterations)
+        ])
+        delete_comments = Comment.objects.bulk_create([
+            Comment(task=task, author=user, content=f'Delete {i}') for i in range(iterations)
+        ])
+        stamp = int(time.time())
+        since = max(current_revision() - 100, 0)
+        new_task = {'board': board.id, 'title': 'Benchmark', 'status': 'to-do', 'priority': 'low'}
+        return [
+            ('registration POST', 'post', lambda i: ('/api/registration/', {
+                'fullname': 'Bench User', 'email': f'bench-{stamp}-{i}@example.com',
+                'password': 'bench-password-1', 'repeated_password': 'bench-password-1',
+            })),
+            ('login POST', 'post', lambda i: ('/api/login/', {'email': user.email, 'password': options['password']})),
+            ('email-check GET', 'get', lambda i: (f'/api/email-check/?email={user.email}', None)),
+            ('api-root GET', 'get', lambda i: ('/api/', None)),
+            ('board-list GET', 'get', lambda i: ('/api/boards/', None)),
+            ('board-list POST', 'post', lambda i: ('/api/boards/', {'title': f'Bench {i}', 'members': [user.id]})),
+            ('board-detail GET', 'get', lambda i: (f'/api/boards/{board.id}/', None)),
+            ('board-detail PATCH', 'patch', lambda i: (f'/api/boards/{board.id}/', {'title': board.title})),
+            ('board-detail DELETE', 'delete', lambda i: (f'/api/boards/{delete_boards[i].id}/', None)),
+            ('task-list GET', 'get', lambda i: ('/api/tasks/', None)),
+            ('task-list POST', 'post', lambda i: ('/api/tasks/', new_task)),
+            ('task-bulk POST', 'post', lambda i: ('/api/tasks/bulk/', {'create': [new_task] * 10})),
+            ('task-detail GET', 'get', lambda i: (f'/api/tasks/{task.id}/', None)),
+            ('task-detail PATCH', 'patch', lambda i: (f'/api/tasks/{task.id}/', {'title': task.title})),
+            ('task-detail DELETE', 'delete', lambda i: (f'/api/tasks/{delete_tasks[i].id}/', None)),
+            ('tasks-assigned-to-me GET', 'get', lambda i: ('/api/tasks/assigned-to-me/', None)),
+            ('tasks-reviewing GET', 'get', lambda i: ('/api/tasks/reviewing/', None)),
+            ('tasks-assigned-to-me-export GET', 'get', lambda i: ('/api/tasks/assigned-to-me/export/', None)),
+            ('tasks-reviewing-export GET', 'get', lambda i: ('/api/tasks/reviewing/export/', None)),
+            ('task-comments GET', 'get', lambda i: (f'/api/tasks/{task.id}/comments/', None)),
+            ('task-comments POST', 'post', lambda i: (f'/api/tasks/{task.id}/comments/', {'content': 'Benchmark'})),
+            ('task-comments-bulk POST', 'post', lambda i: (
+                f'/api/tasks/{task.id}/comments/bulk/', {'comments': [{'content': 'Benchmark'}] * 20}
+            )),
+            ('task-comments-export GET', 'get', lambda i: (f'/api/tasks/{task.id}/comments/export/', None)),
+            ('task-comment-delete DELETE', 'delete', lambda i: (
+                f'/api/tasks/{task.id}/comments/{delete_comments[i].id}/', None
+            )),
+            ('search GET', 'get', lambda i: ('/api/search/?q=task 1234', None)),
+            ('user-search GET', 'get', lambda i: (f'/api/users/search/?prefix={options["prefix"]}-{i}&scope=boards', None)),
+            ('sync GET', 'get', lambda i: (f'/api/sync/?since={since}', None)),
+        ]
+
+    def measure(self, client, method, build, options):
+        """Send warmup + repeat requests; return status, latency percentiles and query counts."""
+        latencies, queries, status_code = [], [], None
+        for i in range(options['warmup'] + options['repeat']):
+            path, data = build(i)
+            profile = QueryProfile()
+            kwargs = {'data': data, 'content_type': 'application/json'} if data is not None else {}
+            with connection.execute_wrapper(profile):
+                start = time.perf_counter()
+                response = getattr(client, method)(path, **kwargs)
+                if response.streaming:
+                    for _ in response.streaming_content:
+                        pass
+                elapsed = (time.perf_counter() - start) * 1000
+            if i >= options['warmup']:
+                latencies.append(elapsed)
+                queries.append(profile.count)
+                status_code = response.status_code
+        return {'status': status_code, 'queries': max(queries), **summarize(latencies)}
+
+    def check_coverage(self, names):
+        """Warn about API routes that are neither benchmarked nor explicitly skipped."""
+        missing = set()
+
+        def walk(patterns, prefix):
+            for pattern in patterns:
+                route = prefix + str(pattern.pattern)
+                if isinstance(pattern, URLResolver):
+                    walk(pattern.url_patterns, route)
+                elif isinstance(pattern, URLPattern) and route.startswith('api/') and pattern.name:
+                    if pattern.name not in names and pattern.name not in SKIPPED_ROUTES:
+                        missing.add(pattern.name)
+
+        walk(get_resolver().url_patterns, '')
+        for name, reason in SKIPPED_ROUTES.items():
+            self.stdout.write(f'skipped {name}: {reason}')
+        if missing:
+            self.stdout.write(self.style.WARNING(f"not benchmarked: {', '.join(sorted(missing))}"))
+
+    def meta(self, user, options):
+        """Describe the run so result files from different commits can be compared."""
+        try:
+            commit = subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+        return {
+            'commit': commit,
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'database': connection.vendor,
+            'async_reads': getattr(settings, 'KANBAN_ASYNC_READS', False),
+            'user': user.email,
+            'repeat': options['repeat'],
+            'dataset': {
+                'users': User.objects.count(),
+                'boards': Board.objects.count(),
+                'tasks': Task.objects.count(),
+                'comments': Comment.objects.count(),
+            },
+        }
+
+    def compare(self, path, results, threshold):
+        """Print p50 and query count changes against an earlier results file."""
+        with open(path, encoding='utf-8') as handle:
+            baseline = json.load(handle)['results']
+        self.stdout.write(self.style.MIGRATE_HEADING(f'Compared with {path}'))
+        for name, row in results.items():
+            before = baseline.get(name)
+            if before is None:
+                continue
+            change = (row['p50_ms'] - before['p50_ms']) / before['p50_ms'] if before['p50_ms'] else 0.0
+            line = (
+                f"{name:34} p50 {before['p50_ms']:8.2f} -> {row['p50_ms']:8.2f} ms ({change:+.0%})  "
+                f"queries {before['queries']} -> {row['queries']}"
+            )
+            if change > threshold or row['queries'] > before['queries']:
+                self.stdout.write(self.style.ERROR(line))
+            else:
+                self.stdout.write(line)
@@ -0,0 +1,127 @@
+# Standardbibliothek
+import asyncio
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+# Drittanbieter
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test import AsyncClient, Client
+from django.test.utils import override_settings
+from rest_framework.authtoken.models import Token
+
+# Lokale Importe
+from kanban_app.benchmarks import percentile
+from kanban_app.models import Board, Comment, Task
+
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """Compare the read endpoints under the WSGI and ASGI request handlers."""
+    help = (
+        'Seed a user with tasks, then fire concurrent GET requests at the read endpoints '
+        'through the WSGI handler (one thread per client) and the ASGI handler (one event '
+        'loop). Uses the configured database; the seeded rows are deleted afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=2000)
+        parser.add_argument('--comments', type=int, default=200)
+        parser.add_argument('--requests', type=int, default=400, help='Requests per endpoint and handler.')
+        parser.add_argument('--concurrency', type=int, default=32)
+
+    def handle(self, *args, **options):
+        """Seed, run both handlers for every endpoint, print the comparison, clean up."""
+        user, token, board, task = self.seed(options)
+        headers = {'Authorization': f'Token {token.key}'}
+        paths = [
+            '/api/boards/',
+            f'/api/boards/{board.id}/',
+            '/api/tasks/assigned-to-me/',
+            '/api/tasks/reviewing/',
+            f'/api/tasks/{task.id}/comments/',
+        ]
+        # The test clients always send ``Host: testserver``.
+        try:
+            with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+                self.stdout.write(f"{'endpoint':40} {'handler':7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+                for path in paths:
+                    for handler, run in (('wsgi', self.run_wsgi), ('asgi', self.run_asgi)):
+                        latencies, elapsed = run(path, headers, options['requests'], options['concurrency'])
+                        latencies.sort()
+                        self.stdout.write(
+                            f'{path:40} {handler:7} {len(latencies) / elapsed:8.1f} '
+                            f'{percentile(latencies, 50):8.2f} {percentile(latencies, 95):8.2f} '
+                            f'{percentile(latencies, 99):8.2f}'
+                        )
+        finally:
+            user.delete()
+
+    def seed(self, options):
+        """Create one user with a board, assigned tasks and comments."""
+        suffix = uuid.uuid4().hex[:8]
+        user = User.objects.create_user(
+            username=f'bench-{suffix}', email=f'bench-{suffix}@example.com',
+            password=None, fullname='Benchmark User'
+        )
+        token = Token.objects.create(user=user)
+        board = Board.objects.create(title='Benchmark', owner=user)
+        board.members.add(user)
+        tasks = Task.objects.bulk_create([
+            Task(board=board, title=f'Task {i}', status='to-do', priority='medium',
+                 assignee=user, reviewer=user, created_by=user)
+            for i in range(options['tasks'])
+        ], batch_size=1000)
+        Comment.objects.bulk_create([
+            Comment(task=tasks[0], author=user, content=f'Comment {i}') for i in range(options['comments'])
+        ], batch_size=1000)
+        Board.objects.filter(pk=board.pk).recount()
+        Task.objects.filter(pk=tasks[0].pk).recount_comments()
+        return user, token, board, tasks[0]
+
+    def run_wsgi(self, path, headers, requests, concurrency):
+        """Send requests through the WSGI handler from a pool of client threads."""
+        def worker(count):
+            client = Client()
+            latencies = []
+            for _ in range(count):
+                start = time.perf_counter()
+                client.get(path, headers=headers)
+                latencies.append((time.perf_counter() - start) * 1000)
+            connections.close_all()
+            return latencies
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = pool.map(worker, self.split(requests, concurrency))
+            latencies = [latency for result in results for latency in result]
+        return latencies, time.perf_counter() - start
+
+    def run_asgi(self, path, headers, requests, concurrency):
+        """Send requests through the ASGI handler from concurrent tasks in one loop."""
+        async def worker(count):
+            client = AsyncClient()
+            latencies = []
+            for _ in range(count):
+                start = time.perf_counter()
+                await client.get(path, headers=headers)
+                latencies.append((time.perf_counter() - start) * 1000)
+            return latencies
+
+        async def main():
+            results = await asyncio.gather(*(worker(count) for count in self.split(requests, concurrency)))
+            return [latency for result in results for latency in result]
+
+        start = time.perf_counter()
+        latencies = asyncio.run(main())
+        return latencies, time.perf_counter() - start
+
+    @staticmethod
+    def split(total, parts):
+        """Split ``total`` requests as evenly as possible over ``parts`` clients."""
+        return [total // parts + (1 if i < total % parts else 0) for i in range(parts)]
@@ -0,0 +1,107 @@
+# Standardbibliothek
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Drittanbieter
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connections, transaction
+from django.db.models import F
+
+# Lokale Importe
+from core.database import sqlite_config
+from kanban_app.benchmarks import summarize
+from kanban_app.models import Board, Task
+
+
+User = get_user_model()
+
+
+def sqlite_profiles(directory):
+    """Return the SQLite settings before (Django defaults) and after the tuned profile."""
+    return {
+        'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': str(directory / 'default.sqlite3')},
+        'tuned': sqlite_config({'DATABASE_NAME': str(directory / 'tuned.sqlite3')}, settings.BASE_DIR),
+    }
+
+
+class Command(BaseCommand):
+    """Measure concurrent task write throughput on SQLite with and without the tuned profile."""
+    help = (
+        'Create a scratch SQLite file per profile, then let several threads create tasks the way '
+        'TaskViewSet does (read the board, insert the task, bump the board counter in one '
+        'transaction) and report writes/s, latency and "database is locked" failures.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8)
+        parser.add_argument('--writes', type=int, default=100, help='Writes per thread.')
+
+    def handle(self, *args, **options):
+        directory = Path(tempfile.mkdtemp(prefix='kanban-db-bench-'))
+        try:
+            for name, config in sqlite_profiles(directory).items():
+                alias = f'bench_{name}'
+                connections.settings[alias] = connections.configure_settings(
+                    {'default': settings.DATABASES['default'], alias: config}
+                )[alias]
+                try:
+                    call_command('migrate', database=alias, verbosity=0)
+                    self.report(name, *self.run(alias, options))
+                finally:
+                    connections[alias].close()
+                    del connections[alias]
+                    del connections.settings[alias]
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def run(self, alias, options):
+        """Run the writer threads; return latencies, failures and elapsed seconds."""
+        owner = User.objects.db_manager(alias).create_user(
+            username='bench', email='bench@example.com', password=None, fullname='Bench'
+        )
+        board = Board.objects.using(alias).create(title='Bench', owner=owner)
+        latencies, failures = [], []
+        lock = threading.Lock()
+        start_barrier = threading.Barrier(options['threads'])
+
+        def worker():
+            local_latencies, local_failures = [], 0
+            start_barrier.wait()
+            for i in range(options['writes']):
+                start = time.perf_counter()
+                try:
+                    with transaction.atomic(using=alias):
+                        current = Board.objects.using(alias).get(pk=board.pk)
+                        Task.objects.using(alias).create(
+                            board=current, title=f'Task {i}', status='to-do', priority='low', created_by=owner
+                        )
+                        Board.objects.using(alias).filter(pk=board.pk).update(task_count=F('task_count') + 1)
+                except OperationalError:
+                    local_failures += 1
+                else:
+                    local_latencies.append((time.perf_counter() - start) * 1000)
+            connections[alias].close()
+            with lock:
+                latencies.extend(local_latencies)
+                failures.append(local_failures)
+
+        threads = [threading.Thread(target=worker) for _ in range(options['threads'])]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return latencies, sum(failures), time.perf_counter() - started
+
+    def report(self, name, latencies, failures, elapsed):
+        stats = summarize(latencies)
+        self.stdout.write(
+            f'{name:8} {len(latencies) / elapsed:8.1f} writes/s  failed {failures:5}  '
+            f"p50 {stats['p50_ms']:7.2f} ms  p95 {stats['p95_ms']:7.2f} ms  p99 {stats['p99_ms']:7.2f} ms"
+        )
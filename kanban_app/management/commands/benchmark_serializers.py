@@ -0,0 +1,75 @@
+# Standardbibliothek
+import statistics
+import time
+
+# Drittanbieter
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+# Lokale Importe
+from kanban_app.api.serializers import TaskRowSerializer, TaskSerializer
+from kanban_app.models import Board, Task
+
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """Compare ``TaskSerializer`` with the values()-based ``TaskRowSerializer``."""
+    help = 'Seed a throw-away board with tasks and time fetching, serializing and rendering them.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=10_000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        """Seed inside a transaction, benchmark both paths, then roll everything back."""
+        with transaction.atomic():
+            queryset = self.seed(options['tasks'])
+            renderer = JSONRenderer()
+            model_json = renderer.render(TaskSerializer(queryset.for_serialization(), many=True).data)
+            row_json = renderer.render(TaskRowSerializer(TaskRowSerializer.rows(queryset), many=True).data)
+            self.stdout.write(f'identical JSON: {model_json == row_json} ({len(row_json)} bytes)')
+            baseline = self.report(
+                'TaskSerializer', options['repeat'],
+                lambda: renderer.render(TaskSerializer(queryset.for_serialization(), many=True).data)
+            )
+            fast = self.report(
+                'TaskRowSerializer', options['repeat'],
+                lambda: renderer.render(TaskRowSerializer(TaskRowSerializer.rows(queryset), many=True).data)
+            )
+            per_10k = 10_000 / options['tasks']
+            self.stdout.write(
+                f'speedup {baseline / fast:.1f}x, '
+                f'{baseline * per_10k:.1f} ms -> {fast * per_10k:.1f} ms per 10k tasks'
+            )
+            transaction.set_rollback(True)
+
+    def seed(self, count):
+        """Create one board with ``count`` assigned tasks and return them as a queryset."""
+        users = User.objects.bulk_create([
+            User(username=f'bench{i}', email=f'bench{i}@example.com', fullname=f'Bench {i}') for i in range(2)
+        ])
+        board = Board.objects.create(title='Benchmark', owner=users[0])
+        Task.objects.bulk_create([
+            Task(
+                board=board, title=f'Task {i}', description='Benchmark task', status='to-do',
+                priority='medium', assignee=users[0], reviewer=users[1] if i % 2 else None,
+                created_by=users[0]
+            )
+            for i in range(count)
+        ], batch_size=5000)
+        return Task.objects.filter(board=board)
+
+    def report(self, label, repeat, run):
+        """Print and return the median wall time of ``run`` in milliseconds."""
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            timings.append((time.perf_counter() - start) * 1000)
+        median = statistics.median(timings)
+        self.stdout.write(f'  {label}: median {median:.1f} ms, min {min(timings):.1f} ms')
+        return median
@@ -0,0 +1,91 @@
+# Standardbibliothek
+import random
+import statistics
+import time
+
+# Drittanbieter
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+# Lokale Importe
+from kanban_app.models import Board, Task
+
+
+User = get_user_model()
+
+
+def legacy_reviewing_queryset(user):
+    """Return the former OR-of-querysets used by ReviewingTasksView."""
+    reviewer_qs = Task.objects.filter(reviewer=user)
+    assignee_qs = Task.objects.filter(assignee=user)
+    board_qs = Task.objects.filter(board__members=user) | Task.objects.filter(board__owner=user)
+    return (reviewer_qs | assignee_qs | board_qs).distinct()
+
+
+class Command(BaseCommand):
+    """Compare query plans and latency of the task access queries on seeded data."""
+    help = 'Seed a throw-away dataset and benchmark the task access queries.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=500)
+        parser.add_argument('--boards', type=int, default=1000)
+        parser.add_argument('--members', type=int, default=8, help='Members per board.')
+        parser.add_argument('--tasks', type=int, default=100_000)
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        """Seed inside a transaction, benchmark, then roll everything back."""
+        with transaction.atomic():
+            user = self.seed(options)
+            self.report('legacy OR + DISTINCT', legacy_reviewing_queryset(user), options['repeat'])
+            self.report('accessible board subselect', Task.objects.related_to(user), options['repeat'])
+            transaction.set_rollback(True)
+
+    def seed(self, options):
+        """Bulk-create users, boards, memberships and tasks; return a sample user."""
+        rng = random.Random(options['seed'])
+        users = User.objects.bulk_create([
+            User(username=f'bench{i}', email=f'bench{i}@example.com', fullname=f'Bench {i}')
+            for i in range(options['users'])
+        ])
+        boards = Board.objects.bulk_create([
+            Board(title=f'Board {i}', owner=rng.choice(users)) for i in range(options['boards'])
+        ])
+        Membership = Board.members.through
+        Membership.objects.bulk_create([
+            Membership(board_id=board.id, user_id=member.id)
+            for board in boards
+            for member in rng.sample(users, min(options['members'], len(users)))
+        ], ignore_conflicts=True)
+        Task.objects.bulk_create([
+            Task(
+                board=rng.choice(boards),
+                title=f'Task {i}',
+                status=rng.choice(Task.STATUS_CHOICES)[0],
+                priority=rng.choice(Task.PRIORITY_CHOICES)[0],
+                assignee=rng.choice(users),
+                reviewer=rng.choice(users),
+                created_by=rng.choice(users),
+            )
+            for i in range(options['tasks'])
+        ], batch_size=5000)
+        return users[0]
+
+    def report(self, label, queryset, repeat):
+        """Print the query plan and latency percentiles for the first page and count."""
+        self.stdout.write(self.style.MIGRATE_HEADING(label))
+        self.stdout.write(queryset.order_by('id')[:50].explain())
+        for name, run in (
+            ('first page', lambda: list(queryset.order_by('id')[:50])),
+            ('count', queryset.count),
+        ):
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                run()
+                timings.append((time.perf_counter() - start) * 1000)
+            timings.sort()
+            p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+            self.stdout.write(f'  {name}: median {statistics.median(timings):.2f} ms, p95 {p95:.2f} ms')
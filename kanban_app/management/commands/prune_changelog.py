@@ -0,0 +1,24 @@
+# Standardbibliothek
+# (keine)
+
+# Drittanbieter
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Lokale Importe
+from kanban_app.changelog import prune
+
+
+class Command(BaseCommand):
+    """Delete old entries of the /api/sync/ change log."""
+    help = (
+        'Delete change log entries older than --days. Clients whose revision is older than the '
+        'remaining log get "reset": true from /api/sync/ and reload everything.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=getattr(settings, 'KANBAN_SYNC_RETENTION_DAYS', 30))
+
+    def handle(self, *args, **options):
+        deleted = prune(options['days'])
+        self.stdout.write(f'Deleted {deleted} change(s).')
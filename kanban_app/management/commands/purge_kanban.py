@@ -0,0 +1,50 @@
+# Drittanbieter
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+# Lokale Importe
+from kanban_app.models import Board
+from kanban_app.purge import purge_board, purge_user
+
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """Delete boards or users with chunked set-based DELETEs instead of Django's collector."""
+    help = (
+        'Purge boards (--board), users with their owned boards (--user) or boards left '
+        'pending by an interrupted background deletion (--pending).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--board', type=int, action='append', default=[], help='Board id; repeatable.')
+        parser.add_argument('--user', action='append', default=[], help='User id or email; repeatable.')
+        parser.add_argument('--pending', action='store_true', help='Finish boards marked for deletion; schedule it when KANBAN_PURGE_IN_BACKGROUND is on.')
+        parser.add_argument('--chunk-size', type=int, default=None, help='Rows per transaction (default: KANBAN_PURGE_CHUNK_SIZE).')
+
+    def handle(self, *args, **options):
+        board_ids = list(options['board'])
+        if options['pending']:
+            board_ids += Board.objects.filter(pending_deletion=True).values_list('id', flat=True)
+        users = [self.get_user(value) for value in options['user']]
+        if not board_ids and not users:
+            raise CommandError('Pass --board, --user or --pending.')
+        for board_id in board_ids:
+            deleted = purge_board(board_id, options['chunk_size'])
+            if not deleted:
+                self.stdout.write(self.style.WARNING(f'Board {board_id} does not exist.'))
+                continue
+            counts = ', '.join(f'{count} {kind}' for kind, count in deleted.items())
+            self.stdout.write(f'Board {board_id}: deleted {counts}')
+        for user in users:
+            purge_user(user.id, options['chunk_size'])
+            self.stdout.write(f'User {user.email}: deleted')
+        self.stdout.write(self.style.SUCCESS('Done.'))
+
+    def get_user(self, value):
+        lookup = {'pk': int(value)} if value.isdigit() else {'email': value}
+        user = User.objects.filter(**lookup).first()
+        if user is None:
+            raise CommandError(f'No user {value}.')
+        return user
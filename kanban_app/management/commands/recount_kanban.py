@@ -0,0 +1,18 @@
+# Drittanbieter
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+# Lokale Importe
+from kanban_app.models import Board, Task
+
+
+class Command(BaseCommand):
+    """Rebuild the denormalized board and task counters."""
+    help = 'Recompute member, task, to-do, high priority and comment counters in bulk.'
+
+    def handle(self, *args, **options):
+        """Run one set-based UPDATE per table."""
+        with transaction.atomic():
+            boards = Board.objects.recount()
+            tasks = Task.objects.recount_comments()
+        self.stdout.write(self.style.SUCCESS(f'Recounted {boards} boards and {tasks} tasks.'))
@@ -0,0 +1,129 @@
+# Standardbibliothek
+import random
+from datetime import date, timedelta
+
+# Drittanbieter
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.authtoken.models import Token
+
+# Lokale Importe
+from kanban_app.models import Board, Comment, Task
+
+
+User = get_user_model()
+
+STATUS_WEIGHTS = [('to-do', 4), ('in-progress', 3), ('review', 1), ('done', 6)]
+PRIORITY_WEIGHTS = [('low', 3), ('medium', 5), ('high', 2)]
+
+
+class Command(BaseCommand):
+    """Bulk-generate a realistic Kanban dataset for benchmarks."""
+    help = (
+        'Create users (with tokens), boards with members, tasks and comments using bulk_create. '
+        'All seeded users share one password and have emails <prefix>-<n>@example.com.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=200)
+        parser.add_argument('--boards', type=int, default=100)
+        parser.add_argument('--members', type=int, default=8, help='Members per board, owner included.')
+        parser.add_argument('--tasks', type=int, default=20_000)
+        parser.add_argument('--comments', type=float, default=3.0, help='Average comments per task.')
+        parser.add_argument('--prefix', default='seed')
+        parser.add_argument('--password', default='seed-password')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--clear', action='store_true', help='Delete users with the same prefix first.')
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        """Seed everything in one transaction and refresh the denormalized counters."""
+        prefix = options['prefix']
+        existing = User.objects.filter(username__startswith=f'{prefix}-')
+        if existing.exists():
+            if not options['clear']:
+                raise CommandError(f'Users with prefix "{prefix}" exist; pass --clear to replace them.')
+            existing.delete()
+        if options['users'] < 1 or options['boards'] < 1:
+            raise CommandError('--users and --boards must be at least 1.')
+
+        rng = random.Random(options['seed'])
+        batch_size = options['batch_size']
+        with transaction.atomic():
+            users = self.seed_users(options, prefix, batch_size)
+            boards = self.seed_boards(options, rng, users, prefix, batch_size)
+            tasks = self.seed_tasks(options, rng, boards, batch_size)
+            comment_count = self.seed_comments(options, rng, tasks, batch_size)
+            board_ids = [board.id for board in boards]
+            Board.objects.filter(id__in=board_ids).recount()
+            Task.objects.filter(board_id__in=board_ids).recount_comments()
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded {len(users)} users, {len(boards)} boards, {len(tasks)} tasks, {comment_count} comments. '
+            f'Log in as {users[0].email} / {options["password"]}.'
+        ))
+
+    def seed_users(self, options, prefix, batch_size):
+        """Create users sharing one password hash, each with an API token."""
+        password = make_password(options['password'])
+        users = User.objects.bulk_create([
+            User(
+                username=f'{prefix}-{i}', email=f'{prefix}-{i}@example.com',
+                fullname=f'Seed User {i}', password=password
+            )
+            for i in range(options['users'])
+        ], batch_size=batch_size)
+        Token.objects.bulk_create([Token(user=user, key=Token.generate_key()) for user in users], batch_size=batch_size)
+        return users
+
+    def seed_boards(self, options, rng, users, prefix, batch_size):
+        """Create boards with random owners; the owner is always a member."""
+        boards = Board.objects.bulk_create([
+            Board(title=f'{prefix} board {i}', owner=rng.choice(users)) for i in range(options['boards'])
+        ], batch_size=batch_size)
+        Membership = Board.members.through
+        memberships = []
+        for board in boards:
+            others = rng.sample(users, min(max(options['members'] - 1, 0), len(users)))
+            board.member_ids = list({board.owner_id, *(user.id for user in others)})
+            memberships.extend(Membership(board_id=board.id, user_id=user_id) for user_id in board.member_ids)
+        Membership.objects.bulk_create(memberships, batch_size=batch_size)
+        return boards
+
+    def seed_tasks(self, options, rng, boards, batch_size):
+        """Create tasks with skewed status/priority and assignees/reviewers among the board members."""
+        statuses, status_weights = zip(*STATUS_WEIGHTS)
+        priorities, priority_weights = zip(*PRIORITY_WEIGHTS)
+        today = date.today()
+        tasks = []
+        for i in range(options['tasks']):
+            board = rng.choice(boards)
+            tasks.append(Task(
+                board=board,
+                title=f'Task {i}',
+                description=f'Description of task {i}.' if rng.random() < 0.7 else '',
+                status=rng.choices(statuses, status_weights)[0],
+                priority=rng.choices(priorities, priority_weights)[0],
+                assignee_id=rng.choice(board.member_ids) if rng.random() < 0.8 else None,
+                reviewer_id=rng.choice(board.member_ids) if rng.random() < 0.5 else None,
+                due_date=today + timedelta(days=rng.randint(-30, 60)) if rng.random() < 0.6 else None,
+                created_by_id=rng.choice(board.member_ids),
+            ))
+        return Task.objects.bulk_create(tasks, batch_size=batch_size)
+
+    def seed_comments(self, options, rng, tasks, batch_size):
+        """Create comments by board members, a Poisson-like number per task."""
+        comments = []
+        created = 0
+        for task in tasks:
+            count = int(rng.expovariate(1 / options['comments'])) if options['comments'] > 0 else 0
+            comments.extend(
+                Comment(task=task, author_id=rng.choice(task.board.member_ids), content=f'Comment {n} on {task.title}')
+                for n in range(count)
+            )
+            if len(comments) >= batch_size:
+                created += len(Comment.objects.bulk_create(comments, batch_size=batch_size))
+                comments = []
+        created += len(Comment.objects.bulk_create(comments, batch_size=batch_size))
+        return created
@@ -0,0 +1,32 @@
+# Standardbibliothek
+import time
+
+# Drittanbieter
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+# Lokale Importe
+from kanban_app.reminders import run_tick
+
+
+class Command(BaseCommand):
+    """Remind assignees of open tasks that are due soon or overdue."""
+    help = (
+        'Send one reminder per assignee for open tasks due within --hours (or overdue) through '
+        'KANBAN_REMINDER_SINK. Runs once, or every --interval seconds with --loop.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=int, default=getattr(settings, 'KANBAN_REMINDER_HOURS', 24))
+        parser.add_argument('--loop', action='store_true', help='Keep running until interrupted.')
+        parser.add_argument('--interval', type=int, default=300, help='Seconds between ticks with --loop.')
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            reminded = run_tick(hours=options['hours'])
+            self.stdout.write(f'Reminded {reminded} task(s).')
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
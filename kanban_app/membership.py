@@ -0,0 +1,47 @@
+# Standardbibliothek
+# (keine)
+
+# Drittanbieter
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+# Lokale Importe
+from kanban_app.models import Board
+
+
+CACHE_KEY = 'kanban:board-access:{user_id}'
+
+
+def _cache():
+    """Return the cache backend configured for board membership."""
+    return caches[getattr(settings, 'KANBAN_MEMBERSHIP_CACHE', 'default')]
+
+
+def get_accessible_board_ids(user):
+    """Return the IDs of all boards the user owns or is a member of."""
+    if not user or not user.is_authenticated:
+        return frozenset()
+    cache = _cache()
+    key = CACHE_KEY.format(user_id=user.pk)
+    board_ids = cache.get(key)
+    if board_ids is None:
+        board_ids = frozenset(Board.objects.accessible_to(user).values_list('id', flat=True))
+        timeout = getattr(settings, 'KANBAN_MEMBERSHIP_CACHE_TIMEOUT', 300)
+        cache.set(key, board_ids, timeout)
+    return board_ids
+
+
+def has_board_access(user, board_id):
+    """Return True if the user owns or is a member of the given board."""
+    return board_id in get_accessible_board_ids(user)
+
+
+def invalidate_board_access(user_ids):
+    """Drop cached board IDs for the given users, now and after commit."""
+    keys = [CACHE_KEY.format(user_id=user_id) for user_id in set(user_ids) if user_id is not None]
+    if not keys:
+        return
+    cache = _cache()
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:06
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count(queryset, fk):
+    counts = queryset.filter(**{fk: OuterRef('pk')}).order_by().values(fk).annotate(count=Count('*')).values('count')
+    return Coalesce(Subquery(counts), 0)
+
+
+def populate_counters(apps, schema_editor):
+    Board = apps.get_model('kanban_app', 'Board')
+    Task = apps.get_model('kanban_app', 'Task')
+    Comment = apps.get_model('kanban_app', 'Comment')
+    db = schema_editor.connection.alias
+    Board.objects.using(db).update(
+        member_count=_count(Board.members.through.objects.all(), 'board_id'),
+        task_count=_count(Task.objects.all(), 'board_id'),
+        todo_count=_count(Task.objects.filter(status='to-do'), 'board_id'),
+        high_prio_count=_count(Task.objects.filter(priority='high'), 'board_id'),
+    )
+    Task.objects.using(db).update(comments_count=_count(Comment.objects.all(), 'task_id'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0003_task_comment_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='high_prio_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='member_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='task_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='todo_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,177 @@
+# Full-text search index over task titles/descriptions and comments, kept up
+# to date by triggers so bulk operations and cascading deletes are covered.
+# Row ids: task id * 2 for tasks, comment id * 2 + 1 for comments.
+
+from django.db import migrations
+
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE kanban_app_search USING fts5(
+        title, body,
+        doc_type UNINDEXED, doc_id UNINDEXED, task_id UNINDEXED, board_id UNINDEXED,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER kanban_search_task_insert AFTER INSERT ON kanban_app_task BEGIN
+        INSERT INTO kanban_app_search (rowid, title, body, doc_type, doc_id, task_id, board_id)
+        VALUES (new.id * 2, new.title, new.description, 'task', new.id, new.id, new.board_id);
+    END
+    """,
+    """
+    CREATE TRIGGER kanban_search_task_update AFTER UPDATE OF title, description, board_id ON kanban_app_task BEGIN
+        UPDATE kanban_app_search SET title = new.title, body = new.description, board_id = new.board_id
+        WHERE rowid = new.id * 2;
+    END
+    """,
+    """
+    CREATE TRIGGER kanban_search_task_delete AFTER DELETE ON kanban_app_task BEGIN
+        DELETE FROM kanban_app_search WHERE rowid = old.id * 2;
+    END
+    """,
+    """
+    CREATE TRIGGER kanban_search_comment_insert AFTER INSERT ON kanban_app_comment BEGIN
+        INSERT INTO kanban_app_search (rowid, title, body, doc_type, doc_id, task_id, board_id)
+        SELECT new.id * 2 + 1, '', new.content, 'comment', new.id, new.task_id, board_id
+        FROM kanban_app_task WHERE id = new.task_id;
+    END
+    """,
+    """
+    CREATE TRIGGER kanban_search_comment_update AFTER UPDATE OF content ON kanban_app_comment BEGIN
+        UPDATE kanban_app_search SET body = new.content WHERE rowid = new.id * 2 + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER kanban_search_comment_delete AFTER DELETE ON kanban_app_comment BEGIN
+        DELETE FROM kanban_app_search WHERE rowid = old.id * 2 + 1;
+    END
+    """,
+    """
+    INSERT INTO kanban_app_search (rowid, title, body, doc_type, doc_id, task_id, board_id)
+    SELECT id * 2, title, description, 'task', id, id, board_id FROM kanban_app_task
+    """,
+    """
+    INSERT INTO kanban_app_search (rowid, title, body, doc_type, doc_id, task_id, board_id)
+    SELECT c.id * 2 + 1, '', c.content, 'comment', c.id, c.task_id, t.board_id
+    FROM kanban_app_comment c JOIN kanban_app_task t ON t.id = c.task_id
+    """,
+]
+
+SQLITE_BACKWARD = [
+    'DROP TRIGGER IF EXISTS kanban_search_task_insert',
+    'DROP TRIGGER IF EXISTS kanban_search_task_update',
+    'DROP TRIGGER IF EXISTS kanban_search_task_delete',
+    'DROP TRIGGER IF EXISTS kanban_search_comment_insert',
+    'DROP TRIGGER IF EXISTS kanban_search_comment_update',
+    'DROP TRIGGER IF EXISTS kanban_search_comment_delete',
+    'DROP TABLE IF EXISTS kanban_app_search',
+]
+
+POSTGRESQL_FORWARD = [
+    """
+    CREATE TABLE kanban_app_search (
+        id bigint PRIMARY KEY,
+        doc_type varchar(10) NOT NULL,
+        doc_id bigint NOT NULL,
+        task_id bigint NOT NULL,
+        board_id bigint NOT NULL,
+        title text NOT NULL,
+        body text NOT NULL,
+        document tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', title), 'A') || setweight(to_tsvector('english', body), 'B')
+        ) STORED
+    )
+    """,
+    'CREATE INDEX kanban_app_search_document_idx ON kanban_app_search USING GIN (document)',
+    'CREATE INDEX kanban_app_search_board_idx ON kanban_app_search (board_id)',
+    """
+    CREATE FUNCTION kanban_search_task() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            DELETE FROM kanban_app_search WHERE id = OLD.id * 2;
+            RETURN OLD;
+        END IF;
+        INSERT INTO kanban_app_search (id, doc_type, doc_id, task_id, board_id, title, body)
+        VALUES (NEW.id * 2, 'task', NEW.id, NEW.id, NEW.board_id, NEW.title, NEW.description)
+        ON CONFLICT (id) DO UPDATE
+            SET board_id = EXCLUDED.board_id, title = EXCLUDED.title, body = EXCLUDED.body;
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER kanban_search_task
+    AFTER INSERT OR DELETE OR UPDATE OF title, description, board_id ON kanban_app_task
+    FOR EACH ROW EXECUTE FUNCTION kanban_search_task()
+    """,
+    """
+    CREATE FUNCTION kanban_search_comment() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            DELETE FROM kanban_app_search WHERE id = OLD.id * 2 + 1;
+            RETURN OLD;
+        END IF;
+        INSERT INTO kanban_app_search (id, doc_type, doc_id, task_id, board_id, title, body)
+        SELECT NEW.id * 2 + 1, 'comment', NEW.id, NEW.task_id, t.board_id, '', NEW.content
+        FROM kanban_app_task t WHERE t.id = NEW.task_id
+        ON CONFLICT (id) DO UPDATE SET body = EXCLUDED.body;
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER kanban_search_comment
+    AFTER INSERT OR DELETE OR UPDATE OF content ON kanban_app_comment
+    FOR EACH ROW EXECUTE FUNCTION kanban_search_comment()
+    """,
+    """
+    INSERT INTO kanban_app_search (id, doc_type, doc_id, task_id, board_id, title, body)
+    SELECT id * 2, 'task', id, id, board_id, title, description FROM kanban_app_task
+    """,
+    """
+    INSERT INTO kanban_app_search (id, doc_type, doc_id, task_id, board_id, title, body)
+    SELECT c.id * 2 + 1, 'comment', c.id, c.task_id, t.board_id, '', c.content
+    FROM kanban_app_comment c JOIN kanban_app_task t ON t.id = c.task_id
+    """,
+]
+
+POSTGRESQL_BACKWARD = [
+    'DROP TRIGGER IF EXISTS kanban_search_task ON kanban_app_task',
+    'DROP TRIGGER IF EXISTS kanban_search_comment ON kanban_app_comment',
+    'DROP FUNCTION IF EXISTS kanban_search_task()',
+    'DROP FUNCTION IF EXISTS kanban_search_comment()',
+    'DROP TABLE IF EXISTS kanban_app_search',
+]
+
+STATEMENTS = {
+    'sqlite': (SQLITE_FORWARD, SQLITE_BACKWARD),
+    'postgresql': (POSTGRESQL_FORWARD, POSTGRESQL_BACKWARD),
+}
+
+
+def _run(schema_editor, direction):
+    statements = STATEMENTS.get(schema_editor.connection.vendor)
+    if statements is None:
+        return
+    for sql in statements[direction]:
+        schema_editor.execute(sql, params=None)
+
+
+def create_search_index(apps, schema_editor):
+    _run(schema_editor, 0)
+
+
+def drop_search_index(apps, schema_editor):
+    _run(schema_editor, 1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0005_board_revision_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
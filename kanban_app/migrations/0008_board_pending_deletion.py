@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0007_task_due_date_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='pending_deletion',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+    ]
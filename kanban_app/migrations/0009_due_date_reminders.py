@@ -0,0 +1,40 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0008_board_pending_deletion'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReminderState',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('due_horizon', models.DateField(blank=True, null=True)),
+                ('updated_since', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='kanban_task_due_date_idx',
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='reminded_due_date',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['due_date', 'status'], name='kanban_task_due_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('due_date__isnull', False), models.Q(('status', 'done'), _negated=True)), fields=['updated_at'], name='kanban_task_open_due_upd_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.3 on 2026-10-18 08:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0009_due_date_reminders'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Change',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('board_id', models.BigIntegerField()),
+                ('kind', models.CharField(choices=[('board', 'Board'), ('membership', 'Membership'), ('task', 'Task'), ('comment', 'Comment')], max_length=20)),
+                ('object_id', models.BigIntegerField()),
+                ('deleted', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Change',
+                'verbose_name_plural': 'Changes',
+                'indexes': [models.Index(fields=['board_id', 'id'], name='kanban_change_board_rev_idx'), models.Index(fields=['kind', 'object_id', 'id'], name='kanban_change_object_rev_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.3 on 2026-10-18 09:07
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_reminded_assignee(apps, schema_editor):
+    # Reminders sent so far went to the current assignee
+    Task = apps.get_model('kanban_app', 'Task')
+    Task.objects.filter(reminded_due_date__isnull=False).update(reminded_assignee=F('assignee'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0010_change_log'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='reminded_assignee',
+            field=models.ForeignKey(blank=True, db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(backfill_reminded_assignee, migrations.RunPython.noop),
+    ]
@@ -1,12 +1,64 @@
 # Standardbibliothek
 from django.conf import settings
 from django.db import models
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, Now
+
+
+def count_subquery(queryset, fk):
+    """Return a correlated ``COUNT(*)`` of ``queryset`` rows whose ``fk`` is the outer pk."""
+    counts = (
+        queryset
+        .filter(**{fk: OuterRef('pk')})
+        .order_by()
+        .values(fk)
+        .annotate(count=Count('*'))
+        .values('count')
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+class BoardQuerySet(models.QuerySet):
+    """QuerySet with the access filter and counter maintenance used by the API."""
+
+    def accessible_to(self, user):
+        """Return boards where the user is owner or member, without a join on members."""
+        member_board_ids = Board.members.through.objects.filter(user=user).values('board_id')
+        return self.filter(Q(owner=user) | Q(id__in=member_board_ids), pending_deletion=False)
+
+    def member_count_subquery(self):
+        """Return the correlated member count used to refresh ``member_count``."""
+        return count_subquery(Board.members.through.objects.all(), 'board_id')
+
+    def touch(self, **changes):
+        """Bump ``revision`` and ``updated_at`` together with optional column changes."""
+        return self.update(revision=F('revision') + 1, updated_at=Now(), **changes)
+
+    def recount(self):
+        """Recompute all denormalized board counters with a single UPDATE."""
+        return self.update(
+            member_count=self.member_count_subquery(),
+            task_count=count_subquery(Task.objects.all(), 'board_id'),
+            todo_count=count_subquery(Task.objects.filter(status='to-do'), 'board_id'),
+            high_prio_count=count_subquery(Task.objects.filter(priority='high'), 'board_id'),
+        )
+
 
 class Board(models.Model):
     """Model representing a Kanban board."""
     title = models.CharField(max_length=255)
     owner = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='owned_boards')
     members = models.ManyToManyField(settings.AUTH_USER_MODEL, related_name='boards')
+    member_count = models.PositiveIntegerField(default=0, editable=False)
+    task_count = models.PositiveIntegerField(default=0, editable=False)
+    todo_count = models.PositiveIntegerField(default=0, editable=False)
+    high_prio_count = models.PositiveIntegerField(default=0, editable=False)
+    revision = models.PositiveBigIntegerField(default=0, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Set while a background purge deletes the board; hides it from everyone
+    pending_deletion = models.BooleanField(default=False, editable=False)
+
+    objects = BoardQuerySet.as_manager()
 
     def __str__(self):
         """String representation of the board."""
@@ -17,6 +69,31 @@ class Board(models.Model):
         verbose_name_plural = 'Boards'
         ordering = ['id']
 
+class TaskQuerySet(models.QuerySet):
+    """QuerySet helpers for task access checks and ``TaskSerializer``."""
+
+    def accessible_to(self, user):
+        """Return tasks on boards the user owns or is a member of."""
+        return self.filter(board_id__in=Board.objects.accessible_to(user).values('id'))
+
+    def assigned_to(self, user):
+        """Return tasks assigned to the user."""
+        return self.filter(assignee=user)
+
+    def related_to(self, user):
+        """Return tasks the user reviews, is assigned to, or can access via a board."""
+        board_ids = Board.objects.accessible_to(user).values('id')
+        return self.filter(Q(reviewer=user) | Q(assignee=user) | Q(board_id__in=board_ids))
+
+    def for_serialization(self):
+        """Join assignee and reviewer for ``TaskSerializer``."""
+        return self.select_related('assignee', 'reviewer')
+
+    def recount_comments(self):
+        """Recompute ``comments_count`` with a single UPDATE."""
+        return self.update(comments_count=count_subquery(Comment.objects.all(), 'task_id'))
+
+
 class Task(models.Model):
     """Model representing a task on a board."""
     STATUS_CHOICES = [
@@ -30,15 +107,25 @@ class Task(models.Model):
         ('medium', 'Medium'),
         ('high', 'High'),
     ]
-    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='tasks')
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='tasks', db_index=False)
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES)
     priority = models.CharField(max_length=20, choices=PRIORITY_CHOICES)
-    assignee = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='assigned_tasks')
-    reviewer = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='reviewing_tasks')
+    assignee = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='assigned_tasks', db_index=False)
+    reviewer = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='reviewing_tasks', db_index=False)
     due_date = models.DateField(null=True, blank=True)
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='created_tasks')
+    comments_count = models.PositiveIntegerField(default=0, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Due date and assignee of the last reminder; see ``kanban_app.reminders``
+    reminded_due_date = models.DateField(null=True, blank=True, editable=False)
+    reminded_assignee = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, editable=False,
+        related_name='+', db_index=False,
+    )
+
+    objects = TaskQuerySet.as_manager()
 
     def __str__(self):
         """String representation of the task."""
@@ -48,19 +135,79 @@ class Task(models.Model):
         verbose_name = 'Task'
         verbose_name_plural = 'Tasks'
         ordering = ['id']
+        indexes = [
+            models.Index(fields=['board', 'id'], name='kanban_task_board_id_idx'),
+            models.Index(fields=['board', 'status'], name='kanban_task_board_status_idx'),
+            models.Index(fields=['board', 'priority'], name='kanban_task_board_prio_idx'),
+            models.Index(fields=['assignee', 'id'], name='kanban_task_assignee_id_idx'),
+            models.Index(fields=['reviewer', 'id'], name='kanban_task_reviewer_id_idx'),
+            models.Index(fields=['due_date', 'status'], name='kanban_task_due_status_idx'),
+            models.Index(
+                fields=['updated_at'], name='kanban_task_open_due_upd_idx',
+                condition=Q(due_date__isnull=False) & ~Q(status='done'),
+            ),
+        ]
 
 class Comment(models.Model):
     """Model representing a comment on a task."""
-    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='comments')
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='comments', db_index=False)
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='comments')
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
         """String representation of the comment."""
-        return f"Comment by {self.author.fullname} on {self.task.title}"
+        return f"Comment {self.pk} on task {self.task_id}"
 
     class Meta:
         verbose_name = 'Comment'
         verbose_name_plural = 'Comments'
         ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['task', 'created_at'], name='kanban_comment_task_date_idx'),
+        ]
+
+
+class ReminderState(models.Model):
+    """High-water marks of a reminder scan, so each tick only reads new rows."""
+    name = models.CharField(max_length=50, primary_key=True)
+    due_horizon = models.DateField(null=True, blank=True)
+    updated_since = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        """String representation of the reminder state."""
+        return self.name
+
+
+class Change(models.Model):
+    """Append-only log of board, membership, task and comment changes for ``/api/sync/``.
+
+    The auto-incremented id is the revision clients pass back as ``?since=``.
+    Rows keep plain ids instead of foreign keys so they outlive the objects.
+    """
+    KIND_CHOICES = [
+        ('board', 'Board'),
+        ('membership', 'Membership'),
+        ('task', 'Task'),
+        ('comment', 'Comment'),
+    ]
+
+    board_id = models.BigIntegerField()
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    # Board, user (membership), task or comment id
+    object_id = models.BigIntegerField()
+    deleted = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        """String representation of the change."""
+        action = 'deleted' if self.deleted else 'changed'
+        return f"Revision {self.pk}: {self.kind} {self.object_id} {action}"
+
+    class Meta:
+        verbose_name = 'Change'
+        verbose_name_plural = 'Changes'
+        indexes = [
+            models.Index(fields=['board_id', 'id'], name='kanban_change_board_rev_idx'),
+            models.Index(fields=['kind', 'object_id', 'id'], name='kanban_change_object_rev_idx'),
+        ]
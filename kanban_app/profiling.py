@@ -0,0 +1,103 @@
+# Standardbibliothek
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+# Drittanbieter
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER_LIST = re.compile(r'%s(?:\s*,\s*%s)+')
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised when an endpoint runs more queries than its configured budget."""
+
+
+def fingerprint(sql):
+    """Return ``sql`` with literals and placeholder lists collapsed, to group repeated queries."""
+    sql = _PLACEHOLDER_LIST.sub('%s, ...', sql)
+    return _LITERAL.sub('?', sql)
+
+
+class QueryProfile:
+    """``execute_wrapper`` that counts queries, DB time and repeated SQL fingerprints."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.fingerprints[fingerprint(sql)] += 1
+
+    def repeated(self, threshold):
+        """Return the fingerprints seen at least ``threshold`` times (likely N+1 queries)."""
+        return {sql: count for sql, count in self.fingerprints.most_common() if count >= threshold}
+
+
+class QueryProfilingMiddleware:
+    """Opt-in (``KANBAN_QUERY_PROFILING``) per-request query count, DB time and N+1 report.
+
+    Adds a ``Server-Timing`` header, logs one JSON line per request to
+    ``kanban_app.profiling`` and enforces ``KANBAN_QUERY_BUDGETS`` (per URL
+    name) by logging or, with ``KANBAN_QUERY_BUDGET_ACTION = 'raise'``, raising
+    ``QueryBudgetExceeded``. Queries run while a streaming response is consumed
+    are not counted.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'KANBAN_QUERY_PROFILING', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        profile = QueryProfile()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(profile))
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - start
+
+        threshold = getattr(settings, 'KANBAN_QUERY_REPEAT_THRESHOLD', 5)
+        repeated = profile.repeated(threshold)
+        match = getattr(request, 'resolver_match', None)
+        url_name = match.url_name if match else None
+        response['Server-Timing'] = (
+            f'db;dur={profile.duration * 1000:.2f};desc="{profile.count} queries", '
+            f'app;dur={(elapsed - profile.duration) * 1000:.2f}'
+        )
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'url_name': url_name,
+            'status': response.status_code,
+            'queries': profile.count,
+            'db_ms': round(profile.duration * 1000, 2),
+            'total_ms': round(elapsed * 1000, 2),
+            'repeated': repeated,
+        }
+        logger.log(logging.WARNING if repeated else logging.INFO, json.dumps(record))
+
+        budget = getattr(settings, 'KANBAN_QUERY_BUDGETS', {}).get(url_name)
+        if budget is not None and profile.count > budget:
+            message = f'{request.method} {request.path} ({url_name}) ran {profile.count} queries, budget is {budget}'
+            if getattr(settings, 'KANBAN_QUERY_BUDGET_ACTION', 'log') == 'raise':
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        return response
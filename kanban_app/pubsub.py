@@ -0,0 +1,92 @@
+# Standardbibliothek
+import asyncio
+import threading
+from collections import defaultdict
+from functools import lru_cache
+
+# Drittanbieter
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+
+class Subscription:
+    """Queue of events for one stream consumer, bound to its event loop."""
+
+    def __init__(self, broker, board_id, loop, max_size=1000):
+        self.broker = broker
+        self.board_id = board_id
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=max_size)
+
+    def push(self, event):
+        """Hand an event to the subscriber's loop; safe to call from any thread."""
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            self.close()
+
+    def _put(self, event):
+        """Queue an event, asking the client to resync if it fell too far behind."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({'type': 'resync', 'board': self.board_id, 'data': None})
+
+    async def get(self, timeout=None):
+        """Wait for the next event; raise ``asyncio.TimeoutError`` after ``timeout``."""
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+    def close(self):
+        """Stop receiving events."""
+        self.broker.unsubscribe(self)
+
+
+class InProcessBroker:
+    """Fan board events out to subscribers in the current process.
+
+    Other backends (e.g. Redis pub/sub) only need to provide ``subscribe``,
+    ``unsubscribe`` and ``publish`` with the same signatures.
+    """
+
+    def __init__(self):
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, board_id):
+        """Return a new subscription; must be called from the consumer's event loop."""
+        subscription = Subscription(self, board_id, asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers[board_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """Remove a subscription."""
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.board_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.board_id]
+
+    def publish(self, board_id, event):
+        """Deliver an event to every subscriber of the board."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(board_id, ()))
+        for subscription in subscribers:
+            subscription.push(event)
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    """Return the broker configured in ``KANBAN_EVENT_BACKEND``."""
+    backend = getattr(settings, 'KANBAN_EVENT_BACKEND', 'kanban_app.pubsub.InProcessBroker')
+    return import_string(backend)()
+
+
+def publish_board_event(board_id, event_type, data):
+    """Publish a board event once the current transaction commits."""
+    event = {'type': event_type, 'board': board_id, 'data': data}
+    transaction.on_commit(lambda: get_broker().publish(board_id, event))
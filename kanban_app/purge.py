@@ -0,0 +1,162 @@
+# Standardbibliothek
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Drittanbieter
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.db.models import Q
+from django.db.models.functions import Now
+
+# Lokale Importe
+from kanban_app import changelog
+from kanban_app.membership import invalidate_board_access
+from kanban_app.models import Board, Comment, Task
+
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+Membership = Board.members.through
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _chunk_size(chunk_size):
+    return chunk_size or getattr(settings, 'KANBAN_PURGE_CHUNK_SIZE', 1000)
+
+
+def _delete(queryset):
+    """Delete ``queryset`` and return the number of its own rows deleted."""
+    return queryset.delete()[1].get(queryset.model._meta.label, 0)
+
+
+def delete_in_chunks(queryset, chunk_size, dependents=()):
+    """Delete the rows of ``queryset`` by primary key, ``chunk_size`` rows per transaction.
+
+    Comments and memberships have no signal receivers or cascades, so
+    Django deletes them without loading instances; tasks load only their
+    ids. ``dependents`` lists ``(model, fk)`` pairs whose rows referencing a
+    chunk are deleted with it, catching rows added after the caller's
+    earlier passes. Returns the number of deleted rows.
+    """
+    model = queryset.model
+    ids_queryset = queryset.order_by().values_list('pk', flat=True)
+    deleted = 0
+    while True:
+        with transaction.atomic(using=queryset.db):
+            ids = list(ids_queryset[:chunk_size])
+            if not ids:
+                return deleted
+            for dependent, fk in dependents:
+                dependent.objects.filter(**{f'{fk}__in': ids}).delete()
+            deleted += _delete(model.objects.filter(pk__in=ids).only('pk'))
+
+
+def _board_user_ids(board_id):
+    owner_ids = Board.objects.filter(pk=board_id).values_list('owner_id', flat=True)
+    member_ids = Membership.objects.filter(board_id=board_id).values_list('user_id', flat=True)
+    return [*owner_ids, *member_ids]
+
+
+def purge_board(board_id, chunk_size=None):
+    """Delete a board with its comments, tasks and memberships in dependency order.
+
+    Comments and tasks go in chunks, so no transaction holds the write lock
+    for long; memberships and the board row go last. Returns deleted row
+    counts per kind.
+    """
+    chunk_size = _chunk_size(chunk_size)
+    user_ids = _board_user_ids(board_id)
+    if not user_ids:
+        return {}
+    deleted = {
+        'comments': delete_in_chunks(Comment.objects.filter(task__board_id=board_id), chunk_size),
+        'tasks': delete_in_chunks(Task.objects.filter(board_id=board_id), chunk_size, [(Comment, 'task_id')]),
+    }
+    with transaction.atomic():
+        deleted['memberships'] = _delete(Membership.objects.filter(board_id=board_id))
+        Comment.objects.filter(task__board_id=board_id).delete()
+        Task.objects.filter(board_id=board_id).only('pk').delete()
+        deleted['boards'] = _delete(Board.objects.filter(pk=board_id))
+        changelog.record_membership(board_id, user_ids, [])
+        invalidate_board_access(user_ids)
+    return deleted
+
+
+def schedule_board_purge(board_id):
+    """Hide a board from everyone now and purge it in the background after commit.
+
+    The background thread does not survive a restart; boards it leaves
+    behind keep ``pending_deletion`` set until ``manage.py purge_kanban
+    --pending`` finishes them, so that command has to run periodically.
+    """
+    user_ids = _board_user_ids(board_id)
+    Board.objects.filter(pk=board_id).update(pending_deletion=True)
+    changelog.record_membership(board_id, user_ids, [])
+    invalidate_board_access(user_ids)
+    transaction.on_commit(lambda: _submit(purge_board, board_id))
+
+
+def purge_user(user_id, chunk_size=None):
+    """Delete a user, the boards they own and their tasks and comments on other boards.
+
+    Counters of the other boards and tasks involved are recomputed and the
+    changes are logged for ``/api/sync/``. The remaining small relations
+    (tokens, admin log) go through ``delete()``.
+    """
+    chunk_size = _chunk_size(chunk_size)
+    for board_id in list(Board.objects.filter(owner_id=user_id).values_list('id', flat=True)):
+        purge_board(board_id, chunk_size)
+
+    created = Task.objects.filter(created_by_id=user_id)
+    task_ids = set(Comment.objects.filter(author_id=user_id).values_list('task_id', flat=True).distinct())
+    board_ids = set(created.values_list('board_id', flat=True).distinct())
+    member_of = list(Membership.objects.filter(user_id=user_id).values_list('board_id', flat=True))
+    board_ids.update(member_of)
+    deleted_tasks = list(created.values_list('board_id', 'id'))
+    deleted_comments = list(Comment.objects.filter(author_id=user_id).values_list('task__board_id', 'id'))
+    changed_tasks = set(
+        Task.objects.filter(Q(assignee_id=user_id) | Q(reviewer_id=user_id) | Q(id__in=task_ids))
+        .exclude(created_by_id=user_id).values_list('board_id', 'id')
+    )
+    delete_in_chunks(Comment.objects.filter(author_id=user_id), chunk_size)
+    delete_in_chunks(Comment.objects.filter(task__created_by_id=user_id), chunk_size)
+    delete_in_chunks(created, chunk_size, [(Comment, 'task_id')])
+
+    with transaction.atomic():
+        Task.objects.filter(assignee_id=user_id).update(assignee=None, updated_at=Now())
+        Task.objects.filter(reviewer_id=user_id).update(reviewer=None, updated_at=Now())
+        Membership.objects.filter(user_id=user_id).delete()
+        Task.objects.filter(id__in=task_ids).recount_comments()
+        Board.objects.filter(id__in=board_ids).recount()
+        Board.objects.filter(id__in=board_ids).touch()
+        changelog.record('task', deleted_tasks, deleted=True)
+        changelog.record('comment', deleted_comments, deleted=True)
+        changelog.record('task', sorted(changed_tasks))
+        changelog.record('board', [(board_id, board_id) for board_id in sorted(board_ids)])
+        changelog.record('membership', [(board_id, user_id) for board_id in member_of], deleted=True)
+        invalidate_board_access([user_id])
+        User.objects.filter(pk=user_id).delete()
+
+
+def _submit(func, *args):
+    """Run ``func(*args)`` on the single background purge thread."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='kanban-purge')
+    return _executor.submit(_run, func, *args)
+
+
+def _run(func, *args):
+    try:
+        return func(*args)
+    except Exception:
+        logger.exception('%s%r failed; finish it with manage.py purge_kanban', func.__name__, args)
+        raise
+    finally:
+        connection.close()
@@ -0,0 +1,151 @@
+# Standardbibliothek
+import json
+import logging
+import threading
+from collections import defaultdict
+from datetime import timedelta
+from functools import lru_cache
+
+# Drittanbieter
+from django.conf import settings
+from django.core.mail import send_mass_mail
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+# Lokale Importe
+from kanban_app.models import ReminderState, Task
+
+
+logger = logging.getLogger(__name__)
+
+STATE_NAME = 'due-date'
+# Rows committed shortly after a tick started may carry an older ``updated_at``;
+# re-reading this window is harmless because reminded tasks are skipped.
+UPDATED_OVERLAP = timedelta(minutes=1)
+ROW_FIELDS = ('id', 'title', 'board_id', 'due_date', 'status', 'assignee_id', 'assignee__email', 'assignee__fullname')
+
+
+class LogSink:
+    """Write reminders to the ``kanban_app.reminders`` logger."""
+
+    def send(self, reminders):
+        for reminder in reminders:
+            logger.info('reminder for %s: %d task(s) due', reminder['user']['email'], len(reminder['tasks']))
+
+
+class FileSink:
+    """Append reminders as JSON lines to ``KANBAN_REMINDER_FILE``."""
+
+    def __init__(self, path=None):
+        self.path = path or getattr(settings, 'KANBAN_REMINDER_FILE', 'reminders.ndjson')
+
+    def send(self, reminders):
+        with open(self.path, 'a', encoding='utf-8') as handle:
+            for reminder in reminders:
+                handle.write(json.dumps(reminder, ensure_ascii=False) + '\n')
+
+
+class MemorySink:
+    """Keep reminders in memory; for tests."""
+    sent = []
+    _lock = threading.Lock()
+
+    def send(self, reminders):
+        with self._lock:
+            self.sent.extend(reminders)
+
+
+class EmailSink:
+    """Send one email per assignee through Django's configured email backend."""
+
+    def send(self, reminders):
+        messages = []
+        for reminder in reminders:
+            lines = [f"- {task['title']} (due {task['due_date']}, {task['status']})" for task in reminder['tasks']]
+            subject = f"{len(reminder['tasks'])} task(s) due soon"
+            messages.append((subject, '\n'.join(lines), None, [reminder['user']['email']]))
+        send_mass_mail(messages, fail_silently=False)
+
+
+@lru_cache(maxsize=None)
+def get_sink():
+    """Return the sink configured in ``KANBAN_REMINDER_SINK``."""
+    return import_string(getattr(settings, 'KANBAN_REMINDER_SINK', 'kanban_app.reminders.LogSink'))()
+
+
+def candidates(state, horizon):
+    """Return open, assigned tasks that became due since the last tick.
+
+    Runs two indexed scans: tasks whose due date entered the window
+    ``(state.due_horizon, horizon]``, and tasks changed since
+    ``state.updated_since`` that are due within ``horizon``. Tasks whose
+    current assignee was already reminded of the current due date are
+    skipped, so a reassigned task is reminded again.
+    """
+    open_tasks = (
+        Task.objects.filter(due_date__isnull=False).exclude(status='done')
+        .filter(assignee__isnull=False)
+        .exclude(reminded_due_date=F('due_date'), reminded_assignee=F('assignee')).order_by()
+    )
+    newly_due = open_tasks.filter(due_date__lte=horizon)
+    if state.due_horizon is not None:
+        newly_due = newly_due.filter(due_date__gt=state.due_horizon)
+    rows = {row['id']: row for row in newly_due.values(*ROW_FIELDS)}
+    if state.updated_since is not None:
+        # The horizon is checked in Python so ``updated_at`` is the only range
+        # and the partial index on recently changed open tasks is chosen.
+        changed = open_tasks.filter(updated_at__gt=state.updated_since)
+        rows.update((row['id'], row) for row in changed.values(*ROW_FIELDS) if row['due_date'] <= horizon)
+    return sorted(rows.values(), key=lambda row: (row['assignee_id'], row['due_date'], row['id']))
+
+
+def batch_by_assignee(rows, today):
+    """Group candidate rows into one reminder per assignee."""
+    batches = defaultdict(list)
+    users = {}
+    for row in rows:
+        users[row['assignee_id']] = {
+            'id': row['assignee_id'], 'email': row['assignee__email'], 'fullname': row['assignee__fullname'],
+        }
+        batches[row['assignee_id']].append({
+            'id': row['id'],
+            'title': row['title'],
+            'board': row['board_id'],
+            'due_date': row['due_date'].isoformat(),
+            'status': row['status'],
+            'overdue': row['due_date'] < today,
+        })
+    return [{'user': users[user_id], 'tasks': tasks} for user_id, tasks in batches.items()]
+
+
+def run_tick(hours=None, sink=None, now=None):
+    """Send reminders for tasks due within ``hours`` (or overdue) and advance the marks.
+
+    Delivery is at-least-once: the sink is called before the tasks and marks
+    are stored, so a crash in between resends that batch on the next tick.
+    Returns the number of reminded tasks.
+    """
+    hours = getattr(settings, 'KANBAN_REMINDER_HOURS', 24) if hours is None else hours
+    sink = sink or get_sink()
+    now = now or timezone.now()
+    horizon = timezone.localdate(now + timedelta(hours=hours))
+    state, _ = ReminderState.objects.get_or_create(name=STATE_NAME)
+    rows = candidates(state, horizon)
+    if rows:
+        sink.send(batch_by_assignee(rows, timezone.localdate(now)))
+    with transaction.atomic():
+        for (due_date, assignee_id), ids in _ids_by_reminder(rows).items():
+            Task.objects.filter(id__in=ids).update(reminded_due_date=due_date, reminded_assignee_id=assignee_id)
+        ReminderState.objects.filter(name=STATE_NAME).update(
+            due_horizon=horizon, updated_since=now - UPDATED_OVERLAP
+        )
+    return len(rows)
+
+
+def _ids_by_reminder(rows):
+    ids = defaultdict(list)
+    for row in rows:
+        ids[row['due_date'], row['assignee_id']].append(row['id'])
+    return ids
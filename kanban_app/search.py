@@ -0,0 +1,95 @@
+# Standardbibliothek
+import re
+
+# Drittanbieter
+from django.db import connection
+
+# Lokale Importe
+from kanban_app.models import Task
+
+
+DOC_TYPES = ('task', 'comment')
+_TOKEN = re.compile(r'\w+', re.UNICODE)
+
+
+class SQLiteSearchBackend:
+    """FTS5 search over ``kanban_app_search``, ranked by BM25 with titles weighted 10:1."""
+
+    sql = """
+        SELECT doc_type, doc_id, task_id, board_id,
+               snippet(kanban_app_search, 1, '<mark>', '</mark>', '…', 12),
+               -bm25(kanban_app_search, 10.0, 1.0) AS score
+        FROM kanban_app_search
+        WHERE kanban_app_search MATCH %s AND board_id IN ({board_ids}){doc_type}
+        ORDER BY score DESC, rowid
+        LIMIT %s OFFSET %s
+    """
+
+    def query(self, text):
+        """Return an FTS5 query matching all words of ``text`` as prefixes, or None."""
+        tokens = _TOKEN.findall(text)
+        return ' '.join(f'"{token}"*' for token in tokens) or None
+
+
+class PostgreSQLSearchBackend:
+    """``tsvector`` search (GIN index) ranked by ``ts_rank_cd`` with title weight A, body weight B."""
+
+    sql = """
+        SELECT doc_type, doc_id, task_id, board_id,
+               ts_headline('english', body, query, 'StartSel=<mark>, StopSel=</mark>, MaxWords=20, MinWords=5'),
+               ts_rank_cd(document, query) AS score
+        FROM kanban_app_search, websearch_to_tsquery('english', %s) AS query
+        WHERE document @@ query AND board_id IN ({board_ids}){doc_type}
+        ORDER BY score DESC, id
+        LIMIT %s OFFSET %s
+    """
+
+    def query(self, text):
+        """Return the raw text for ``websearch_to_tsquery``, or None if it has no words."""
+        return text if _TOKEN.search(text) else None
+
+
+BACKENDS = {
+    'sqlite': SQLiteSearchBackend,
+    'postgresql': PostgreSQLSearchBackend,
+}
+
+
+def get_search_backend():
+    """Return the search backend for the default database, or None if unsupported."""
+    backend = BACKENDS.get(connection.vendor)
+    return backend() if backend else None
+
+
+def search(backend, text, board_ids, doc_type=None, limit=20, offset=0):
+    """Return ranked hits for ``text`` on the given boards, each with its task title.
+
+    Returns None if ``text`` contains no searchable words.
+    """
+    query = backend.query(text)
+    if query is None:
+        return None
+    if not board_ids:
+        return []
+    board_ids = sorted(board_ids)
+    sql = backend.sql.format(
+        board_ids=', '.join(['%s'] * len(board_ids)),
+        doc_type=' AND doc_type = %s' if doc_type else '',
+    )
+    params = [query, *board_ids, *([doc_type] if doc_type else []), limit, offset]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    titles = dict(Task.objects.filter(id__in={row[2] for row in rows}).values_list('id', 'title'))
+    return [
+        {
+            'type': doc_type,
+            'id': doc_id,
+            'task': task_id,
+            'board': board_id,
+            'title': titles.get(task_id, ''),
+            'snippet': snippet,
+            'score': round(score, 4),
+        }
+        for doc_type, doc_id, task_id, board_id, snippet, score in rows
+    ]
@@ -0,0 +1,63 @@
+# Drittanbieter
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+# Lokale Importe
+from kanban_app import changelog
+from kanban_app.membership import invalidate_board_access
+from kanban_app.models import Board
+
+
+def _membership_pairs(instance, reverse, ids):
+    """Return the ``(board_id, user_id)`` pairs of an ``m2m_changed`` call."""
+    if reverse:
+        return [(board_id, instance.pk) for board_id in sorted(ids)]
+    return [(instance.pk, user_id) for user_id in sorted(ids)]
+
+
+@receiver(m2m_changed, sender=Board.members.through)
+def board_members_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Log membership changes and invalidate cached board access of the users involved."""
+    if action == 'pre_clear':
+        column = 'board_id' if reverse else 'user_id'
+        lookup = {'user_id' if reverse else 'board_id': instance.pk}
+        ids = sender.objects.filter(**lookup).values_list(column, flat=True)
+        instance._cleared_memberships = _membership_pairs(instance, reverse, ids)
+        return
+    if action == 'post_clear':
+        pairs = getattr(instance, '_cleared_memberships', [])
+        changelog.record('membership', pairs, deleted=True)
+        invalidate_board_access({user_id for _, user_id in pairs})
+        return
+    if action not in ('post_add', 'post_remove'):
+        return
+    pairs = _membership_pairs(instance, reverse, pk_set or [])
+    changelog.record('membership', pairs, deleted=action == 'post_remove')
+    invalidate_board_access({user_id for _, user_id in pairs})
+
+
+@receiver(pre_save, sender=Board)
+def board_saving(sender, instance, update_fields, **kwargs):
+    """Remember the stored owner of a board whose owner may change."""
+    if instance.pk is None or (update_fields is not None and not {'owner', 'owner_id'} & set(update_fields)):
+        return
+    instance._previous_owner_id = Board.objects.filter(pk=instance.pk).values_list('owner_id', flat=True).first()
+
+
+@receiver(post_save, sender=Board)
+def board_saved(sender, instance, **kwargs):
+    """Invalidate cached board access for the current and the previous owner of a saved board."""
+    invalidate_board_access([instance.owner_id, instance.__dict__.pop('_previous_owner_id', None)])
+
+
+@receiver(pre_delete, sender=Board)
+def board_deleting(sender, instance, **kwargs):
+    """Remember the members of a board before its membership rows are cascaded."""
+    instance._deleted_board_user_ids = list(instance.members.values_list('id', flat=True))
+
+
+@receiver(post_delete, sender=Board)
+def board_deleted(sender, instance, **kwargs):
+    """Invalidate cached board access for the owner and members of a deleted board."""
+    member_ids = getattr(instance, '_deleted_board_user_ids', [])
+    invalidate_board_access([instance.owner_id, *member_ids])